@@ -3,6 +3,8 @@
 from enum import Enum
 from pathlib import Path
 
+from .filters import file_suffix
+
 
 class FileCategory(Enum):
     """File category enumeration."""
@@ -25,6 +27,15 @@ def get_category_extensions() -> dict[FileCategory, set[str]]:
     }
 
 
+# Category of each known extension, built once so classification is a single
+# dictionary lookup per file
+_EXT_TO_CATEGORY: dict[str, FileCategory] = {
+    extension: category
+    for category, extensions in get_category_extensions().items()
+    for extension in extensions
+}
+
+
 def classify_file(file_path: Path) -> FileCategory:
     """Returns category enum for a given file.
     
@@ -34,11 +45,19 @@ def classify_file(file_path: Path) -> FileCategory:
     Returns:
         FileCategory: The category the file belongs to
     """
-    extension = file_path.suffix.lower()
-    extension_map = get_category_extensions()
+    return _EXT_TO_CATEGORY.get(file_path.suffix.lower(), FileCategory.MISC)
+
+
+def classify_name(name: str) -> FileCategory:
+    """Returns category enum for a file name.
     
-    for category, extensions in extension_map.items():
-        if extension in extensions:
-            return category
+    Same as classify_file, for callers that already have the name as a
+    string and don't need a Path.
     
-    return FileCategory.MISC
+    Args:
+        name: File name to classify (e.g., "photo.JPG")
+        
+    Returns:
+        FileCategory: The category the file belongs to
+    """
+    return _EXT_TO_CATEGORY.get(file_suffix(name).lower(), FileCategory.MISC)
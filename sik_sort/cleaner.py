@@ -1,67 +1,283 @@
 """Folder cleaner module for removing empty directories."""
 
 import os
+import queue
+import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Optional
 
 
-def find_empty_directories(root_path: Path, preserve_dirs: set[str]) -> list[Path]:
+# Bound once at import so the removal loops skip the os attribute lookup
+_rmdir = os.rmdir
+_RMDIR_ERRORS = (PermissionError, OSError, FileNotFoundError)
+
+# Levels a parallel scanning worker walks on its own before handing deeper
+# subdirectories back to the shared queue
+_WORKER_DEPTH = 2
+
+
+def find_empty_directories(root_path: Path, preserve_dirs: set[str], max_workers: int = 1) -> list[Path]:
     """Finds all empty directories.
     
+    By default the tree is walked serially, which is fastest on local
+    disks. On high-latency storage (network shares, USB drives) pass
+    max_workers > 1 to list directories concurrently; each worker walks a
+    few levels on its own and hands deeper subdirectories to the others
+    through a shared queue.
+    
+    Preserved directories are never scanned, so neither they nor anything
+    inside them is reported.
+    
     Args:
         root_path: Root directory to search
-        preserve_dirs: Set of directory names to preserve even if empty
+        preserve_dirs: Set of directory names to preserve and skip entirely
+        max_workers: Number of scanning threads (1 walks the tree serially)
         
     Returns:
-        list[Path]: List of empty directory paths
+        list[Path]: List of empty directory paths, deepest first
+    """
+    # Directory names are compared against entry names from scandir, so
+    # intern them once and freeze the set for the whole walk
+    preserve_dirs = frozenset(map(sys.intern, preserve_dirs))
+    
+    root_str = os.fspath(root_path)
+    empty_dirs: list[str] = []
+    
+    if max_workers > 1:
+        _scan_empty_parallel(root_str, preserve_dirs, empty_dirs, max_workers)
+    else:
+        _scan_empty(root_str, preserve_dirs, empty_dirs)
+    
+    # An empty root has no subdirectories, so it is the only directory
+    # reported; the root directory itself is never removed
+    if empty_dirs == [root_str]:
+        return []
+    
+    # Report deepest directories first so callers removing them in order
+    # never attempt a parent before a child
+    empty_dirs.sort(key=lambda directory: (-directory.count(os.sep), directory))
+    
+    # Work on plain strings during the walk and only build Path objects
+    # for the directories that are actually reported
+    return [Path(directory) for directory in empty_dirs]
+
+
+def _scan_empty(
+    path: str,
+    preserve_dirs: frozenset[str],
+    empty_dirs: list[str],
+    depth: int = -1,
+    hand_off: Optional[Callable[[str], None]] = None
+) -> None:
+    """Collects a directory and its subdirectories that have no entries.
+    
+    Args:
+        path: Directory to scan
+        preserve_dirs: Set of directory names to preserve and skip entirely
+        empty_dirs: List that empty directory paths are appended to
+        depth: Levels to descend before passing subdirectories to hand_off
+            (negative for no limit)
+        hand_off: Called with each subdirectory below the depth limit
     """
-    empty_dirs = []
+    entry_count = 0
+    subdirs = []
+    
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                entry_count += 1
+                
+                # is_dir() uses the type cached by scandir, so this costs no
+                # extra stat call; symlinks are counted but never followed
+                try:
+                    if entry.is_dir(follow_symlinks=False) and entry.name not in preserve_dirs:
+                        subdirs.append(entry.path)
+                except OSError:
+                    continue
+    except (PermissionError, OSError):
+        # Skip directories we can't access
+        return
+    
+    if entry_count == 0:
+        empty_dirs.append(path)
+        return
+    
+    # Recurse after the scandir handle is closed, so only one directory
+    # handle is open at a time regardless of depth
+    for subdir in subdirs:
+        if depth == 0:
+            hand_off(subdir)
+        else:
+            _scan_empty(subdir, preserve_dirs, empty_dirs, depth - 1, hand_off)
+
+
+def _scan_empty_parallel(
+    root: str,
+    preserve_dirs: frozenset[str],
+    empty_dirs: list[str],
+    max_workers: int
+) -> None:
+    """Collects empty directories using a pool of worker threads.
+    
+    Workers take directories from a shared queue and walk them up to
+    _WORKER_DEPTH levels deep themselves, so the queue only sees a
+    fraction of the directories in the tree.
+    
+    Args:
+        root: Directory to scan
+        preserve_dirs: Set of directory names to preserve and skip entirely
+        empty_dirs: List that empty directory paths are appended to
+        max_workers: Number of scanning threads
+    """
+    work: queue.Queue = queue.Queue()
+    
+    def worker() -> None:
+        while True:
+            path = work.get()
+            if path is None:
+                return
+            try:
+                _scan_empty(path, preserve_dirs, empty_dirs, _WORKER_DEPTH, work.put)
+            finally:
+                work.task_done()
+    
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(max_workers)]
+    for thread in threads:
+        thread.start()
+    
+    work.put(root)
+    work.join()
+    
+    for _ in threads:
+        work.put(None)
+    for thread in threads:
+        thread.join()
+
+
+def clean_empty_directories(root_path: Path, preserve_dirs: set[str], dry_run: bool = False) -> int:
+    """Finds and removes empty directories in a single bottom-up pass.
+    
+    Directories are removed as soon as they are found empty, so a parent
+    that only contained empty directories is removed in the same pass
+    without listing the tree again. Preserved directories are never
+    scanned or removed, and the root directory itself is kept.
     
-    # Walk the directory tree bottom-up so we can detect empty directories
-    # after their subdirectories have been processed
-    for dirpath, dirnames, filenames in os.walk(root_path, topdown=False):
-        current_dir = Path(dirpath)
+    Args:
+        root_path: Root directory to clean
+        preserve_dirs: Set of directory names to preserve and skip entirely
+        dry_run: If True, count the directories that would be removed
+            without removing them
         
-        # Skip if this is a preserved directory
-        if current_dir.name in preserve_dirs:
-            continue
+    Returns:
+        int: Number of directories removed (or that would be removed)
+    """
+    preserve_dirs = frozenset(map(sys.intern, preserve_dirs))
+    _, removed_count = _clean_tree(os.fspath(root_path), preserve_dirs, dry_run)
+    return removed_count
+
+
+def _clean_tree(path: str, preserve_dirs: frozenset[str], dry_run: bool) -> tuple[int, int]:
+    """Removes empty subdirectories of a directory, deepest first.
+    
+    Args:
+        path: Directory to clean
+        preserve_dirs: Set of directory names to preserve and skip entirely
+        dry_run: If True, only count the directories that would be removed
         
-        # Skip the root directory itself
-        if current_dir == root_path:
-            continue
+    Returns:
+        tuple: (remaining_count, removed_count)
+            - remaining_count: Entries left in the directory, or -1 if it
+              cannot be read
+            - removed_count: Directories removed below this directory
+    """
+    subdirs = []
+    
+    try:
+        with os.scandir(path) as entries:
+            remaining_count = 0
+            for entry in entries:
+                remaining_count += 1
+                try:
+                    if entry.is_dir(follow_symlinks=False) and entry.name not in preserve_dirs:
+                        subdirs.append(entry.path)
+                except OSError:
+                    continue
+    except (PermissionError, OSError):
+        # Skip directories we can't access
+        return -1, 0
+    
+    # Recurse after the scandir handle is closed, so only one directory
+    # handle is open at a time regardless of depth
+    removed_count = 0
+    for subdir in subdirs:
+        subdir_remaining, subdir_removed = _clean_tree(subdir, preserve_dirs, dry_run)
+        removed_count += subdir_removed
         
-        # Check if directory is empty (no files and no subdirectories)
-        try:
-            # A directory is empty if it has no items
-            if not any(current_dir.iterdir()):
-                empty_dirs.append(current_dir)
-        except (PermissionError, OSError):
-            # Skip directories we can't access
+        if subdir_remaining != 0:
             continue
+        
+        if not dry_run:
+            try:
+                _rmdir(subdir)
+            except _RMDIR_ERRORS:
+                # Skip directories we can't remove
+                continue
+        
+        removed_count += 1
+        remaining_count -= 1
     
-    return empty_dirs
+    return remaining_count, removed_count
 
 
-def remove_empty_directories(directories: list[Path]) -> int:
+def remove_empty_directories(directories: list[Path], max_workers: int | None = None) -> int:
     """Removes empty folders and returns count.
     
-    Repeatedly removes empty directories until no more can be removed.
-    This handles nested empty directories where a parent becomes empty
-    after its empty child is removed.
+    Directories are removed deepest-first, so a nested empty directory is
+    always gone before its parent is attempted. Directories at the same
+    depth cannot depend on each other and are removed concurrently.
     
     Args:
         directories: List of directory paths to remove
+        max_workers: Number of removal threads (defaults to twice the CPU count)
         
     Returns:
         int: Number of directories removed
     """
-    removed_count = 0
+    if max_workers is None:
+        max_workers = (os.cpu_count() or 1) * 2
     
+    # Group directories by depth so each level can be removed as one batch,
+    # converting each path to a string once so os.rmdir gets it directly
+    by_depth: dict[int, list[str]] = defaultdict(list)
+    fspath = os.fspath
     for directory in directories:
-        try:
-            directory.rmdir()
-            removed_count += 1
-        except (PermissionError, OSError, FileNotFoundError):
-            # Skip directories we can't remove or that no longer exist
-            continue
+        by_depth[len(directory.parts)].append(fspath(directory))
+    
+    removed_count = 0
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for depth in sorted(by_depth, reverse=True):
+            removed_count += sum(executor.map(_remove_directory, by_depth[depth]))
     
     return removed_count
+
+
+def _remove_directory(directory: str) -> bool:
+    """Removes a single empty directory.
+    
+    Args:
+        directory: Directory path to remove
+        
+    Returns:
+        bool: True if the directory was removed, False otherwise
+    """
+    try:
+        _rmdir(directory)
+    except _RMDIR_ERRORS:
+        # Skip directories we can't remove or that no longer exist
+        return False
+    
+    return True
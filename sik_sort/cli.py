@@ -1,21 +1,40 @@
 """CLI module for handling user interaction with Rich library components."""
 
 import argparse
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Optional
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
+from typing import TYPE_CHECKING, Callable, Optional
+from .operation_logger import output_lock
 
-console = Console()
+# Rich is imported lazily inside the functions that display output so that
+# non-interactive paths such as argument parsing don't pay its import cost
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress
 
+_console: Optional['Console'] = None
 
-def parse_arguments() -> tuple[Optional[Path], bool]:
-    """Parse command-line arguments for path and dry-run flag.
+
+def get_console() -> 'Console':
+    """Return the shared Rich console, creating it on first use.
+    
+    Returns:
+        Console: Shared Rich console instance
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser, once per process.
     
     Returns:
-        tuple: (path or None, dry_run flag)
+        argparse.ArgumentParser: Parser for the sik command
     """
     parser = argparse.ArgumentParser(
         prog='sik',
@@ -38,8 +57,26 @@ def parse_arguments() -> tuple[Optional[Path], bool]:
         action='store_true',
         help='Bypass safety checks (USE WITH EXTREME CAUTION!)'
     )
+    parser.add_argument(
+        '--no-recursive',
+        action='store_false',
+        dest='recursive',
+        help='Only sort files directly in the source directory, not in its subdirectories'
+    )
+    return parser
+
+
+def parse_arguments(argv: Optional[list[str]] = None) -> tuple[Optional[Path], bool, bool]:
+    """Parse command-line arguments for path, dry-run and recursion flags.
+    
+    Args:
+        argv: Arguments to parse, without the program name (defaults to
+            sys.argv[1:])
     
-    args = parser.parse_args()
+    Returns:
+        tuple: (path or None, dry_run flag, recursive flag)
+    """
+    args = _build_parser().parse_args(argv)
     
     # If path is provided, validate it
     if args.path:
@@ -50,10 +87,10 @@ def parse_arguments() -> tuple[Optional[Path], bool]:
         if not path.is_dir():
             display_error(f"Path is not a directory: {args.path}")
             raise SystemExit(1)
-        return path, args.dry_run
+        return path, args.dry_run, args.recursive
     
     # No path provided, will need to prompt
-    return None, args.dry_run
+    return None, args.dry_run, args.recursive
 
 
 def prompt_for_path() -> Path:
@@ -62,6 +99,8 @@ def prompt_for_path() -> Path:
     Returns:
         Path: Validated directory path
     """
+    from rich.prompt import Prompt
+    
     while True:
         path_str = Prompt.ask("[bold cyan]Enter the source directory path[/bold cyan]")
         path = Path(path_str)
@@ -84,6 +123,8 @@ def display_statistics(stats, dry_run: bool = False) -> None:
         stats: SortingStats object containing file counts
         dry_run: If True, indicate these are simulated statistics
     """
+    from rich.table import Table
+    
     title = "Sorting Statistics (DRY RUN)" if dry_run else "Sorting Statistics"
     table = Table(title=title, show_header=True, header_style="bold magenta")
     table.add_column("Category", style="cyan", justify="left")
@@ -95,6 +136,7 @@ def display_statistics(stats, dry_run: bool = False) -> None:
     table.add_row("Miscellaneous (msk)", str(stats.msk_count))
     table.add_row("[bold]Total[/bold]", f"[bold]{stats.total_files}[/bold]")
     
+    console = get_console()
     console.print()
     console.print(table)
     console.print()
@@ -106,10 +148,12 @@ def confirm_cleanup() -> bool:
     Returns:
         bool: True if user confirms cleanup, False otherwise
     """
+    from rich.prompt import Confirm
+    
     return Confirm.ask("[bold yellow]Do you want to clean up empty folders?[/bold yellow]")
 
 
-def show_progress(total: int) -> Progress:
+def show_progress(total: int) -> 'Progress':
     """Create Rich progress bar for file operations.
     
     Args:
@@ -118,12 +162,14 @@ def show_progress(total: int) -> Progress:
     Returns:
         Progress: Rich progress bar instance
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+    
     progress = Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TaskProgressColumn(),
-        console=console
+        console=get_console()
     )
     return progress
 
@@ -134,7 +180,7 @@ def display_error(message: str) -> None:
     Args:
         message: Error message to display
     """
-    console.print(f"[bold red]Error:[/bold red] {message}")
+    get_console().print(f"[bold red]Error:[/bold red] {message}")
 
 
 def display_safety_warnings(warnings: list[str]) -> bool:
@@ -146,6 +192,9 @@ def display_safety_warnings(warnings: list[str]) -> bool:
     Returns:
         bool: True if user confirms to proceed, False otherwise
     """
+    from rich.prompt import Confirm
+    
+    console = get_console()
     console.print()
     console.print("[bold red]⚠️  SAFETY WARNING ⚠️[/bold red]")
     console.print()
@@ -169,29 +218,66 @@ def display_safety_warnings(warnings: list[str]) -> bool:
 def display_ascii_progress(current: int, total: int) -> None:
     """Shows ASCII progress bar with █ and ░ characters.
     
+    Redraws are skipped when the frame is identical to the last one written
+    to the same stream, so frequent ticks only cost a few integer operations.
+    A tick with current == 0 starts a new progress session: it is always
+    drawn and forgets the previous run's last frame, so callers should
+    report 0 before the first item of each run.
+    
     Args:
         current: Current number of items processed
         total: Total number of items to process
     """
-    if total == 0:
-        percentage = 100
+    global _last_progress_frame
+    
+    # Integer division avoids float rounding, which showed e.g. 29/100 as 28%
+    if total > 0:
+        percentage = current * 100 // total
+        filled = current * _PROGRESS_BAR_WIDTH // total
     else:
-        percentage = int((current / total) * 100)
+        percentage = 100
+        filled = _PROGRESS_BAR_WIDTH
     
-    # Fixed bar width of 20 characters
-    bar_width = 20
-    filled = int((current / total) * bar_width) if total > 0 else bar_width
-    empty = bar_width - filled
+    # Skip the redraw if nothing visible changed within this session; the
+    # first tick of a run (current == 0) is always drawn
+    stream = sys.stdout
+    frame = (stream, filled, percentage)
+    if current and _last_progress_frame is not None and (
+        _last_progress_frame[0] is stream and _last_progress_frame[1:] == frame[1:]
+    ):
+        return
+    _last_progress_frame = frame
     
-    # Build the progress bar
-    bar = '█' * filled + '░' * empty
+    # Print with carriage return for in-place update, holding the output
+    # lock so batched log lines flushed by their timer can't split the frame
+    with output_lock:
+        stream.write(f'\r[{_progress_bar(filled)}] {percentage}%')
+        stream.flush()
+
+
+# Fixed bar width of 20 characters
+_PROGRESS_BAR_WIDTH = 20
+
+# Last (stream, filled, percentage) frame drawn by display_ascii_progress
+_last_progress_frame: Optional[tuple] = None
+
+
+@lru_cache(maxsize=_PROGRESS_BAR_WIDTH + 1)
+def _progress_bar(filled: int) -> str:
+    """Build the progress bar string for a number of filled cells.
     
-    # Print with carriage return for in-place update
-    print(f'\r[{bar}] {percentage}%', end='', flush=True)
+    Args:
+        filled: Number of filled cells (0 to the bar width)
+        
+    Returns:
+        str: Bar made of █ and ░ characters
+    """
+    return '█' * filled + '░' * (_PROGRESS_BAR_WIDTH - filled)
 
 
 def display_dry_run_banner() -> None:
     """Show prominent banner indicating dry-run mode."""
+    console = get_console()
     console.print()
     console.print("[bold yellow]" + "=" * 60 + "[/bold yellow]")
     console.print("[bold yellow]                    DRY RUN MODE                           [/bold yellow]")
@@ -1,13 +1,22 @@
 """Configuration management module for Sik Sort."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
+import copy
 import json
 import yaml
 
 
+# Use the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed configurations keyed by path, stored with the file signature
+# (mtime, size, inode) they were parsed from
+_config_cache: dict[str, tuple[tuple[int, int, int], 'Config']] = {}
+
+
 class DateMode(Enum):
     """Date mode enumeration for date-based sorting."""
     CREATION = "creation"
@@ -86,9 +95,19 @@ def load_config(config_path: Path | None) -> Config:
     if config_path is None:
         return Config()
     
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
+    # Reuse the previous parse if the file has not changed since. Callers
+    # may mutate the returned Config, so hand out a copy of the cached one.
+    cache_key = str(config_path)
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _config_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[1])
+    
     # Read file content
     content = config_path.read_text()
     
@@ -96,7 +115,7 @@ def load_config(config_path: Path | None) -> Config:
     suffix = config_path.suffix.lower()
     if suffix in ['.yaml', '.yml']:
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=_YAML_LOADER)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML syntax: {e}")
     elif suffix == '.json':
@@ -111,7 +130,9 @@ def load_config(config_path: Path | None) -> Config:
         data = {}
     
     # Build Config object from parsed data
-    return _dict_to_config(data)
+    config = _dict_to_config(data)
+    _config_cache[cache_key] = (signature, copy.deepcopy(config))
+    return config
 
 
 def _dict_to_config(data: dict[str, Any]) -> Config:
@@ -123,74 +144,75 @@ def _dict_to_config(data: dict[str, Any]) -> Config:
     Returns:
         Config: Configuration object
     """
-    config = Config()
-    
+    kwargs = {key: coerce(data[key]) for key, coerce in _FIELD_COERCIONS.items() if key in data}
+    return Config(**kwargs)
+
+
+def _expanded_path_or_none(value: Any) -> Path | None:
+    """Convert a config value to a user-expanded Path, or None if empty."""
+    return Path(value).expanduser() if value else None
+
+
+def _path_or_none(value: Any) -> Path | None:
+    """Convert a config value to a Path, or None if empty."""
+    return Path(value) if value else None
+
+
+def _date_mode_from_str(value: Any) -> DateMode:
+    """Convert a config value to a DateMode (anything but 'creation' is modification)."""
+    return DateMode.CREATION if value == 'creation' else DateMode.MODIFICATION
+
+
+def _filters_from_dict(filters_data: dict[str, Any]) -> FilterConfig:
+    """Convert the 'filters' config section to a FilterConfig."""
+    return FilterConfig(
+        include_patterns=filters_data.get('include_patterns', []),
+        exclude_patterns=filters_data.get('exclude_patterns', []),
+        include_extensions=set(filters_data.get('include_extensions', [])),
+        exclude_extensions=set(filters_data.get('exclude_extensions', []))
+    )
+
+
+def _thresholds_from_dict(thresholds_data: dict[str, Any]) -> SizeThresholds:
+    """Convert the 'size_thresholds' config section to SizeThresholds."""
+    return SizeThresholds(
+        small_max=thresholds_data.get('small_max', 1_048_576),
+        medium_max=thresholds_data.get('medium_max', 104_857_600)
+    )
+
+
+# Config fields that can be set from a configuration file, with the
+# conversion applied to each value. Keys missing from the file keep the
+# Config defaults.
+_FIELD_COERCIONS: dict[str, Callable[[Any], Any]] = {
     # General settings
-    if 'default_path' in data and data['default_path']:
-        config.default_path = Path(data['default_path']).expanduser()
-    if 'auto_cleanup' in data:
-        config.auto_cleanup = bool(data['auto_cleanup'])
-    
+    'default_path': _expanded_path_or_none,
+    'auto_cleanup': bool,
     # Undo settings
-    if 'undo_enabled' in data:
-        config.undo_enabled = bool(data['undo_enabled'])
-    if 'manifest_dir' in data:
-        config.manifest_dir = Path(data['manifest_dir'])
-    
+    'undo_enabled': bool,
+    'manifest_dir': Path,
     # Filter settings
-    if 'filters' in data:
-        filters_data = data['filters']
-        config.filters = FilterConfig(
-            include_patterns=filters_data.get('include_patterns', []),
-            exclude_patterns=filters_data.get('exclude_patterns', []),
-            include_extensions=set(filters_data.get('include_extensions', [])),
-            exclude_extensions=set(filters_data.get('exclude_extensions', []))
-        )
-    
+    'filters': _filters_from_dict,
     # Size sorting settings
-    if 'size_sorting_enabled' in data:
-        config.size_sorting_enabled = bool(data['size_sorting_enabled'])
-    if 'size_thresholds' in data:
-        thresholds_data = data['size_thresholds']
-        config.size_thresholds = SizeThresholds(
-            small_max=thresholds_data.get('small_max', 1_048_576),
-            medium_max=thresholds_data.get('medium_max', 104_857_600)
-        )
-    
+    'size_sorting_enabled': bool,
+    'size_thresholds': _thresholds_from_dict,
     # Date sorting settings
-    if 'date_sorting_enabled' in data:
-        config.date_sorting_enabled = bool(data['date_sorting_enabled'])
-    if 'date_mode' in data:
-        mode_str = data['date_mode']
-        config.date_mode = DateMode.CREATION if mode_str == 'creation' else DateMode.MODIFICATION
-    if 'date_format' in data:
-        config.date_format = str(data['date_format'])
-    
+    'date_sorting_enabled': bool,
+    'date_mode': _date_mode_from_str,
+    'date_format': str,
     # Duplicate detection settings
-    if 'duplicate_detection_enabled' in data:
-        config.duplicate_detection_enabled = bool(data['duplicate_detection_enabled'])
-    if 'hash_algorithm' in data:
-        config.hash_algorithm = str(data['hash_algorithm'])
-    
+    'duplicate_detection_enabled': bool,
+    'hash_algorithm': str,
     # Archive mode settings
-    if 'archive_mode' in data:
-        config.archive_mode = bool(data['archive_mode'])
-    
+    'archive_mode': bool,
     # Report settings
-    if 'report_enabled' in data:
-        config.report_enabled = bool(data['report_enabled'])
-    if 'report_format' in data:
-        config.report_format = str(data['report_format'])
-    if 'report_path' in data and data['report_path']:
-        config.report_path = Path(data['report_path'])
-    
+    'report_enabled': bool,
+    'report_format': str,
+    'report_path': _path_or_none,
     # Custom categories
-    if 'custom_categories' in data:
-        config.custom_categories = dict(data['custom_categories'])
-    if 'custom_extensions' in data:
-        config.custom_extensions = dict(data['custom_extensions'])
-    
-    return config
+    'custom_categories': dict,
+    'custom_extensions': dict,
+}
 
 
 def create_template_config(output_path: Path) -> None:
@@ -235,7 +257,7 @@ date_format: "%Y-%m"
 
 # Duplicate detection settings
 duplicate_detection_enabled: false
-hash_algorithm: md5  # or sha256
+hash_algorithm: md5  # or sha256, blake2b (blake3 and xxh3 need sik-sort[fast-hash])
 
 # Archive mode settings
 archive_mode: false
@@ -273,101 +295,92 @@ def merge_with_cli_args(config: Config, cli_args: dict[str, Any]) -> Config:
         cli_args: Dictionary of command-line arguments
         
     Returns:
-        Config: Merged configuration object
+        Config: Merged configuration object (nested sections that are not
+            overridden are shared with config)
     """
-    # Create a copy to avoid modifying the original
-    merged = Config(
-        default_path=config.default_path,
-        auto_cleanup=config.auto_cleanup,
-        undo_enabled=config.undo_enabled,
-        manifest_dir=config.manifest_dir,
-        filters=FilterConfig(
-            include_patterns=config.filters.include_patterns.copy(),
-            exclude_patterns=config.filters.exclude_patterns.copy(),
-            include_extensions=config.filters.include_extensions.copy(),
-            exclude_extensions=config.filters.exclude_extensions.copy()
-        ),
-        size_sorting_enabled=config.size_sorting_enabled,
-        size_thresholds=SizeThresholds(
-            small_max=config.size_thresholds.small_max,
-            medium_max=config.size_thresholds.medium_max
-        ),
-        date_sorting_enabled=config.date_sorting_enabled,
-        date_mode=config.date_mode,
-        date_format=config.date_format,
-        duplicate_detection_enabled=config.duplicate_detection_enabled,
-        hash_algorithm=config.hash_algorithm,
-        archive_mode=config.archive_mode,
-        report_enabled=config.report_enabled,
-        report_format=config.report_format,
-        report_path=config.report_path,
-        custom_categories=config.custom_categories.copy(),
-        custom_extensions=config.custom_extensions.copy()
-    )
-    
-    # Override with CLI arguments
-    if 'default_path' in cli_args and cli_args['default_path'] is not None:
-        merged.default_path = Path(cli_args['default_path'])
-    if 'auto_cleanup' in cli_args:
-        merged.auto_cleanup = cli_args['auto_cleanup']
-    if 'undo_enabled' in cli_args:
-        merged.undo_enabled = cli_args['undo_enabled']
-    if 'manifest_dir' in cli_args and cli_args['manifest_dir'] is not None:
-        merged.manifest_dir = Path(cli_args['manifest_dir'])
-    
-    # Filter settings
-    if 'include_patterns' in cli_args and cli_args['include_patterns']:
-        merged.filters.include_patterns = cli_args['include_patterns']
-    if 'exclude_patterns' in cli_args and cli_args['exclude_patterns']:
-        merged.filters.exclude_patterns = cli_args['exclude_patterns']
-    if 'include_extensions' in cli_args and cli_args['include_extensions']:
-        merged.filters.include_extensions = set(cli_args['include_extensions'])
-    if 'exclude_extensions' in cli_args and cli_args['exclude_extensions']:
-        merged.filters.exclude_extensions = set(cli_args['exclude_extensions'])
-    
-    # Size sorting settings
-    if 'size_sorting_enabled' in cli_args:
-        merged.size_sorting_enabled = cli_args['size_sorting_enabled']
-    if 'size_small_max' in cli_args and cli_args['size_small_max'] is not None:
-        merged.size_thresholds.small_max = cli_args['size_small_max']
-    if 'size_medium_max' in cli_args and cli_args['size_medium_max'] is not None:
-        merged.size_thresholds.medium_max = cli_args['size_medium_max']
-    
-    # Date sorting settings
-    if 'date_sorting_enabled' in cli_args:
-        merged.date_sorting_enabled = cli_args['date_sorting_enabled']
-    if 'date_mode' in cli_args and cli_args['date_mode'] is not None:
-        merged.date_mode = cli_args['date_mode']
-    if 'date_format' in cli_args and cli_args['date_format'] is not None:
-        merged.date_format = cli_args['date_format']
-    
-    # Duplicate detection settings
-    if 'duplicate_detection_enabled' in cli_args:
-        merged.duplicate_detection_enabled = cli_args['duplicate_detection_enabled']
-    if 'hash_algorithm' in cli_args and cli_args['hash_algorithm'] is not None:
-        merged.hash_algorithm = cli_args['hash_algorithm']
-    
-    # Archive mode settings
-    if 'archive_mode' in cli_args:
-        merged.archive_mode = cli_args['archive_mode']
-    
-    # Report settings
-    if 'report_enabled' in cli_args:
-        merged.report_enabled = cli_args['report_enabled']
-    if 'report_format' in cli_args and cli_args['report_format'] is not None:
-        merged.report_format = cli_args['report_format']
-    if 'report_path' in cli_args and cli_args['report_path'] is not None:
-        merged.report_path = Path(cli_args['report_path'])
-    
-    # Custom categories and extensions
-    if 'custom_categories' in cli_args and cli_args['custom_categories']:
-        merged.custom_categories = cli_args['custom_categories']
-    if 'custom_extensions' in cli_args and cli_args['custom_extensions']:
-        merged.custom_extensions = cli_args['custom_extensions']
+    # Collect top-level overrides from the CLI arguments
+    overrides: dict[str, Any] = {}
+    for key in _CLI_FLAG_FIELDS:
+        if key in cli_args:
+            overrides[key] = cli_args[key]
+    for key, coerce in _CLI_OPTIONAL_FIELDS.items():
+        value = cli_args.get(key)
+        if value is not None:
+            overrides[key] = coerce(value) if coerce is not None else value
+    for key in _CLI_NONEMPTY_FIELDS:
+        if cli_args.get(key):
+            overrides[key] = cli_args[key]
+    
+    # Nested sections are only copied when the CLI overrides part of them;
+    # untouched sections are shared with the original config
+    filter_changes = {
+        key: coerce(cli_args[key]) if coerce is not None else cli_args[key]
+        for key, coerce in _CLI_FILTER_FIELDS.items()
+        if cli_args.get(key)
+    }
+    if filter_changes:
+        overrides['filters'] = replace(config.filters, **filter_changes)
+    
+    threshold_changes = {
+        field_name: cli_args[key]
+        for key, field_name in _CLI_THRESHOLD_FIELDS.items()
+        if cli_args.get(key) is not None
+    }
+    if threshold_changes:
+        overrides['size_thresholds'] = replace(config.size_thresholds, **threshold_changes)
+    
+    # Build the merged config without modifying the original
+    merged = replace(config, **overrides)
     
     return merged
 
 
+# CLI arguments applied whenever they are present
+_CLI_FLAG_FIELDS = (
+    'auto_cleanup',
+    'undo_enabled',
+    'size_sorting_enabled',
+    'date_sorting_enabled',
+    'duplicate_detection_enabled',
+    'archive_mode',
+    'report_enabled',
+)
+
+# CLI arguments applied unless None, with the conversion for each value
+# (None means the value is used as given)
+_CLI_OPTIONAL_FIELDS: dict[str, Callable[[Any], Any] | None] = {
+    'default_path': Path,
+    'manifest_dir': Path,
+    'date_mode': None,
+    'date_format': None,
+    'hash_algorithm': None,
+    'report_format': None,
+    'report_path': Path,
+}
+
+# CLI arguments applied only when non-empty
+_CLI_NONEMPTY_FIELDS = (
+    'custom_categories',
+    'custom_extensions',
+)
+
+# CLI filter arguments (applied when non-empty), with the conversion for
+# each value (None means the value is used as given)
+_CLI_FILTER_FIELDS: dict[str, Callable[[Any], Any] | None] = {
+    'include_patterns': None,
+    'exclude_patterns': None,
+    'include_extensions': set,
+    'exclude_extensions': set,
+}
+
+# CLI size threshold arguments (applied unless None) and the SizeThresholds
+# field each one sets
+_CLI_THRESHOLD_FIELDS = {
+    'size_small_max': 'small_max',
+    'size_medium_max': 'medium_max',
+}
+
+
 def validate_config(config: Config) -> list[str]:
     """Validate configuration values.
     
@@ -387,9 +400,12 @@ def validate_config(config: Config) -> list[str]:
     if config.size_thresholds.small_max >= config.size_thresholds.medium_max:
         errors.append("size_thresholds.small_max must be less than medium_max")
     
-    # Validate hash algorithm
-    if config.hash_algorithm not in ['md5', 'sha256']:
-        errors.append(f"hash_algorithm must be 'md5' or 'sha256', got '{config.hash_algorithm}'")
+    # Validate hash algorithm; duplicates pulls in the hash cache, scanner
+    # and mmap, so it is only imported when a config is actually validated
+    from .duplicates import available_algorithms
+    if config.hash_algorithm not in available_algorithms():
+        supported = ", ".join(f"'{name}'" for name in available_algorithms())
+        errors.append(f"hash_algorithm must be one of {supported}, got '{config.hash_algorithm}'")
     
     # Validate report format
     if config.report_format not in ['json', 'csv']:
@@ -1,8 +1,11 @@
 """Date classifier module for categorizing files by date."""
 
+import os
+import time
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from typing import Union
 
 
 class DateMode(Enum):
@@ -11,33 +14,87 @@ class DateMode(Enum):
     MODIFICATION = "modification"
 
 
-def classify_by_date(file_path: Path, use_creation: bool = False, date_format: str = "%Y-%m") -> str:
+# Formatters for the common folder formats, taking (year, month, day).
+# These skip strftime's format parsing and, in classify_by_date, the
+# datetime allocation; any other format falls back to strftime.
+_FAST_FORMATTERS = {
+    "%Y-%m": lambda year, month, day: f"{year:04d}-{month:02d}",
+    "%Y-%m-%d": lambda year, month, day: f"{year:04d}-{month:02d}-{day:02d}",
+    "%Y": lambda year, month, day: f"{year:04d}",
+}
+
+
+def classify_by_date(
+    file_path: Union[Path, str],
+    use_creation: bool = False,
+    date_format: str = "%Y-%m",
+    stat_result: os.stat_result | None = None
+) -> str:
     """Categorizes a file by its date and returns a formatted date string.
     
     Args:
-        file_path: Path to the file to classify
+        file_path: Path to the file to classify (as a Path or string)
         use_creation: If True, use creation date; otherwise use modification date
         date_format: Format string for the date (default: "%Y-%m" for YYYY-MM)
+        stat_result: Stat result already fetched for the file (skips the stat call)
         
     Returns:
         str: Formatted date string for folder naming
     """
-    date = get_file_date(file_path, use_creation)
-    return format_date(date, date_format)
+    stat = stat_result if stat_result is not None else os.stat(file_path)
+    timestamp = _timestamp_from_stat(stat, use_creation)
+    
+    formatter = _FAST_FORMATTERS.get(date_format)
+    if formatter is not None:
+        year, month, day = time.localtime(timestamp)[:3]
+        # strftime does not zero-pad years below 1000 on every platform
+        if year >= 1000:
+            return formatter(year, month, day)
+    
+    return format_date(datetime.fromtimestamp(timestamp), date_format)
 
 
-def get_file_date(file_path: Path, use_creation: bool = False) -> datetime:
+def get_file_date(file_path: Path, use_creation: bool = False, stat_result: os.stat_result | None = None) -> datetime:
     """Retrieves the creation or modification timestamp of a file.
     
     Args:
         file_path: Path to the file
         use_creation: If True, return creation date; otherwise return modification date
+        stat_result: Stat result already fetched for the file (skips the stat call)
+        
+    Returns:
+        datetime: File timestamp
+    """
+    stat = stat_result if stat_result is not None else file_path.stat()
+    return datetime.fromtimestamp(_timestamp_from_stat(stat, use_creation))
+
+
+def get_file_date_from_entry(entry: os.DirEntry, use_creation: bool = False) -> datetime:
+    """Retrieves the creation or modification timestamp of a scanned directory entry.
+    
+    DirEntry caches its stat result, and on Windows the result comes from
+    the directory listing itself, so no extra system call is needed.
+    
+    Args:
+        entry: Directory entry from os.scandir
+        use_creation: If True, return creation date; otherwise return modification date
         
     Returns:
         datetime: File timestamp
     """
-    stat = file_path.stat()
+    return datetime.fromtimestamp(_timestamp_from_stat(entry.stat(), use_creation))
+
+
+def _timestamp_from_stat(stat: os.stat_result, use_creation: bool) -> float:
+    """Picks the creation or modification timestamp from a stat result.
     
+    Args:
+        stat: Stat result of the file
+        use_creation: If True, use creation date; otherwise use modification date
+        
+    Returns:
+        float: Timestamp in seconds since the epoch
+    """
     if use_creation:
         # st_ctime on Unix is the last metadata change time, not creation time
         # st_birthtime is creation time on some systems (macOS, BSD)
@@ -48,7 +105,7 @@ def get_file_date(file_path: Path, use_creation: bool = False) -> datetime:
         # st_mtime is modification time
         timestamp = stat.st_mtime
     
-    return datetime.fromtimestamp(timestamp)
+    return timestamp
 
 
 def format_date(date: datetime, format_string: str = "%Y-%m") -> str:
@@ -61,4 +118,8 @@ def format_date(date: datetime, format_string: str = "%Y-%m") -> str:
     Returns:
         str: Formatted date string
     """
+    formatter = _FAST_FORMATTERS.get(format_string)
+    if formatter is not None and date.year >= 1000:
+        return formatter(date.year, date.month, date.day)
+    
     return date.strftime(format_string)
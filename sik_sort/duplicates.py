@@ -1,9 +1,65 @@
 """Duplicate detector module for identifying files with identical content."""
 
+import filecmp
 import hashlib
+import mmap
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, BinaryIO, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .hash_cache import HashCache
+from .scanner import FileRecord
+
+
+# Optional hash libraries, used when installed (pip install sik-sort[fast-hash])
+try:
+    import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+try:
+    import xxhash as _xxhash
+except ImportError:
+    _xxhash = None
+
+
+# Supported hash algorithms and their hashlib-style constructors
+_HASH_ALGORITHMS = {
+    "md5": hashlib.md5,
+    "sha256": hashlib.sha256,
+    "blake2b": hashlib.blake2b,
+}
+if _blake3 is not None:
+    _HASH_ALGORITHMS["blake3"] = _blake3.blake3
+if _xxhash is not None:
+    _HASH_ALGORITHMS["xxh3"] = _xxhash.xxh3_128
+
+# Algorithms that are not collision resistant; files they group together are
+# confirmed by comparing their contents
+_NON_CRYPTOGRAPHIC_ALGORITHMS = frozenset({"xxh3"})
+
+# Number of leading and trailing bytes compared before a file is fully
+# hashed (4KB each)
+_HEAD_SIZE = 4096
+
+# Positional reads (not available on Windows)
+_pread = getattr(os, 'pread', None)
+
+# Files at least this large are hashed through mmap (1MB)
+_MMAP_THRESHOLD = 1024 * 1024
+
+# madvise hint for mapped files (not available on every platform)
+_MADV_SEQUENTIAL = getattr(mmap, 'MADV_SEQUENTIAL', None)
+
+# C-level file hashing helper (Python 3.11+)
+_file_digest = getattr(hashlib, 'file_digest', None)
+
+# Default algorithms in order of preference; the first one installed is
+# used, so the same files always get the same digests and cache keys
+_DEFAULT_ALGORITHMS = ("xxh3", "blake3", "blake2b", "md5")
 
 
 @dataclass
@@ -22,40 +78,312 @@ class DuplicateStats:
     duplicate_groups: int = 0
 
 
-def find_duplicates(files: List[Path], algorithm: str = "md5") -> Dict[str, List[Path]]:
+class DuplicateGroup(list):
+    """List of paths to files with identical content.
+    
+    Behaves like a plain list of paths, and also carries the file size that
+    duplicate detection already knows, so callers don't need to stat the
+    files again.
+    
+    Attributes:
+        size: Size in bytes of each file in the group
+    """
+    __slots__ = ('size',)
+    
+    def __init__(self, size: int, paths: Iterable[Path] = ()):
+        super().__init__(paths)
+        self.size = size
+
+
+def find_duplicates(
+    files: Sequence[Union[Path, FileRecord]],
+    algorithm: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    cache: Optional[HashCache] = None
+) -> Dict[str, DuplicateGroup]:
     """Identifies files with identical content using hash comparison.
     
     Args:
-        files: List of file paths to check for duplicates
-        algorithm: Hash algorithm to use ("md5" or "sha256")
+        files: List of file paths or scanned file records to check for
+            duplicates; records supply their size without a stat call
+        algorithm: Hash algorithm to use ("md5", "sha256", "blake2b", or
+            "blake3" and "xxh3" when installed). If None, default_algorithm()
+            is used.
+        max_workers: Number of hashing threads (defaults to four times the
+            CPU count, capped at 32)
+        cache: Persistent hash cache. Files whose size and modification time
+            match a cached entry are not read again, and new hashes are
+            stored in it.
         
     Returns:
-        Dict mapping hash values to lists of file paths with that hash.
+        Dict mapping hash values to groups of file paths with that hash.
         Only includes hashes that have multiple files (duplicates).
+        
+    Raises:
+        ValueError: If algorithm is not supported
+    """
+    if algorithm is None:
+        algorithm = default_algorithm()
+    elif algorithm.lower() not in _HASH_ALGORITHMS:
+        raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+    
+    # Files can only be duplicates of files with the same size, so only
+    # files that share their size with another file need to be hashed
+    candidates: List[Path] = []
+    candidate_sizes: List[int] = []
+    for file_size, same_size in _group_by_size(files).items():
+        if len(same_size) < 2:
+            continue
+        
+        # Larger files are split further by their first and last bytes so
+        # files that differ there are never read in full
+        if file_size > _HEAD_SIZE:
+            groups = _group_by_fingerprint(same_size, file_size).values()
+        else:
+            groups = [same_size]
+        
+        for group in groups:
+            if len(group) > 1:
+                candidates.extend(group)
+                candidate_sizes.extend([file_size] * len(group))
+    
+    algorithm = algorithm.lower()
+    
+    # Reuse cached hashes for files that haven't changed since they were
+    # hashed. The cache is shared by every working directory, so entries
+    # are keyed by absolute path.
+    digests: List[Optional[str]] = [None] * len(candidates)
+    signatures: List[Optional[Tuple[str, int, int]]] = [None] * len(candidates)
+    if cache is not None:
+        for index, file_path in enumerate(candidates):
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                continue
+            signatures[index] = (os.path.abspath(file_path), file_stat.st_size, file_stat.st_mtime_ns)
+            digests[index] = cache.get(*signatures[index], algorithm)
+    
+    # Hash the remaining candidates in parallel
+    missing = [index for index, digest in enumerate(digests) if digest is None]
+    hashed = _hash_files([candidates[index] for index in missing], algorithm, max_workers)
+    for index, (file_path, file_hash) in zip(missing, hashed):
+        digests[index] = file_hash
+    
+    # Store the new hashes in one transaction
+    if cache is not None:
+        cache.put_many(
+            (*signatures[index], algorithm, digests[index])
+            for index in missing
+            if signatures[index] is not None and digests[index] is not None
+        )
+    
+    # Collate the results; a hash only gets a group once a second file with
+    # it is seen, so files with unique content never allocate one
+    first_seen: Dict[str, Path] = {}
+    duplicates: Dict[str, DuplicateGroup] = {}
+    for file_path, file_hash, file_size in zip(candidates, digests, candidate_sizes):
+        if file_hash is None:
+            # Skip files that cannot be read
+            continue
+        group = duplicates.get(file_hash)
+        if group is not None:
+            group.append(file_path)
+        elif file_hash in first_seen:
+            duplicates[file_hash] = DuplicateGroup(file_size, [first_seen.pop(file_hash), file_path])
+        else:
+            first_seen[file_hash] = file_path
+    
+    # Non-cryptographic hashes can collide, so confirm their groups by content
+    if algorithm in _NON_CRYPTOGRAPHIC_ALGORITHMS:
+        duplicates = _confirm_by_content(duplicates)
+    
+    return duplicates
+
+
+def _confirm_by_content(duplicates: Dict[str, DuplicateGroup]) -> Dict[str, DuplicateGroup]:
+    """Splits duplicate groups into groups of files with identical content.
+    
+    Args:
+        duplicates: Dict mapping hashes to groups of files with that hash
+        
+    Returns:
+        Dict mapping hashes to groups whose files are byte-for-byte identical.
+        If a group splits, the extra groups are keyed as "<hash>:<n>". Only
+        groups with multiple files are included.
+    """
+    confirmed: Dict[str, DuplicateGroup] = {}
+    
+    for file_hash, group in duplicates.items():
+        subgroups: List[DuplicateGroup] = []
+        for file_path in group:
+            try:
+                for subgroup in subgroups:
+                    if filecmp.cmp(subgroup[0], file_path, shallow=False):
+                        subgroup.append(file_path)
+                        break
+                else:
+                    subgroups.append(DuplicateGroup(group.size, [file_path]))
+            except OSError:
+                # Skip files that cannot be read
+                continue
+        
+        subgroups = [subgroup for subgroup in subgroups if len(subgroup) > 1]
+        for index, subgroup in enumerate(subgroups):
+            confirmed[file_hash if index == 0 else f"{file_hash}:{index}"] = subgroup
+    
+    return confirmed
+
+
+def _group_by_size(files: Sequence[Union[Path, FileRecord]]) -> Dict[int, List[Path]]:
+    """Groups files by their size in bytes.
+    
+    Args:
+        files: List of file paths or scanned file records to group
+        
+    Returns:
+        Dict mapping file sizes to the files of that size, in input order.
+        Files that cannot be accessed are skipped.
+    """
+    size_to_files: Dict[int, List[Path]] = {}
+    
+    for item in files:
+        if isinstance(item, FileRecord):
+            file_path = item.path
+            file_size = item.size
+        else:
+            file_path = item
+            try:
+                file_size = file_path.stat().st_size
+            except OSError:
+                continue
+        size_to_files.setdefault(file_size, []).append(file_path)
+    
+    return size_to_files
+
+
+def _group_by_fingerprint(files: List[Path], file_size: int) -> Dict[bytes, List[Path]]:
+    """Groups same-size files by a fingerprint of their first and last bytes.
+    
+    Args:
+        files: List of file paths to group, all of file_size bytes
+        file_size: Size in bytes shared by the files
+        
+    Returns:
+        Dict mapping fingerprints to the files that have them, in input order.
+        Unreadable files are skipped.
     """
-    hash_to_files: Dict[str, List[Path]] = {}
+    fingerprint_to_files: Dict[bytes, List[Path]] = {}
     
     for file_path in files:
         try:
-            file_hash = compute_hash(file_path, algorithm)
-            if file_hash not in hash_to_files:
-                hash_to_files[file_hash] = []
-            hash_to_files[file_hash].append(file_path)
-        except (OSError, IOError) as e:
-            # Skip files that cannot be read
+            fingerprint = _head_tail_fingerprint(file_path, file_size)
+        except OSError:
             continue
+        fingerprint_to_files.setdefault(fingerprint, []).append(file_path)
     
-    # Return only hashes with duplicates (more than one file)
-    return {h: paths for h, paths in hash_to_files.items() if len(paths) > 1}
+    return fingerprint_to_files
 
 
-def compute_hash(file_path: Path, algorithm: str = "md5") -> str:
-    """Computes the hash of a file using streaming to handle large files.
+def _head_tail_fingerprint(file_path: Path, file_size: int) -> bytes:
+    """Hashes the first and last _HEAD_SIZE bytes of a file.
+    
+    Most files of the same size that differ at all already differ in their
+    headers or trailers, so comparing these is much cheaper than hashing the
+    whole file.
+    
+    Args:
+        file_path: Path to the file
+        file_size: Size of the file in bytes
+        
+    Returns:
+        bytes: 16-byte BLAKE2b digest of the head and tail
+        
+    Raises:
+        OSError: If the file cannot be read
+    """
+    tail_offset = max(0, file_size - _HEAD_SIZE)
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        if _pread is not None:
+            head = _pread(fd, _HEAD_SIZE, 0)
+            tail = _pread(fd, _HEAD_SIZE, tail_offset)
+        else:
+            head = os.read(fd, _HEAD_SIZE)
+            os.lseek(fd, tail_offset, os.SEEK_SET)
+            tail = os.read(fd, _HEAD_SIZE)
+    finally:
+        os.close(fd)
+    
+    hasher = hashlib.blake2b(head, digest_size=16)
+    hasher.update(tail)
+    return hasher.digest()
+
+
+def _hash_files(
+    files: List[Path],
+    algorithm: str,
+    max_workers: int
+) -> Iterator[Tuple[Path, Optional[str]]]:
+    """Hashes files on a thread pool, yielding results in input order.
+    
+    hashlib releases the GIL while hashing, so files are hashed in parallel.
+    At most a few files per worker are in flight at any time, which keeps
+    memory flat for long file lists.
+    
+    Args:
+        files: List of file paths to hash
+        algorithm: Hash algorithm to use ("md5" or "sha256")
+        max_workers: Number of hashing threads
+        
+    Yields:
+        Tuples of (file path, hash), with None as the hash for files that
+        cannot be read
+    """
+    if len(files) < 2 or max_workers < 2:
+        for file_path in files:
+            yield file_path, _try_compute_hash(file_path, algorithm)
+        return
+    
+    max_in_flight = max_workers * 2
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight: Deque[Tuple[Path, Future]] = deque()
+        for file_path in files:
+            if len(in_flight) >= max_in_flight:
+                done_path, future = in_flight.popleft()
+                yield done_path, future.result()
+            in_flight.append((file_path, executor.submit(_try_compute_hash, file_path, algorithm)))
+        
+        while in_flight:
+            done_path, future = in_flight.popleft()
+            yield done_path, future.result()
+
+
+def _try_compute_hash(file_path: Path, algorithm: str) -> Optional[str]:
+    """Computes the hash of a file, returning None if it cannot be read.
     
     Args:
         file_path: Path to the file to hash
         algorithm: Hash algorithm to use ("md5" or "sha256")
         
+    Returns:
+        Optional[str]: Hexadecimal hash string, or None on read errors
+    """
+    try:
+        return compute_hash(file_path, algorithm)
+    except (OSError, IOError):
+        return None
+
+
+def compute_hash(file_path: Path, algorithm: str = "md5") -> str:
+    """Computes the hash of a file, memory-mapping large files.
+    
+    Args:
+        file_path: Path to the file to hash
+        algorithm: Hash algorithm to use (one of available_algorithms())
+        
     Returns:
         str: Hexadecimal hash string
         
@@ -63,32 +391,94 @@ def compute_hash(file_path: Path, algorithm: str = "md5") -> str:
         ValueError: If algorithm is not supported
         OSError: If file cannot be read
     """
-    if algorithm.lower() == "md5":
-        hasher = hashlib.md5()
-    elif algorithm.lower() == "sha256":
-        hasher = hashlib.sha256()
-    else:
+    hasher_factory = _HASH_ALGORITHMS.get(algorithm.lower())
+    if hasher_factory is None:
         raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    hasher = hasher_factory()
+    
+    with open(file_path, 'rb') as f:
+        # Small files are read and hashed in one call
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            hasher.update(f.read())
+            return hasher.hexdigest()
+        
+        # Larger files are mapped and hashed in a single update so the whole
+        # buffer is handed to the hash implementation without a Python-level
+        # read loop; sequential access lets the kernel read ahead aggressively
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if _MADV_SEQUENTIAL is not None:
+                    mapped.madvise(_MADV_SEQUENTIAL)
+                hasher.update(mapped)
+            return hasher.hexdigest()
+        except (ValueError, OSError):
+            # Files that cannot be mapped are streamed instead
+            f.seek(0)
+        
+        return _stream_digest(f, hasher_factory).hexdigest()
+
+
+def _stream_digest(f: BinaryIO, hasher_factory: Callable[[], Any]) -> Any:
+    """Hashes a binary file object by streaming it into a fresh hasher.
+    
+    Uses hashlib.file_digest where available (Python 3.11+), otherwise reads
+    into one reusable buffer so no new bytes object is allocated per chunk.
+    
+    Args:
+        f: Binary file object positioned at the start of the data
+        hasher_factory: Constructor for the hash object (e.g., hashlib.md5)
+        
+    Returns:
+        Hash object that has consumed the whole file
+    """
+    if _file_digest is not None:
+        return _file_digest(f, hasher_factory)
+    
+    hasher = hasher_factory()
     
-    # Use streaming to handle large files efficiently
     # Read in 64KB chunks
-    chunk_size = 65536
+    buffer = bytearray(65536)
+    view = memoryview(buffer)
+    while True:
+        size = f.readinto(buffer)
+        if not size:
+            break
+        hasher.update(view[:size])
     
-    with open(file_path, 'rb') as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            hasher.update(chunk)
+    return hasher
+
+
+def available_algorithms() -> tuple[str, ...]:
+    """Returns the names of the hash algorithms usable on this installation.
+    
+    Returns:
+        tuple: Algorithm names; "md5", "sha256" and "blake2b" are always
+            available, and "blake3" and "xxh3" when their optional libraries
+            are installed
+    """
+    return tuple(_HASH_ALGORITHMS)
+
+
+def default_algorithm() -> str:
+    """Picks the hash algorithm used when none is given.
     
-    return hasher.hexdigest()
+    The first installed algorithm in a fixed order of preference is used:
+    xxh3, blake3, blake2b, then md5. xxh3 is not collision resistant, so
+    find_duplicates confirms its groups by comparing file contents.
+    
+    Returns:
+        str: Name of the default algorithm (e.g., "xxh3" or "blake2b")
+    """
+    return next(name for name in _DEFAULT_ALGORITHMS if name in _HASH_ALGORITHMS)
 
 
 def calculate_space_saved(duplicates: Dict[str, List[Path]]) -> int:
     """Calculates the total space that could be saved by removing duplicates.
     
     Args:
-        duplicates: Dict mapping hashes to lists of duplicate file paths
+        duplicates: Dict mapping hashes to lists of duplicate file paths.
+            Groups returned by find_duplicates carry their file size, so no
+            files need to be accessed; other lists are sized with stat().
         
     Returns:
         int: Total bytes that could be saved (size of all duplicates except first)
@@ -98,12 +488,14 @@ def calculate_space_saved(duplicates: Dict[str, List[Path]]) -> int:
     for file_list in duplicates.values():
         if len(file_list) > 1:
             # Get size of first file (the one we keep)
-            try:
-                file_size = file_list[0].stat().st_size
-                # Space saved is the size multiplied by number of duplicates (excluding the original)
-                total_saved += file_size * (len(file_list) - 1)
-            except OSError:
-                # Skip if we can't get file size
-                continue
+            file_size = getattr(file_list, 'size', None)
+            if file_size is None:
+                try:
+                    file_size = file_list[0].stat().st_size
+                except OSError:
+                    # Skip if we can't get file size
+                    continue
+            # Space saved is the size multiplied by number of duplicates (excluding the original)
+            total_saved += file_size * (len(file_list) - 1)
     
     return total_saved
@@ -1,8 +1,11 @@
 """Filter engine module for filtering files based on patterns and extensions."""
 
+import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from fnmatch import fnmatch
+from fnmatch import fnmatch, translate
+from typing import Callable, Optional
 
 
 @dataclass
@@ -21,17 +24,20 @@ class FilterConfig:
     exclude_extensions: set[str] = field(default_factory=set)
 
 
-def apply_filters(files: list[Path], config: FilterConfig) -> tuple[list[Path], int]:
+def apply_filters(files: list, config: FilterConfig) -> tuple[list, int]:
     """Filters file list based on patterns and extensions.
     
-    Applies filters in the following order:
+    A file is kept only if it passes every filter that is specified:
     1. Include patterns (if specified)
     2. Include extensions (if specified)
     3. Exclude patterns (if specified)
     4. Exclude extensions (if specified)
     
+    All filters are checked in a single pass over the file list.
+    
     Args:
-        files: List of file paths to filter
+        files: List of file paths to filter; any objects with a name
+            attribute, such as scanned file records, can be filtered
         config: Filter configuration
         
     Returns:
@@ -39,27 +45,77 @@ def apply_filters(files: list[Path], config: FilterConfig) -> tuple[list[Path],
             - filtered_files: List of files that passed all filters
             - excluded_count: Number of files excluded by filters
     """
-    total_files = len(files)
-    filtered = files.copy()
+    # Without any filters every file passes; skip the per-file checks
+    passes = compile_filter(config)
+    if passes is None:
+        return list(files), 0
     
-    # Apply include patterns first (if any)
-    if config.include_patterns:
-        filtered = [f for f in filtered if any(matches_pattern(f, pattern) for pattern in config.include_patterns)]
+    # All filters are applied in a single pass over the file list
+    filtered = [f for f in files if passes(f.name)]
     
-    # Apply include extensions (if any)
-    if config.include_extensions:
-        filtered = [f for f in filtered if matches_extensions(f, config.include_extensions)]
+    excluded_count = len(files) - len(filtered)
+    return filtered, excluded_count
+
+
+def compile_filter(config: FilterConfig) -> Optional[Callable[[str], bool]]:
+    """Builds a predicate that checks a file name against all filters.
     
-    # Apply exclude patterns (if any)
-    if config.exclude_patterns:
-        filtered = [f for f in filtered if not any(matches_pattern(f, pattern) for pattern in config.exclude_patterns)]
+    Args:
+        config: Filter configuration
+        
+    Returns:
+        Optional[Callable]: Function returning True for names that pass every
+            filter, or None if no filters are specified
+    """
+    if not (config.include_patterns or config.exclude_patterns
+            or config.include_extensions or config.exclude_extensions):
+        return None
     
-    # Apply exclude extensions (if any)
-    if config.exclude_extensions:
-        filtered = [f for f in filtered if not matches_extensions(f, config.exclude_extensions)]
+    # Compile each pattern list into a single regex so every file needs one
+    # match call per list instead of one fnmatch call per pattern
+    include_regex = _compile_patterns(config.include_patterns)
+    exclude_regex = _compile_patterns(config.exclude_patterns)
     
-    excluded_count = total_files - len(filtered)
-    return filtered, excluded_count
+    # Normalize the extension sets once rather than once per file
+    include_extensions = _normalize_extensions(config.include_extensions)
+    exclude_extensions = _normalize_extensions(config.exclude_extensions)
+    
+    def passes(name: str) -> bool:
+        return _passes(name, include_regex, include_extensions, exclude_regex, exclude_extensions)
+    
+    return passes
+
+
+def _passes(
+    name: str,
+    include_regex: Optional[re.Pattern],
+    include_extensions: frozenset[str],
+    exclude_regex: Optional[re.Pattern],
+    exclude_extensions: frozenset[str]
+) -> bool:
+    """Checks a file name against all filters, stopping at the first failure.
+    
+    Args:
+        name: File name to check
+        include_regex: Compiled include patterns, or None if there are none
+        include_extensions: Normalized extensions to include (empty for all)
+        exclude_regex: Compiled exclude patterns, or None if there are none
+        exclude_extensions: Normalized extensions to exclude
+        
+    Returns:
+        bool: True if the file passes every filter, False otherwise
+    """
+    if include_regex is not None and include_regex.match(os.path.normcase(name)) is None:
+        return False
+    if include_extensions or exclude_extensions:
+        file_ext = file_suffix(name).lower()
+        if include_extensions and file_ext not in include_extensions:
+            return False
+        if file_ext in exclude_extensions:
+            return False
+    if exclude_regex is not None and exclude_regex.match(os.path.normcase(name)) is not None:
+        return False
+    return True
 
 
 def matches_pattern(file_path: Path, pattern: str) -> bool:
@@ -85,7 +141,52 @@ def matches_extensions(file_path: Path, extensions: set[str]) -> bool:
     Returns:
         bool: True if file has one of the extensions, False otherwise
     """
-    file_ext = file_path.suffix.lower()
-    # Normalize extensions to lowercase for comparison
-    normalized_extensions = {ext.lower() for ext in extensions}
-    return file_ext in normalized_extensions
+    return file_suffix(file_path.name).lower() in _normalize_extensions(extensions)
+
+
+def _compile_patterns(patterns: list[str]) -> Optional[re.Pattern]:
+    """Compiles glob patterns into one regex matching any of them.
+    
+    Patterns are case-normalized the same way fnmatch does, so matching a
+    normcased file name against the result is equivalent to calling fnmatch
+    with each pattern.
+    
+    Args:
+        patterns: List of glob patterns (e.g., ["*.jpg", "*_backup*"])
+        
+    Returns:
+        Optional[re.Pattern]: Compiled regex, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile('|'.join(
+        f'(?:{translate(os.path.normcase(pattern))})' for pattern in patterns
+    ))
+
+
+def _normalize_extensions(extensions: set[str]) -> frozenset[str]:
+    """Normalizes extensions to lowercase for comparison.
+    
+    Args:
+        extensions: Set of extensions (e.g., {".PDF", ".doc"})
+        
+    Returns:
+        frozenset: Lowercase extensions
+    """
+    return frozenset(ext.lower() for ext in extensions)
+
+
+def file_suffix(name: str) -> str:
+    """Returns the extension of a file name, like Path.suffix.
+    
+    Args:
+        name: File name (e.g., "photo.JPG")
+        
+    Returns:
+        str: Extension including the dot (e.g., ".JPG"), or an empty string
+            for names without one
+    """
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[dot:]
+    return ''
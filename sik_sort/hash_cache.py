@@ -0,0 +1,100 @@
+"""Hash cache module for reusing file hashes across duplicate detection runs."""
+
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+
+# Default location of the persistent hash cache
+DEFAULT_HASH_CACHE_PATH = Path.home() / ".sik_sort" / "hash_cache.sqlite"
+
+
+class HashCache:
+    """Persistent cache of file hashes keyed by path, size and modification time.
+    
+    A cached hash is only returned while the file's size and modification
+    time are unchanged, so modified files are always hashed again.
+    
+    Attributes:
+        db_path: Path to the SQLite database file
+    """
+    
+    def __init__(self, db_path: Path = DEFAULT_HASH_CACHE_PATH):
+        """Opens the cache database, creating it if needed.
+        
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._connection = sqlite3.connect(str(self.db_path))
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            "path TEXT NOT NULL, "
+            "algorithm TEXT NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, "
+            "digest TEXT NOT NULL, "
+            "PRIMARY KEY (path, algorithm))"
+        )
+        self._connection.commit()
+    
+    def get(self, path: str, size: int, mtime_ns: int, algorithm: str) -> Optional[str]:
+        """Looks up the cached hash of a file.
+        
+        Args:
+            path: File path as a string
+            size: Current file size in bytes
+            mtime_ns: Current modification time in nanoseconds
+            algorithm: Hash algorithm name (e.g., "md5")
+        
+        Returns:
+            Optional[str]: Cached hexadecimal hash, or None if the file is not
+                cached or has changed since it was hashed
+        """
+        row = self._connection.execute(
+            "SELECT digest FROM hashes "
+            "WHERE path = ? AND algorithm = ? AND size = ? AND mtime_ns = ?",
+            (path, algorithm, size, mtime_ns)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def put_many(self, entries: Iterable[Tuple[str, int, int, str, str]]) -> None:
+        """Stores file hashes in a single transaction.
+        
+        Args:
+            entries: Tuples of (path, size, mtime_ns, algorithm, digest)
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO hashes (path, size, mtime_ns, algorithm, digest) "
+                "VALUES (?, ?, ?, ?, ?)",
+                entries
+            )
+    
+    def move_many(self, moves: Iterable[Tuple[str, str]]) -> None:
+        """Re-keys cached hashes of moved files in a single transaction.
+        
+        A rename keeps a file's size and modification time, so its cached
+        hashes stay valid under the new path.
+        
+        Args:
+            moves: Tuples of (old_path, new_path)
+        """
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE OR REPLACE hashes SET path = ? WHERE path = ?",
+                ((new_path, old_path) for old_path, new_path in moves)
+            )
+    
+    def close(self) -> None:
+        """Closes the cache database."""
+        self._connection.close()
+    
+    def __enter__(self) -> "HashCache":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -1,9 +1,9 @@
 """Main entry point for Sik Sort application."""
 
 from pathlib import Path
-from rich.console import Console
 from .classifier import FileCategory
 from .cli import (
+    get_console,
     parse_arguments,
     prompt_for_path,
     display_statistics,
@@ -16,11 +16,14 @@ from .cli import (
 )
 from .sorter import sort_files
 from .scanner import scan_directory
-from .cleaner import find_empty_directories, remove_empty_directories
+from .cleaner import clean_empty_directories
 from .safety import run_safety_checks
 from .operation_logger import log_scan_complete
 
-console = Console()
+# Category folder names, created in the source directory and excluded from
+# scanning and cleanup
+CATEGORY_FOLDERS: tuple[str, ...] = tuple(category.value for category in FileCategory)
+EXCLUDE_DIRS: frozenset[str] = frozenset(CATEGORY_FOLDERS)
 
 
 def setup_category_folders(source_path: Path, dry_run: bool = False) -> None:
@@ -34,8 +37,7 @@ def setup_category_folders(source_path: Path, dry_run: bool = False) -> None:
         # In dry-run mode, don't actually create folders
         return
     
-    category_folders = ['img', 'vid', 'arc', 'msk']
-    for folder_name in category_folders:
+    for folder_name in CATEGORY_FOLDERS:
         folder_path = source_path / folder_name
         folder_path.mkdir(exist_ok=True)
 
@@ -44,7 +46,11 @@ def main() -> None:
     """Main application flow."""
     try:
         # Parse command line arguments
-        source_path, dry_run = parse_arguments()
+        source_path, dry_run, recursive = parse_arguments()
+        
+        # Rich is only loaded once there is something to display, so
+        # argument errors and --help exit without importing it
+        console = get_console()
         
         # Display welcome message
         console.print("[bold green]Welcome to Sik Sort![/bold green]")
@@ -65,14 +71,9 @@ def main() -> None:
                 console.print("[yellow]Operation cancelled for safety.[/yellow]")
                 return
         
-        # Setup category folders
-        console.print("[cyan]Setting up category folders...[/cyan]")
-        setup_category_folders(source_path, dry_run=dry_run)
-        
         # Scan directory to count files
         console.print("[cyan]Scanning directory...[/cyan]")
-        exclude_dirs = {'img', 'vid', 'arc', 'msk'}
-        files = scan_directory(source_path, exclude_dirs)
+        files = scan_directory(source_path, EXCLUDE_DIRS, recursive=recursive)
         
         if not files:
             console.print("[yellow]No files found to sort.[/yellow]")
@@ -86,7 +87,12 @@ def main() -> None:
         console.print("[cyan]Sorting files...[/cyan]")
         
         # Use ASCII progress bar
-        stats = sort_files(source_path, dry_run=dry_run, ascii_progress_callback=display_ascii_progress)
+        stats = sort_files(
+            source_path,
+            dry_run=dry_run,
+            ascii_progress_callback=display_ascii_progress,
+            recursive=recursive
+        )
         
         # Print newline after progress bar completes
         print()
@@ -97,14 +103,15 @@ def main() -> None:
         # Display statistics
         display_statistics(stats, dry_run=dry_run)
         
-        # Skip cleanup prompt in dry-run mode
-        if not dry_run:
+        # Skip cleanup prompt in dry-run mode, and in non-recursive mode,
+        # which leaves subdirectories untouched
+        if not dry_run and not recursive:
+            console.print("[yellow]Skipping cleanup of subdirectories (--no-recursive).[/yellow]")
+        elif not dry_run:
             # Prompt for cleanup
             if confirm_cleanup():
                 console.print("[cyan]Cleaning up empty directories...[/cyan]")
-                preserve_dirs = {'img', 'vid', 'arc', 'msk'}
-                empty_dirs = find_empty_directories(source_path, preserve_dirs)
-                removed_count = remove_empty_directories(empty_dirs)
+                removed_count = clean_empty_directories(source_path, EXCLUDE_DIRS)
                 console.print(f"[green]Removed {removed_count} empty directories.[/green]")
             else:
                 console.print("[yellow]Skipping cleanup.[/yellow]")
@@ -121,6 +128,7 @@ def main() -> None:
         console.print("[bold green]Done![/bold green]")
         
     except KeyboardInterrupt:
+        console = get_console()
         console.print()
         console.print("[yellow]Operation cancelled by user.[/yellow]")
     except Exception as e:
@@ -1,12 +1,135 @@
 """Operation logger module for real-time console logging during file operations."""
 
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from rich.console import Console
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 from .classifier import FileCategory
 
+# Rich is imported lazily so that importing the sorter, e.g. for --help,
+# doesn't pay its import cost
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
 
-# Create a global console instance for logging
-console = Console()
+
+# Console used for logging, created on first use by _get_console
+console: Optional['Console'] = None
+
+# Lines waiting to be printed while batched logging is active (None otherwise)
+_log_buffer: Optional[list[Union[str, 'Text']]] = None
+
+# Buffered lines are printed once this many are pending, or by a timer this
+# many seconds after the first of them was buffered
+_LOG_BATCH_SIZE = 256
+_LOG_BATCH_INTERVAL = 0.1
+
+# Guards the buffer, which the flush timer and sorting threads share, and
+# console output; other writers to the terminal, such as the ASCII progress
+# bar, take it too so a timed flush never lands inside one of their writes
+output_lock = threading.Lock()
+_flush_timer: Optional[threading.Timer] = None
+
+
+# Category-specific colors
+_CATEGORY_COLORS = {
+    FileCategory.IMAGE: "green",
+    FileCategory.VIDEO: "blue",
+    FileCategory.ARCHIVE: "yellow",
+    FileCategory.MISC: "white"
+}
+
+# Text before and after the filename for each (category, dry_run) pair, in
+# the format: [CATEGORY] filename → category_folder
+_FILE_OPERATION_TEMPLATES = {
+    (category, dry_run): (
+        f"{'[DRY RUN] ' if dry_run else ''}"
+        f"[{_CATEGORY_COLORS[category]}][{category.value.upper()}][/{_CATEGORY_COLORS[category]}] ",
+        f" → {category.value}/"
+    )
+    for category in FileCategory
+    for dry_run in (False, True)
+}
+
+
+# Styled labels for conflict and error lines; these lines are built as Text
+# so the filenames and messages in them are never parsed as markup
+_CONFLICT_LABEL = ("[CONFLICT]", "bold yellow")
+_ERROR_LABEL = ("[ERROR]", "bold red")
+
+
+def _get_console() -> 'Console':
+    """Return the logging console, creating it on first use.
+    
+    Returns:
+        Console: Rich console that log lines are printed to
+    """
+    global console
+    if console is None:
+        from rich.console import Console
+        console = Console()
+    return console
+
+
+@contextmanager
+def batched_logging() -> Iterator[None]:
+    """Buffers log lines and prints them in batches while active.
+    
+    Printing one line per file costs a console write per file; batching
+    joins many lines into a single print. A timer prints buffered lines
+    within _LOG_BATCH_INTERVAL seconds even while a slow move blocks the
+    sorting loop, and all pending lines are printed when the block exits.
+    Nested uses share the outermost buffer.
+    """
+    global _log_buffer
+    if _log_buffer is not None:
+        yield
+        return
+    
+    _log_buffer = []
+    try:
+        yield
+    finally:
+        flush_log_buffer()
+        _log_buffer = None
+
+
+def flush_log_buffer() -> None:
+    """Prints any log lines buffered by batched_logging."""
+    with output_lock:
+        _flush_locked()
+
+
+def _flush_locked() -> None:
+    """Prints buffered log lines; the caller must hold output_lock."""
+    global _flush_timer
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+    if _log_buffer:
+        _get_console().print(*_log_buffer, sep="\n", highlight=False)
+        _log_buffer.clear()
+
+
+def _emit(line: Union[str, 'Text']) -> None:
+    """Prints a log line, or buffers it while batched logging is active.
+    
+    Args:
+        line: Rich markup string or pre-styled Text to print
+    """
+    global _flush_timer
+    if _log_buffer is None:
+        _get_console().print(line, highlight=False)
+        return
+    
+    with output_lock:
+        _log_buffer.append(line)
+        if len(_log_buffer) >= _LOG_BATCH_SIZE:
+            _flush_locked()
+        elif _flush_timer is None:
+            _flush_timer = threading.Timer(_LOG_BATCH_INTERVAL, flush_log_buffer)
+            _flush_timer.daemon = True
+            _flush_timer.start()
 
 
 def log_file_operation(filename: str, category: FileCategory, dry_run: bool = False) -> None:
@@ -17,22 +140,8 @@ def log_file_operation(filename: str, category: FileCategory, dry_run: bool = Fa
         category: Destination category for the file
         dry_run: Whether this is a dry-run simulation
     """
-    # Define category-specific colors
-    category_colors = {
-        FileCategory.IMAGE: "green",
-        FileCategory.VIDEO: "blue",
-        FileCategory.ARCHIVE: "yellow",
-        FileCategory.MISC: "white"
-    }
-    
-    color = category_colors.get(category, "white")
-    prefix = "[DRY RUN] " if dry_run else ""
-    
-    # Format: [CATEGORY] filename → category_folder
-    console.print(
-        f"{prefix}[{color}][{category.value.upper()}][/{color}] {filename} → {category.value}/",
-        highlight=False
-    )
+    head, tail = _FILE_OPERATION_TEMPLATES[category, bool(dry_run)]
+    _emit(head + filename + tail)
 
 
 def log_scan_complete(file_count: int) -> None:
@@ -41,10 +150,7 @@ def log_scan_complete(file_count: int) -> None:
     Args:
         file_count: Total number of files found during scan
     """
-    console.print(
-        f"\n[bold cyan]Scan complete:[/bold cyan] Found {file_count} file(s) to process\n",
-        highlight=False
-    )
+    _emit(f"\n[bold cyan]Scan complete:[/bold cyan] Found {file_count} file(s) to process\n")
 
 
 def log_conflict_resolution(original_name: str, new_name: str) -> None:
@@ -54,10 +160,8 @@ def log_conflict_resolution(original_name: str, new_name: str) -> None:
         original_name: Original filename that had a conflict
         new_name: New unique filename after resolution
     """
-    console.print(
-        f"[bold yellow][CONFLICT][/bold yellow] {original_name} → {new_name}",
-        highlight=False
-    )
+    from rich.text import Text
+    _emit(Text.assemble(_CONFLICT_LABEL, f" {original_name} → {new_name}"))
 
 
 def log_error(filename: str, error_message: str) -> None:
@@ -67,7 +171,5 @@ def log_error(filename: str, error_message: str) -> None:
         filename: Name of the file that caused the error
         error_message: Description of the error
     """
-    console.print(
-        f"[bold red][ERROR][/bold red] {filename}: {error_message}",
-        highlight=False
-    )
+    from rich.text import Text
+    _emit(Text.assemble(_ERROR_LABEL, f" {filename}: {error_message}"))
@@ -1,5 +1,6 @@
 """Safety checks module to prevent sorting development directories."""
 
+import os
 from pathlib import Path
 from typing import List, Tuple
 
@@ -10,23 +11,38 @@ def check_python_package(path: Path) -> Tuple[bool, str]:
     Args:
         path: Directory to check
         
+    Returns:
+        Tuple of (is_package, warning_message)
+    """
+    return _check_python_package(path, *_list_entries(path))
+
+
+def _check_python_package(path: Path, names: List[str], dir_names: List[str]) -> Tuple[bool, str]:
+    """Check a directory listing for Python package files.
+    
+    Args:
+        path: Directory that was listed
+        names: Names of all entries in the directory
+        dir_names: Names of the subdirectories
+        
     Returns:
         Tuple of (is_package, warning_message)
     """
     package_indicators = ['setup.py', 'pyproject.toml']
     
+    # Compare names case-insensitively, as Windows and macOS filesystems do,
+    # so e.g. Setup.py is found as well
+    folded_names = {name.lower() for name in names}
+    
     # Check for package files in root
     for indicator in package_indicators:
-        if (path / indicator).exists():
+        if indicator in folded_names:
             return True, f"Directory contains {indicator} - appears to be a Python package"
     
     # Check for __init__.py in subdirectories (indicates package structure)
-    try:
-        for subdir in path.iterdir():
-            if subdir.is_dir() and (subdir / '__init__.py').exists():
-                return True, f"Directory contains Python package structure (found {subdir.name}/__init__.py)"
-    except PermissionError:
-        pass
+    for name in dir_names:
+        if os.path.exists(os.path.join(path, name, '__init__.py')):
+            return True, f"Directory contains Python package structure (found {name}/__init__.py)"
     
     return False, ""
 
@@ -40,9 +56,20 @@ def check_git_repository(path: Path) -> Tuple[bool, str]:
     Returns:
         Tuple of (has_uncommitted_changes, warning_message)
     """
-    git_dir = path / '.git'
+    return _check_git_repository(_list_entries(path)[0])
+
+
+def _check_git_repository(names: List[str]) -> Tuple[bool, str]:
+    """Check a directory listing for a .git entry.
     
-    if not git_dir.exists():
+    Args:
+        names: Names of all entries in the directory
+        
+    Returns:
+        Tuple of (is_repository, warning_message)
+    """
+    # Compare case-insensitively, as Windows and macOS filesystems do
+    if not any(name.lower() == '.git' for name in names):
         return False, ""
     
     # If .git exists, it's a repository
@@ -57,19 +84,25 @@ def check_dev_folders(path: Path) -> Tuple[bool, str]:
     Args:
         path: Directory to check
         
+    Returns:
+        Tuple of (has_dev_folders, warning_message)
+    """
+    return _check_dev_folders(_list_entries(path)[1])
+
+
+def _check_dev_folders(dir_names: List[str]) -> Tuple[bool, str]:
+    """Check a directory listing for common development folders.
+    
+    Args:
+        dir_names: Names of the subdirectories
+        
     Returns:
         Tuple of (has_dev_folders, warning_message)
     """
     dev_folders = {'.git', '.venv', 'venv', 'node_modules', '.env', '__pycache__', 
                    '.pytest_cache', '.hypothesis', 'dist', 'build', '.tox'}
     
-    found_folders = []
-    try:
-        for item in path.iterdir():
-            if item.is_dir() and item.name in dev_folders:
-                found_folders.append(item.name)
-    except PermissionError:
-        pass
+    found_folders = [name for name in dir_names if name in dev_folders]
     
     if found_folders:
         folders_str = ", ".join(found_folders)
@@ -78,9 +111,37 @@ def check_dev_folders(path: Path) -> Tuple[bool, str]:
     return False, ""
 
 
+def _list_entries(path: Path) -> Tuple[List[str], List[str]]:
+    """List a directory once for the safety checks.
+    
+    Args:
+        path: Directory to list
+        
+    Returns:
+        Tuple of (entry_names, directory_names) in listing order, both
+        empty if the directory cannot be read
+    """
+    names = []
+    dir_names = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                names.append(entry.name)
+                try:
+                    if entry.is_dir():
+                        dir_names.append(entry.name)
+                except OSError:
+                    continue
+    except PermissionError:
+        return [], []
+    return names, dir_names
+
+
 def run_safety_checks(path: Path) -> List[str]:
     """Run all safety checks on a directory.
     
+    The directory is listed once and the listing is shared by every check.
+    
     Args:
         path: Directory to check
         
@@ -88,19 +149,20 @@ def run_safety_checks(path: Path) -> List[str]:
         List of warning messages (empty if all checks pass)
     """
     warnings = []
+    names, dir_names = _list_entries(path)
     
     # Check for Python package
-    is_package, msg = check_python_package(path)
+    is_package, msg = _check_python_package(path, names, dir_names)
     if is_package:
         warnings.append(msg)
     
     # Check for Git repository
-    is_git, msg = check_git_repository(path)
+    is_git, msg = _check_git_repository(names)
     if is_git:
         warnings.append(msg)
     
     # Check for dev folders
-    has_dev, msg = check_dev_folders(path)
+    has_dev, msg = _check_dev_folders(dir_names)
     if has_dev:
         warnings.append(msg)
     
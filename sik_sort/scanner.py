@@ -1,35 +1,277 @@
 """Directory scanner module for recursive file traversal."""
 
+import os
+import queue
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from sik_sort.filters import FilterConfig, apply_filters
+from typing import Iterator
+from sik_sort.filters import FilterConfig, apply_filters, compile_filter, file_suffix
 
 
-def scan_directory(path: Path, exclude_dirs: set[str]) -> list[Path]:
+# Levels a parallel scanning worker lists on its own before handing deeper
+# subdirectories back to the shared queue
+_WORKER_DEPTH = 2
+
+
+@dataclass(slots=True)
+class FileRecord:
+    """A scanned file with the attributes used by filtering and duplicate detection.
+    
+    The attributes are captured once from the directory entry during the scan,
+    so later stages don't need to stat the file or parse its name again.
+    
+    Attributes:
+        path: Path to the file
+        name: File name (e.g., "photo.JPG")
+        suffix: File extension including the dot (e.g., ".JPG"), or ""
+        size: File size in bytes
+    """
+    path: Path
+    name: str
+    suffix: str
+    size: int
+
+
+def scan_directory(path: Path, exclude_dirs: set[str], recursive: bool = True) -> list[Path]:
     """Returns list of all files to process.
     
+    Directories below path whose names are in exclude_dirs are skipped along
+    with everything inside them. Symbolic links to directories are not
+    followed.
+    
     Args:
         path: Root directory to scan
         exclude_dirs: Set of directory names to exclude from scanning
+        recursive: If False, only files directly in path are returned
         
     Returns:
         list[Path]: List of file paths found
     """
-    files = []
+    return [Path(entry.path) for entry in _walk_files(os.fspath(path), exclude_dirs, recursive)]
+
+
+def iter_scan_directory(path: Path, exclude_dirs: set[str], recursive: bool = True) -> Iterator[os.DirEntry]:
+    """Yields directory entries for all files to process as they are found.
+    
+    Streams the same files, in the same order, as scan_directory without
+    building the whole list first. Entries carry their name and path, and
+    cache their stat result once it is requested.
+    
+    Args:
+        path: Root directory to scan
+        exclude_dirs: Set of directory names to exclude from scanning
+        recursive: If False, only files directly in path are yielded
+        
+    Yields:
+        os.DirEntry: Entry for each file found
+    """
+    return _walk_files(os.fspath(path), exclude_dirs, recursive)
+
+
+def scan_file_records(path: Path, exclude_dirs: set[str]) -> list[FileRecord]:
+    """Returns records for all files to process.
+    
+    Directories below path whose names are in exclude_dirs are skipped along
+    with everything inside them. Symbolic links to directories are not
+    followed.
+    
+    Args:
+        path: Root directory to scan
+        exclude_dirs: Set of directory names to exclude from scanning
+        
+    Returns:
+        list[FileRecord]: Records for the files found
+    """
+    records = []
     
-    for item in path.rglob('*'):
-        # Skip if any parent directory is excluded
-        if any(is_excluded_directory(parent, exclude_dirs) for parent in item.parents):
+    for entry in _walk_files(os.fspath(path), exclude_dirs):
+        try:
+            size = entry.stat().st_size
+        except OSError:
+            # Skip files that disappeared or cannot be accessed
             continue
+        name = entry.name
+        records.append(FileRecord(Path(entry.path), name, file_suffix(name), size))
+    
+    return records
+
+
+def _walk_files(root: str, exclude_dirs: set[str], recursive: bool = True) -> Iterator[os.DirEntry]:
+    """Yields directory entries for all files below root.
+    
+    Each directory's files are yielded before descending into its
+    subdirectories, in the order scandir returns them. Each directory is
+    listed in full before its first file is yielded. Excluded directories
+    are skipped without being opened, and the file type comes from the
+    directory listing, so most entries need no stat call.
+    
+    Args:
+        root: Root directory to walk
+        exclude_dirs: Set of directory names to skip
+        recursive: If False, only the files directly in root are yielded
         
-        # Skip if the item itself is an excluded directory
-        if item.is_dir() and is_excluded_directory(item, exclude_dirs):
+    Yields:
+        os.DirEntry: Entry for each file found
+    """
+    # Callers may pass any collection; name checks below need O(1) lookups
+    exclude_dirs = frozenset(exclude_dirs)
+    pending = [root]
+    
+    while pending:
+        current = pending.pop()
+        
+        # Read the whole listing before yielding any entry: callers move
+        # files out of (and create folders in) the directory being walked,
+        # and readdir results are unspecified once a directory changes
+        # during iteration, which can skip entries on some filesystems
+        try:
+            with os.scandir(current) as listing:
+                entries = list(listing)
+        except OSError:
+            # Skip directories that cannot be read
             continue
-            
-        # Add files only
-        if item.is_file():
-            files.append(item)
+        
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in exclude_dirs:
+                        subdirs.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+            except OSError:
+                continue
+        
+        # Visit subdirectories in listing order
+        if recursive:
+            pending.extend(reversed(subdirs))
+
+
+def parallel_scan(path: Path, exclude_dirs: set[str], workers: int = 8) -> list[Path]:
+    """Returns list of all files to process, listing directories in parallel.
+    
+    Gives the same result, in the same order, as scan_directory, but
+    overlaps directory reads on a thread pool. This mostly helps on network
+    and other high-latency filesystems.
+    
+    Args:
+        path: Root directory to scan
+        exclude_dirs: Set of directory names to exclude from scanning
+        workers: Number of scanning threads
+        
+    Returns:
+        list[Path]: List of file paths found
+    """
+    root = os.fspath(path)
+    listings = _list_directories_parallel([root], exclude_dirs, workers)
+    return [Path(file_path) for file_path in _files_in_order(root, listings)]
+
+
+def _list_directories_parallel(
+    roots: list[str],
+    exclude_dirs: set[str],
+    workers: int
+) -> dict[str, tuple[list[str], list[str]]]:
+    """Lists every directory below the roots on a pool of worker threads.
+    
+    Workers take directories from a shared queue and list them, and the
+    subdirectories below them up to _WORKER_DEPTH levels deep, themselves;
+    deeper subdirectories go back on the queue for any idle worker.
+    scandir releases the GIL, so directory reads overlap.
+    
+    Args:
+        roots: Root directories to walk
+        exclude_dirs: Set of directory names to skip
+        workers: Number of scanning threads
+        
+    Returns:
+        dict: Mapping of each directory listed to its (files, subdirectories)
+    """
+    listings: dict[str, tuple[list[str], list[str]]] = {}
+    exclude_dirs = frozenset(exclude_dirs)
+    work: queue.Queue = queue.Queue()
+    
+    def list_tree(directory: str, depth: int) -> None:
+        _, files, subdirs = _list_directory(directory, exclude_dirs)
+        listings[directory] = (files, subdirs)
+        for subdir in subdirs:
+            if depth == 0:
+                work.put(subdir)
+            else:
+                list_tree(subdir, depth - 1)
+    
+    def worker() -> None:
+        while True:
+            directory = work.get()
+            if directory is None:
+                return
+            try:
+                list_tree(directory, _WORKER_DEPTH)
+            finally:
+                work.task_done()
+    
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    
+    for root in roots:
+        work.put(root)
+    work.join()
+    
+    for _ in threads:
+        work.put(None)
+    for thread in threads:
+        thread.join()
+    
+    return listings
+
+
+def _list_directory(directory: str, exclude_dirs: set[str]) -> tuple[str, list[str], list[str]]:
+    """Lists the files and non-excluded subdirectories of one directory.
+    
+    Args:
+        directory: Directory to list
+        exclude_dirs: Set of directory names to skip
+        
+    Returns:
+        tuple: (directory, file paths, subdirectory paths), both lists empty
+            if the directory cannot be read
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in exclude_dirs:
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        # Skip directories that cannot be read
+        return directory, [], []
+    return directory, files, subdirs
+
+
+def _files_in_order(root: str, listings: dict[str, tuple[list[str], list[str]]]) -> Iterator[str]:
+    """Yields the listed files below root in scan_directory order.
     
-    return files
+    Args:
+        root: Root directory
+        listings: Mapping of directories to their (files, subdirectories)
+        
+    Yields:
+        str: Path of each file
+    """
+    pending = [root]
+    while pending:
+        files, subdirs = listings.get(pending.pop(), ((), ()))
+        yield from files
+        pending.extend(reversed(subdirs))
 
 
 def is_excluded_directory(path: Path, exclude_dirs: set[str]) -> bool:
@@ -45,13 +287,19 @@ def is_excluded_directory(path: Path, exclude_dirs: set[str]) -> bool:
     return path.name in exclude_dirs
 
 
-def scan_with_filters(path: Path, exclude_dirs: set[str], filters: FilterConfig) -> tuple[list[Path], int]:
+def scan_with_filters(
+    path: Path,
+    exclude_dirs: set[str],
+    filters: FilterConfig,
+    recursive: bool = True
+) -> tuple[list[Path], int]:
     """Scans directory and applies filters to the file list.
     
     Args:
         path: Root directory to scan
         exclude_dirs: Set of directory names to exclude from scanning
         filters: Filter configuration to apply
+        recursive: If False, only files directly in path are scanned
         
     Returns:
         tuple: (filtered_files, excluded_count)
@@ -59,7 +307,7 @@ def scan_with_filters(path: Path, exclude_dirs: set[str], filters: FilterConfig)
             - excluded_count: Number of files excluded by filters
     """
     # First scan all files
-    all_files = scan_directory(path, exclude_dirs)
+    all_files = scan_directory(path, exclude_dirs, recursive)
     
     # Apply filters to the scanned files
     filtered_files, excluded_count = apply_filters(all_files, filters)
@@ -67,21 +315,68 @@ def scan_with_filters(path: Path, exclude_dirs: set[str], filters: FilterConfig)
     return filtered_files, excluded_count
 
 
-def scan_multiple_directories(paths: list[Path], exclude_dirs: set[str], filters: FilterConfig) -> dict[Path, list[Path]]:
+def scan_multiple_directories(
+    paths: list[Path],
+    exclude_dirs: set[str],
+    filters: FilterConfig,
+    workers: int = 1
+) -> dict[Path, list[Path]]:
     """Scans multiple directories and applies filters to each.
     
     Args:
         paths: List of root directories to scan
         exclude_dirs: Set of directory names to exclude from scanning
         filters: Filter configuration to apply
+        workers: Number of scanning threads. With more than one, all roots
+            are listed on one shared pool, which mostly helps on network
+            and other high-latency filesystems; the default scans each root
+            serially, which is fastest on local disks.
         
     Returns:
         dict: Dictionary mapping each source path to its filtered file list
     """
     results = {}
     
-    for path in paths:
-        filtered_files, _ = scan_with_filters(path, exclude_dirs, filters)
+    if workers <= 1:
+        for path in paths:
+            filtered_files, _ = scan_with_filters(path, exclude_dirs, filters)
+            results[path] = filtered_files
+        return results
+    
+    # List all trees on one pool so small trees don't leave threads idle
+    roots = [os.fspath(path) for path in paths]
+    listings = _list_directories_parallel(roots, exclude_dirs, workers)
+    
+    for path, root in zip(paths, roots):
+        files = [Path(file_path) for file_path in _files_in_order(root, listings)]
+        filtered_files, _ = apply_filters(files, filters)
         results[path] = filtered_files
     
     return results
+
+
+def iter_scan_multiple(
+    paths: list[Path],
+    exclude_dirs: set[str],
+    filters: FilterConfig
+) -> Iterator[tuple[Path, Path]]:
+    """Yields the filtered files of several directories as they are found.
+    
+    Streams the same files, in the same order, as scan_multiple_directories
+    without holding every root's file list in memory, so processing can
+    start before later roots have been scanned.
+    
+    Args:
+        paths: List of root directories to scan
+        exclude_dirs: Set of directory names to exclude from scanning
+        filters: Filter configuration to apply
+        
+    Yields:
+        tuple: (root, file_path) for each file that passes the filters
+    """
+    passes = compile_filter(filters)
+    
+    for path in paths:
+        for entry in _walk_files(os.fspath(path), exclude_dirs):
+            if passes is None or passes(entry.name):
+                yield path, Path(entry.path)
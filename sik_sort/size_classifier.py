@@ -1,8 +1,14 @@
 """Size classifier module for categorizing files by size."""
 
+import os
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import Union
+
+
+# Units used by format_size, each 1024 times the previous
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 class SizeCategory(Enum):
@@ -24,11 +30,15 @@ class SizeThresholds:
     medium_max: int = 104_857_600  # 100 MB
 
 
-def classify_by_size(file_path: Path, thresholds: SizeThresholds = None) -> SizeCategory:
+def classify_by_size(
+    file_path: Union[Path, os.DirEntry, os.stat_result],
+    thresholds: SizeThresholds = None
+) -> SizeCategory:
     """Categorizes a file by its size.
     
     Args:
-        file_path: Path to the file to classify
+        file_path: Path or directory entry of the file to classify, or a stat
+            result already taken for it
         thresholds: Custom size thresholds (uses defaults if None)
         
     Returns:
@@ -47,15 +57,21 @@ def classify_by_size(file_path: Path, thresholds: SizeThresholds = None) -> Size
         return SizeCategory.LARGE
 
 
-def get_file_size(file_path: Path) -> int:
+def get_file_size(file_path: Union[Path, os.DirEntry, os.stat_result]) -> int:
     """Retrieves the size of a file in bytes.
     
+    A stat result is used as is, and a directory entry reuses its cached stat
+    result, so callers that already have either don't cause another stat call.
+    
     Args:
-        file_path: Path to the file
+        file_path: Path or directory entry of the file, or a stat result
+            already taken for it
         
     Returns:
         int: File size in bytes
     """
+    if isinstance(file_path, os.stat_result):
+        return file_path.st_size
     return file_path.stat().st_size
 
 
@@ -68,18 +84,14 @@ def format_size(bytes: int) -> str:
     Returns:
         str: Human-readable size string (e.g., "1.50 MB")
     """
-    if bytes < 0:
+    if bytes <= 0:
         return "0 B"
     
-    units = ['B', 'KB', 'MB', 'GB', 'TB']
-    size = float(bytes)
-    unit_index = 0
-    
-    while size >= 1024.0 and unit_index < len(units) - 1:
-        size /= 1024.0
-        unit_index += 1
+    # Each unit is 2**10 times the previous, so the bit length of the whole
+    # byte count picks the unit; int() keeps float sizes working too
+    whole_bytes = int(bytes)
+    unit_index = min(max(whole_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
     
     if unit_index == 0:
-        return f"{int(size)} {units[unit_index]}"
-    else:
-        return f"{size:.2f} {units[unit_index]}"
+        return f"{whole_bytes} B"
+    return f"{bytes / (1 << (10 * unit_index)):.2f} {_SIZE_UNITS[unit_index]}"
@@ -1,26 +1,41 @@
 """File sorter module for coordinating the sorting process."""
 
+from array import array
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Optional, Union
+from typing import Callable, Iterator, Optional, Union
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+import errno
+import os
 import shutil
-from .classifier import FileCategory, classify_file
-from .scanner import scan_directory
-from .operation_logger import log_file_operation
-from .size_classifier import SizeCategory, SizeThresholds, classify_by_size
+import sys
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from .classifier import FileCategory, classify_name
+from .scanner import iter_scan_directory, scan_file_records
+from .operation_logger import batched_logging, log_file_operation
+from .size_classifier import SizeCategory, SizeThresholds, classify_by_size, format_size
 from .date_classifier import classify_by_date, DateMode
 from .duplicates import find_duplicates, calculate_space_saved
+from .hash_cache import HashCache
+
+
+# Folders the sorters create, which are excluded when scanning for files
+_CATEGORY_EXCLUDE_DIRS = frozenset(category.value for category in FileCategory)
+_SIZE_EXCLUDE_DIRS = _CATEGORY_EXCLUDE_DIRS | frozenset(category.value for category in SizeCategory)
+_DUPLICATE_EXCLUDE_DIRS = _CATEGORY_EXCLUDE_DIRS | frozenset({'duplicates'})
 
 
 @dataclass
 class SortingStats:
     """Statistics for file sorting operations."""
     total_files: int = 0
-    img_count: int = 0
-    vid_count: int = 0
-    arc_count: int = 0
-    msk_count: int = 0
+    # Number of files sorted into each category
+    counts: dict = field(default_factory=lambda: dict.fromkeys(FileCategory, 0))
     
     def increment(self, category: FileCategory) -> None:
         """Increment counter for given category.
@@ -29,25 +44,151 @@ class SortingStats:
             category: The file category to increment
         """
         self.total_files += 1
-        if category == FileCategory.IMAGE:
-            self.img_count += 1
-        elif category == FileCategory.VIDEO:
-            self.vid_count += 1
-        elif category == FileCategory.ARCHIVE:
-            self.arc_count += 1
-        elif category == FileCategory.MISC:
-            self.msk_count += 1
+        self.counts[category] += 1
+    
+    @property
+    def img_count(self) -> int:
+        return self.counts[FileCategory.IMAGE]
+    
+    @property
+    def vid_count(self) -> int:
+        return self.counts[FileCategory.VIDEO]
+    
+    @property
+    def arc_count(self) -> int:
+        return self.counts[FileCategory.ARCHIVE]
+    
+    @property
+    def msk_count(self) -> int:
+        return self.counts[FileCategory.MISC]
 
 
-@dataclass
+@dataclass(slots=True)
 class FileOperation:
-    """Record of a file operation for undo functionality."""
+    """Record of a file operation for undo functionality.
+    
+    The timestamp is stored as nanoseconds since the epoch from
+    time.time_ns(), which is much cheaper to take per file than a datetime;
+    use as_datetime() to display it.
+    """
     source: Path
     destination: Path
-    timestamp: datetime
+    timestamp: int
     category: str
     size: int
     hash: Optional[str] = None
+    
+    def as_datetime(self) -> datetime:
+        """Returns the operation timestamp as a local datetime.
+        
+        Returns:
+            datetime: Time the operation was recorded
+        """
+        return datetime.fromtimestamp(self.timestamp / 1_000_000_000)
+
+
+class OperationLog:
+    """Columnar store of file operation records.
+    
+    Operations are kept as parallel columns instead of one object per file:
+    paths and categories as strings, timestamps and sizes in typed arrays.
+    Indexing and iteration rebuild FileOperation records on demand, so the
+    log can be used like a list of operations.
+    
+    Attributes:
+        sources: Source path of each operation
+        destinations: Destination path of each operation
+        timestamps: Nanosecond timestamp of each operation
+        categories: Category string of each operation, interned so equal
+            categories share one string object
+        sizes: File size in bytes of each operation
+        hashes: File hash of each operation, or None
+    """
+    
+    __slots__ = ('sources', 'destinations', 'timestamps', 'categories', 'sizes', 'hashes')
+    
+    def __init__(self):
+        self.sources: list[str] = []
+        self.destinations: list[str] = []
+        self.timestamps = array('q')
+        self.categories: list[str] = []
+        self.sizes = array('q')
+        self.hashes: list[Optional[str]] = []
+    
+    def record(
+        self,
+        source: Union[Path, str],
+        destination: Union[Path, str],
+        timestamp: int,
+        category: str,
+        size: int,
+        hash: Optional[str] = None
+    ) -> None:
+        """Records one operation without building a FileOperation.
+        
+        Args:
+            source: Source file path
+            destination: Destination file path
+            timestamp: Nanoseconds since the epoch (from time.time_ns())
+            category: Category string (e.g., "img" or "small/img")
+            size: File size in bytes
+            hash: Optional file hash
+        """
+        self.sources.append(os.fspath(source))
+        self.destinations.append(os.fspath(destination))
+        self.timestamps.append(timestamp)
+        self.categories.append(sys.intern(category))
+        self.sizes.append(size)
+        self.hashes.append(hash)
+    
+    def append(self, operation: FileOperation) -> None:
+        """Records a FileOperation.
+        
+        Args:
+            operation: Operation to record
+        """
+        self.record(
+            operation.source,
+            operation.destination,
+            operation.timestamp,
+            operation.category,
+            operation.size,
+            operation.hash
+        )
+    
+    def __len__(self) -> int:
+        return len(self.sources)
+    
+    def __getitem__(self, index: int) -> FileOperation:
+        return FileOperation(
+            source=Path(self.sources[index]),
+            destination=Path(self.destinations[index]),
+            timestamp=self.timestamps[index],
+            category=self.categories[index],
+            size=self.sizes[index],
+            hash=self.hashes[index]
+        )
+    
+    def __iter__(self) -> Iterator[FileOperation]:
+        for index in range(len(self.sources)):
+            yield self[index]
+
+
+@lru_cache(maxsize=1024)
+def _category_path(folder: str, category: FileCategory) -> str:
+    """Returns the "folder/category" string recorded for nested sort folders.
+    
+    There are only a few distinct combinations per run, so each is built
+    and interned once and then shared by every operation that uses it.
+    
+    Args:
+        folder: Outer folder name (e.g., "small" or "2024-01")
+        category: File category of the inner folder
+        
+    Returns:
+        str: Interned category path (e.g., "small/img")
+    """
+    return sys.intern(f"{folder}/{category.value}")
 
 
 @dataclass
@@ -55,18 +196,17 @@ class EnhancedSortingStats:
     """Enhanced statistics for file sorting operations with advanced features."""
     # Existing fields
     total_files: int = 0
-    img_count: int = 0
-    vid_count: int = 0
-    arc_count: int = 0
-    msk_count: int = 0
+    # Number of files sorted into each category
+    counts: dict = field(default_factory=lambda: dict.fromkeys(FileCategory, 0))
     
     # New fields for advanced features
     excluded_by_filters: int = 0
     duplicates_found: int = 0
     space_saved: int = 0
-    size_categories: dict = field(default_factory=dict)
-    date_categories: dict = field(default_factory=dict)
-    operations: list = field(default_factory=list)
+    # Files per size or date folder; missing keys count as 0
+    size_categories: Counter = field(default_factory=Counter)
+    date_categories: Counter = field(default_factory=Counter)
+    operations: OperationLog = field(default_factory=OperationLog)
     errors: list = field(default_factory=list)
     
     def increment(self, category: FileCategory) -> None:
@@ -76,43 +216,29 @@ class EnhancedSortingStats:
             category: The file category to increment
         """
         self.total_files += 1
-        if category == FileCategory.IMAGE:
-            self.img_count += 1
-        elif category == FileCategory.VIDEO:
-            self.vid_count += 1
-        elif category == FileCategory.ARCHIVE:
-            self.arc_count += 1
-        elif category == FileCategory.MISC:
-            self.msk_count += 1
-    
-    @staticmethod
-    def format_size(size_bytes: int) -> str:
-        """Format bytes to human-readable string.
-        
-        Args:
-            size_bytes: Size in bytes
-            
-        Returns:
-            str: Human-readable size string (e.g., "1.50 MB")
-        """
-        if size_bytes < 0:
-            return "0 B"
-        
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-        size = float(size_bytes)
-        unit_index = 0
-        
-        while size >= 1024.0 and unit_index < len(units) - 1:
-            size /= 1024.0
-            unit_index += 1
-        
-        if unit_index == 0:
-            return f"{int(size)} {units[unit_index]}"
-        else:
-            return f"{size:.2f} {units[unit_index]}"
+        self.counts[category] += 1
+    
+    @property
+    def img_count(self) -> int:
+        return self.counts[FileCategory.IMAGE]
+    
+    @property
+    def vid_count(self) -> int:
+        return self.counts[FileCategory.VIDEO]
+    
+    @property
+    def arc_count(self) -> int:
+        return self.counts[FileCategory.ARCHIVE]
+    
+    @property
+    def msk_count(self) -> int:
+        return self.counts[FileCategory.MISC]
+    
+    # Shared with size_classifier so reports format sizes identically
+    format_size = staticmethod(format_size)
 
 
-def sort_files(source_path: Path, dry_run: bool = False, progress_callback: Callable = None, ascii_progress_callback: Callable = None, record_operations: bool = False) -> Union[SortingStats, EnhancedSortingStats]:
+def sort_files(source_path: Path, dry_run: bool = False, progress_callback: Callable = None, ascii_progress_callback: Callable = None, record_operations: bool = False, recursive: bool = True, max_workers: int = 1) -> Union[SortingStats, EnhancedSortingStats]:
     """Main sorting orchestrator.
     
     Args:
@@ -121,6 +247,11 @@ def sort_files(source_path: Path, dry_run: bool = False, progress_callback: Call
         progress_callback: Callback function for progress updates (Rich progress)
         ascii_progress_callback: Callback function for ASCII progress bar updates
         record_operations: If True, return EnhancedSortingStats with FileOperation records
+        recursive: If False, only sort files directly in source_path
+        max_workers: Number of threads moving files. With more than one,
+            moves overlap, which mostly helps on network and other
+            high-latency filesystems. Files that collide on a name may then
+            get their numbered names in a different order.
         
     Returns:
         SortingStats or EnhancedSortingStats: Statistics about the sorting operation
@@ -130,181 +261,428 @@ def sort_files(source_path: Path, dry_run: bool = False, progress_callback: Call
     else:
         stats = SortingStats()
     
-    # Define category folders to exclude from scanning
-    exclude_dirs = {'img', 'vid', 'arc', 'msk'}
+    # Category folders are excluded from scanning
+    exclude_dirs = _CATEGORY_EXCLUDE_DIRS
+    
+    # File names per destination folder, read on its first conflict
+    name_cache: dict[str, set[str]] = {}
+    
+    # Destination folders already created during this run
+    created_folders: set = set()
+    
+    # Stream files straight from the scan into classification and moving;
+    # the ASCII progress bar needs the total up front, so only then is the
+    # scan collected first
+    entries = iter_scan_directory(source_path, exclude_dirs, recursive=recursive)
+    total_files = 0
+    if ascii_progress_callback:
+        entries = list(entries)
+        total_files = len(entries)
     
-    # Scan for all files
-    files = scan_directory(source_path, exclude_dirs)
+    # Destination folder of each category as a plain string path; a folder
+    # is only created when its first file arrives
+    dest_folders = {category: os.path.join(source_path, category.value) for category in FileCategory}
     
-    # Process each file
-    for i, file_path in enumerate(files, 1):
+    # Bind the per-file stats updates once, outside the loop
+    increment = stats.increment
+    operations = stats.operations if record_operations else None
+    
+    # With several workers, moves into one folder are serialized by that
+    # folder's lock so conflict resolution never races, while moves into
+    # different folders overlap
+    folder_locks = None
+    if max_workers > 1:
+        folder_locks = {folder: threading.Lock() for folder in dest_folders.values()}
+    
+    def prepare(entry: os.DirEntry) -> tuple:
         # Classify the file
-        category = classify_file(file_path)
+        category = classify_name(entry.name)
         
         # Log the operation
-        log_file_operation(file_path.name, category, dry_run=dry_run)
+        log_file_operation(entry.name, category, dry_run=dry_run)
         
-        # Determine destination folder
-        dest_folder = source_path / category.value
-        if not dry_run:
-            dest_folder.mkdir(exist_ok=True)
+        # Record the size before the file is moved away
+        file_size = entry.stat().st_size if operations is not None else 0
         
-        # Move file with conflict resolution
-        dest_path = dest_folder / file_path.name
-        actual_dest = move_file_with_conflict_resolution(file_path, dest_path, dry_run=dry_run)
+        # Create the category folder on its first file
+        dest_folder = dest_folders[category]
+        if not dry_run and dest_folder not in created_folders:
+            os.makedirs(dest_folder, exist_ok=True)
+            created_folders.add(dest_folder)
         
-        # Record operation if requested
-        if record_operations and isinstance(stats, EnhancedSortingStats):
-            file_size = file_path.stat().st_size if file_path.exists() else 0
-            operation = FileOperation(
-                source=file_path,
-                destination=actual_dest,
-                timestamp=datetime.now(),
-                category=category.value,
-                size=file_size
-            )
-            stats.operations.append(operation)
+        return entry, category, file_size
+    
+    def move(prepared: tuple) -> tuple:
+        entry, category, file_size = prepared
+        dest_folder = dest_folders[category]
         
-        # Update statistics
-        stats.increment(category)
+        # Move file with conflict resolution
+        if folder_locks is None:
+            actual_dest = _move_to_folder(entry.path, dest_folder, entry.name, dry_run, name_cache)
+        else:
+            with folder_locks[dest_folder]:
+                actual_dest = _move_to_folder(entry.path, dest_folder, entry.name, dry_run, name_cache)
         
-        # Call progress callbacks
-        if progress_callback:
-            progress_callback()
+        return entry.path, category, file_size, actual_dest
+    
+    # Start the progress bar at 0%, which also begins a new progress session
+    if ascii_progress_callback and total_files:
+        ascii_progress_callback(0, total_files)
+    
+    # Process each file, printing the per-file log lines in batches. Files
+    # are classified and logged here in scan order; results come back in
+    # the same order, so stats and progress are updated as in a serial run.
+    # Only a few files per worker are prepared ahead of the moves, so the
+    # scan keeps streaming and log lines stay close to move progress.
+    with batched_logging(), ThreadPoolExecutor(max_workers=max_workers) as executor:
+        prepared_files = map(prepare, entries)
+        if max_workers > 1:
+            moved_files = _bounded_map(executor, move, prepared_files, max_workers * 2)
+        else:
+            moved_files = map(move, prepared_files)
         
-        if ascii_progress_callback:
-            ascii_progress_callback(i, len(files))
+        for i, (source, category, file_size, actual_dest) in enumerate(moved_files, 1):
+            # Record operation if requested
+            if operations is not None:
+                operations.record(source, actual_dest, time.time_ns(), category.value, file_size)
+            
+            # Update statistics
+            increment(category)
+            
+            # Call progress callbacks
+            if progress_callback:
+                progress_callback()
+            
+            if ascii_progress_callback:
+                ascii_progress_callback(i, total_files)
     
     return stats
 
 
-def move_file_with_conflict_resolution(src: Path, dest: Path, dry_run: bool = False) -> Path:
+def _bounded_map(executor: Executor, function: Callable, items: Iterator, max_in_flight: int) -> Iterator:
+    """Maps a function over items on an executor, keeping results in order.
+    
+    Unlike Executor.map, items are taken from the input only as results are
+    consumed, so at most max_in_flight items are taken ahead of the results
+    the caller has consumed.
+    
+    Args:
+        executor: Executor to run the calls on
+        function: Function to call with each item
+        items: Items to process, consumed lazily
+        max_in_flight: Maximum number of submitted calls without a consumed
+            result
+        
+    Yields:
+        Result of each call, in input order
+    """
+    items = iter(items)
+    in_flight = deque(executor.submit(function, item) for item in islice(items, max_in_flight))
+    
+    while in_flight:
+        yield in_flight.popleft().result()
+        
+        # Take the next item only once the caller has consumed a result
+        for item in islice(items, 1):
+            in_flight.append(executor.submit(function, item))
+
+
+def move_file_with_conflict_resolution(
+    src: Path,
+    dest: Path,
+    dry_run: bool = False,
+    name_cache: Optional[dict[str, set[str]]] = None
+) -> Path:
     """Moves file and handles naming conflicts.
     
     Args:
         src: Source file path
         dest: Destination file path
         dry_run: If True, simulate the move without actually moving files
+        name_cache: Optional cache of file names per destination folder, shared
+            across calls within one sorting run. A folder's names are read
+            once on its first conflict, so later conflicts are resolved
+            without probing the filesystem for each candidate name.
         
     Returns:
         Path: Actual destination path (may differ from dest if conflict occurred)
     """
+    return Path(_move_to_folder(os.fspath(src), os.fspath(dest.parent), dest.name, dry_run, name_cache))
+
+
+def _move_to_folder(
+    src: str,
+    folder: str,
+    name: str,
+    dry_run: bool,
+    name_cache: Optional[dict[str, set[str]]]
+) -> str:
+    """Moves a file into a folder under the given name, resolving conflicts.
+    
+    Works on plain string paths so the per-file sorting loops don't build
+    Path objects for every destination.
+    
+    Args:
+        src: Source file path
+        folder: Destination folder path
+        name: Desired file name in the destination folder
+        dry_run: If True, simulate the move without actually moving files
+        name_cache: Optional cache of file names per destination folder
+        
+    Returns:
+        str: Actual destination path (may differ if a conflict occurred)
+    """
+    dest = os.path.join(folder, name)
     if dry_run:
         # In dry-run mode, don't actually move files
         return dest
     
+    existing_names = name_cache.get(folder) if name_cache is not None else None
+    
     # If destination doesn't exist, move directly
-    if not dest.exists():
-        shutil.move(str(src), str(dest))
+    if not os.path.exists(dest):
+        _move_file(src, dest)
+        if existing_names is not None:
+            existing_names.add(name)
         return dest
     
+    # Snapshot the folder's names on its first conflict
+    if name_cache is not None and existing_names is None:
+        existing_names = _list_names(folder)
+        name_cache[folder] = existing_names
+    
     # Handle conflict by generating unique filename
-    unique_filename = generate_unique_filename(dest.parent, dest.name)
-    unique_dest = dest.parent / unique_filename
-    shutil.move(str(src), str(unique_dest))
+    unique_filename = generate_unique_filename(folder, name, existing_names)
+    unique_dest = os.path.join(folder, unique_filename)
+    _move_file(src, unique_dest)
     return unique_dest
 
 
-def generate_unique_filename(dest_path: Path, filename: str) -> str:
+def _move_file(src: str, dest: str) -> None:
+    """Moves a file, renaming it in place when possible.
+    
+    Sorting keeps files under the source directory, so moves are almost
+    always on one filesystem and a single rename does the job. shutil.move
+    (copy and delete) is only used when the rename crosses filesystems.
+    
+    Args:
+        src: Source file path
+        dest: Destination file path, which must not exist
+    """
+    try:
+        os.rename(src, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dest)
+
+
+class _FolderNames(set):
+    """Names known to exist in a destination folder.
+    
+    Also remembers, for each conflicting filename, the counter its numbered
+    search stopped at, so the next conflict on the same name resumes there
+    instead of probing every taken name again from 1.
+    
+    Attributes:
+        next_counters: Next counter to try, keyed by original filename
+    """
+    
+    __slots__ = ('next_counters',)
+    
+    def __init__(self, names=()):
+        super().__init__(names)
+        self.next_counters: dict[str, int] = {}
+
+
+def _list_names(folder: str) -> _FolderNames:
+    """Returns the names of the entries in a folder.
+    
+    Args:
+        folder: Folder to list
+        
+    Returns:
+        _FolderNames: Entry names (empty if the folder cannot be read)
+    """
+    try:
+        with os.scandir(folder) as entries:
+            return _FolderNames(entry.name for entry in entries)
+    except OSError:
+        return _FolderNames()
+
+
+def generate_unique_filename(dest_path: Union[Path, str], filename: str, existing_names: Optional[set[str]] = None) -> str:
     """Creates unique filename when conflicts occur.
     
     Args:
         dest_path: Destination directory path
         filename: Original filename
+        existing_names: Optional set of names known to exist in dest_path.
+            Candidates in the set are skipped without touching the
+            filesystem, and the returned name is added to it. A set
+            returned by _list_names also keeps the counter each filename's
+            search stopped at, since names are only added to the folder.
         
     Returns:
         str: Unique filename
     """
-    # Split filename into name and extension
-    path = Path(filename)
-    name = path.stem
-    ext = path.suffix
+    # Split filename into name and extension the way Path.stem and
+    # Path.suffix do, without parsing it as a path
+    dot = filename.rfind('.')
+    if 0 < dot < len(filename) - 1:
+        name, ext = filename[:dot], filename[dot:]
+    else:
+        name, ext = filename, ''
+    
+    # Resume where the last search for this filename stopped, since every
+    # lower counter is already taken
+    next_counters = getattr(existing_names, 'next_counters', None)
+    counter = next_counters.get(filename, 1) if next_counters is not None else 1
     
     # Try incrementing numbers until we find a unique name
-    counter = 1
     while True:
         new_filename = f"{name}_{counter}{ext}"
-        if not (dest_path / new_filename).exists():
-            return new_filename
+        if existing_names is None or new_filename not in existing_names:
+            # Confirm on disk, since the folder may have changed since the
+            # names were read
+            if not os.path.exists(os.path.join(dest_path, new_filename)):
+                if existing_names is not None:
+                    existing_names.add(new_filename)
+                if next_counters is not None:
+                    next_counters[filename] = counter + 1
+                return new_filename
+            if existing_names is not None:
+                existing_names.add(new_filename)
         counter += 1
 
 
-
-def sort_files_with_size(
-    source_path: Path,
-    thresholds: SizeThresholds = None,
+def _process_files(
+    files: list,
+    plan: Callable,
+    stats: EnhancedSortingStats,
     dry_run: bool = False,
     progress_callback: Callable = None,
-    ascii_progress_callback: Callable = None
-) -> EnhancedSortingStats:
-    """Sort files with size-based hierarchy (size/type).
+    ascii_progress_callback: Callable = None,
+    group_counts: Optional[Counter] = None,
+    record_operations: bool = True
+) -> None:
+    """Moves scanned files to their planned destinations and records the results.
+    
+    This is the per-file loop shared by the enhanced sorters. Destination
+    folders are created on first use, name conflicts are resolved against a
+    name cache kept for the whole run, and a file that fails is reported in
+    stats.errors without stopping the run.
     
     Args:
-        source_path: Root directory to sort files from
-        thresholds: Custom size thresholds (uses defaults if None)
+        files: Scanned files (directory entries or file records)
+        plan: Called with each file, returns a tuple of (destination folder,
+            destination name, category string, size in bytes, type category,
+            group). The type category is counted in the category stats and
+            the group in group_counts, unless they are None.
+        stats: Statistics to record operations, counts and errors in
         dry_run: If True, simulate operations without modifying files
         progress_callback: Callback function for progress updates
         ascii_progress_callback: Callback function for ASCII progress bar updates
-        
-    Returns:
-        EnhancedSortingStats: Statistics about the sorting operation
+        group_counts: Optional file counts per group (e.g., per size category)
+        record_operations: If False, skip recording operations in stats.operations
     """
-    stats = EnhancedSortingStats()
+    # File names per destination folder, read on its first conflict
+    name_cache: dict[str, set[str]] = {}
     
-    if thresholds is None:
-        thresholds = SizeThresholds()
+    # Destination folders already created during this run
+    created_folders: set[str] = set()
     
-    # Define category folders to exclude from scanning
-    exclude_dirs = {'img', 'vid', 'arc', 'msk', 'small', 'medium', 'large'}
+    total = len(files)
     
-    # Scan for all files
-    files = scan_directory(source_path, exclude_dirs)
+    # Start the progress bar at 0%, which also begins a new progress session
+    if ascii_progress_callback and total:
+        ascii_progress_callback(0, total)
     
-    # Process each file
-    for i, file_path in enumerate(files, 1):
+    for i, item in enumerate(files, 1):
         try:
-            # Classify by size and type
-            size_category = classify_by_size(file_path, thresholds)
-            type_category = classify_file(file_path)
-            
-            # Determine destination folder: size/type
-            dest_folder = source_path / size_category.value / type_category.value
-            if not dry_run:
-                dest_folder.mkdir(parents=True, exist_ok=True)
+            dest_folder, dest_name, category_str, size, type_category, group = plan(item)
+            if not dry_run and dest_folder not in created_folders:
+                os.makedirs(dest_folder, exist_ok=True)
+                created_folders.add(dest_folder)
             
             # Move file with conflict resolution
-            dest_path = dest_folder / file_path.name
-            actual_dest = move_file_with_conflict_resolution(file_path, dest_path, dry_run=dry_run)
+            source = os.fspath(item.path)
+            actual_dest = _move_to_folder(source, dest_folder, dest_name, dry_run, name_cache)
             
             # Record operation
-            file_size = file_path.stat().st_size if file_path.exists() else 0
-            operation = FileOperation(
-                source=file_path,
-                destination=actual_dest,
-                timestamp=datetime.now(),
-                category=f"{size_category.value}/{type_category.value}",
-                size=file_size
-            )
-            stats.operations.append(operation)
+            if record_operations:
+                stats.operations.record(source, actual_dest, time.time_ns(), category_str, size)
             
             # Update statistics
-            stats.increment(type_category)
-            
-            # Track size category counts
-            size_key = size_category.value
-            if size_key not in stats.size_categories:
-                stats.size_categories[size_key] = 0
-            stats.size_categories[size_key] += 1
+            if type_category is not None:
+                stats.increment(type_category)
+            if group is not None:
+                group_counts[group] += 1
             
             # Call progress callbacks
             if progress_callback:
                 progress_callback()
             
             if ascii_progress_callback:
-                ascii_progress_callback(i, len(files))
+                ascii_progress_callback(i, total)
                 
         except Exception as e:
-            stats.errors.append(f"Error processing {file_path}: {str(e)}")
+            stats.errors.append(f"Error processing {item.path}: {str(e)}")
+
+
+def sort_files_with_size(
+    source_path: Path,
+    thresholds: SizeThresholds = None,
+    dry_run: bool = False,
+    progress_callback: Callable = None,
+    ascii_progress_callback: Callable = None,
+    record_operations: bool = True
+) -> EnhancedSortingStats:
+    """Sort files with size-based hierarchy (size/type).
+    
+    Args:
+        source_path: Root directory to sort files from
+        thresholds: Custom size thresholds (uses defaults if None)
+        dry_run: If True, simulate operations without modifying files
+        progress_callback: Callback function for progress updates
+        ascii_progress_callback: Callback function for ASCII progress bar updates
+        record_operations: If False, leave stats.operations empty and skip
+            recording each move
+        
+    Returns:
+        EnhancedSortingStats: Statistics about the sorting operation
+    """
+    stats = EnhancedSortingStats()
+    
+    if thresholds is None:
+        thresholds = SizeThresholds()
+    
+    root = os.fspath(source_path)
+    
+    def plan(entry: os.DirEntry) -> tuple:
+        # Stat once and share the result between size classification and
+        # the operation record
+        file_stat = entry.stat()
+        size_category = classify_by_size(file_stat, thresholds)
+        type_category = classify_name(entry.name)
+        
+        # Destination folder: size/type
+        return (
+            os.path.join(root, size_category.value, type_category.value),
+            entry.name,
+            _category_path(size_category.value, type_category),
+            file_stat.st_size,
+            type_category,
+            size_category.value
+        )
+    
+    # Category and size folders are excluded from scanning
+    files = list(iter_scan_directory(source_path, _SIZE_EXCLUDE_DIRS))
+    _process_files(
+        files, plan, stats, dry_run, progress_callback, ascii_progress_callback,
+        group_counts=stats.size_categories,
+        record_operations=record_operations
+    )
     
     return stats
 
@@ -315,7 +693,8 @@ def sort_files_with_date(
     date_format: str = "%Y-%m",
     dry_run: bool = False,
     progress_callback: Callable = None,
-    ascii_progress_callback: Callable = None
+    ascii_progress_callback: Callable = None,
+    record_operations: bool = True
 ) -> EnhancedSortingStats:
     """Sort files with date-based hierarchy (date/type).
     
@@ -326,64 +705,24 @@ def sort_files_with_date(
         dry_run: If True, simulate operations without modifying files
         progress_callback: Callback function for progress updates
         ascii_progress_callback: Callback function for ASCII progress bar updates
+        record_operations: If False, leave stats.operations empty and skip
+            recording each move
         
     Returns:
         EnhancedSortingStats: Statistics about the sorting operation
     """
-    stats = EnhancedSortingStats()
-    
-    # Define category folders to exclude from scanning
-    exclude_dirs = {'img', 'vid', 'arc', 'msk'}
-    
-    # Scan for all files
-    files = scan_directory(source_path, exclude_dirs)
-    
-    # Process each file
-    for i, file_path in enumerate(files, 1):
-        try:
-            # Classify by date and type
-            date_folder = classify_by_date(file_path, use_creation, date_format)
-            type_category = classify_file(file_path)
-            
-            # Determine destination folder: date/type
-            dest_folder = source_path / date_folder / type_category.value
-            if not dry_run:
-                dest_folder.mkdir(parents=True, exist_ok=True)
-            
-            # Move file with conflict resolution
-            dest_path = dest_folder / file_path.name
-            actual_dest = move_file_with_conflict_resolution(file_path, dest_path, dry_run=dry_run)
-            
-            # Record operation
-            file_size = file_path.stat().st_size if file_path.exists() else 0
-            operation = FileOperation(
-                source=file_path,
-                destination=actual_dest,
-                timestamp=datetime.now(),
-                category=f"{date_folder}/{type_category.value}",
-                size=file_size
-            )
-            stats.operations.append(operation)
-            
-            # Update statistics
-            stats.increment(type_category)
-            
-            # Track date category counts
-            if date_folder not in stats.date_categories:
-                stats.date_categories[date_folder] = 0
-            stats.date_categories[date_folder] += 1
-            
-            # Call progress callbacks
-            if progress_callback:
-                progress_callback()
-            
-            if ascii_progress_callback:
-                ascii_progress_callback(i, len(files))
-                
-        except Exception as e:
-            stats.errors.append(f"Error processing {file_path}: {str(e)}")
-    
-    return stats
+    # Date folders under a type hierarchy are the archive layout with
+    # type folders
+    return sort_files_archive_mode(
+        source_path,
+        use_creation=use_creation,
+        date_format=date_format,
+        with_type_hierarchy=True,
+        dry_run=dry_run,
+        progress_callback=progress_callback,
+        ascii_progress_callback=ascii_progress_callback,
+        record_operations=record_operations
+    )
 
 
 def sort_files_archive_mode(
@@ -393,7 +732,8 @@ def sort_files_archive_mode(
     with_type_hierarchy: bool = False,
     dry_run: bool = False,
     progress_callback: Callable = None,
-    ascii_progress_callback: Callable = None
+    ascii_progress_callback: Callable = None,
+    record_operations: bool = True
 ) -> EnhancedSortingStats:
     """Sort files into dated archive folders.
     
@@ -405,70 +745,43 @@ def sort_files_archive_mode(
         dry_run: If True, simulate operations without modifying files
         progress_callback: Callback function for progress updates
         ascii_progress_callback: Callback function for ASCII progress bar updates
+        record_operations: If False, leave stats.operations empty and skip
+            recording each move
         
     Returns:
         EnhancedSortingStats: Statistics about the sorting operation
     """
     stats = EnhancedSortingStats()
+    root = os.fspath(source_path)
     
-    # Define category folders to exclude from scanning
-    exclude_dirs = {'img', 'vid', 'arc', 'msk'}
-    
-    # Scan for all files
-    files = scan_directory(source_path, exclude_dirs)
+    def plan(entry: os.DirEntry) -> tuple:
+        # Stat once and share the result between date classification and
+        # the operation record
+        file_stat = entry.stat()
+        
+        # Classify by date and type; the type is needed for stats even in
+        # the flat structure
+        date_folder = classify_by_date(entry.path, use_creation, date_format, stat_result=file_stat)
+        type_category = classify_name(entry.name)
+        
+        if with_type_hierarchy:
+            # Create date/type hierarchy
+            dest_folder = os.path.join(root, date_folder, type_category.value)
+            category_str = _category_path(date_folder, type_category)
+        else:
+            # Flat structure: just date folder
+            dest_folder = os.path.join(root, date_folder)
+            category_str = date_folder
+        
+        return dest_folder, entry.name, category_str, file_stat.st_size, type_category, date_folder
     
-    # Process each file
-    for i, file_path in enumerate(files, 1):
-        try:
-            # Classify by date
-            date_folder = classify_by_date(file_path, use_creation, date_format)
-            
-            if with_type_hierarchy:
-                # Create date/type hierarchy
-                type_category = classify_file(file_path)
-                dest_folder = source_path / date_folder / type_category.value
-                category_str = f"{date_folder}/{type_category.value}"
-            else:
-                # Flat structure: just date folder
-                dest_folder = source_path / date_folder
-                type_category = classify_file(file_path)  # Still classify for stats
-                category_str = date_folder
-            
-            if not dry_run:
-                dest_folder.mkdir(parents=True, exist_ok=True)
-            
-            # Move file with conflict resolution
-            dest_path = dest_folder / file_path.name
-            actual_dest = move_file_with_conflict_resolution(file_path, dest_path, dry_run=dry_run)
-            
-            # Record operation
-            file_size = file_path.stat().st_size if file_path.exists() else 0
-            operation = FileOperation(
-                source=file_path,
-                destination=actual_dest,
-                timestamp=datetime.now(),
-                category=category_str,
-                size=file_size
-            )
-            stats.operations.append(operation)
-            
-            # Update statistics
-            stats.increment(type_category)
-            
-            # Track date category counts
-            if date_folder not in stats.date_categories:
-                stats.date_categories[date_folder] = 0
-            stats.date_categories[date_folder] += 1
-            
-            # Call progress callbacks
-            if progress_callback:
-                progress_callback()
-            
-            if ascii_progress_callback:
-                ascii_progress_callback(i, len(files))
-                
-        except Exception as e:
-            stats.errors.append(f"Error processing {file_path}: {str(e)}")
+    # Category folders are excluded from scanning
+    files = list(iter_scan_directory(source_path, _CATEGORY_EXCLUDE_DIRS))
+    _process_files(
+        files, plan, stats, dry_run, progress_callback, ascii_progress_callback,
+        group_counts=stats.date_categories,
+        record_operations=record_operations
+    )
     
     return stats
 
@@ -478,7 +791,9 @@ def sort_files_with_duplicates(
     hash_algorithm: str = "md5",
     dry_run: bool = False,
     progress_callback: Callable = None,
-    ascii_progress_callback: Callable = None
+    ascii_progress_callback: Callable = None,
+    hash_cache: Optional[HashCache] = None,
+    record_operations: bool = True
 ) -> EnhancedSortingStats:
     """Sort files with duplicate detection.
     
@@ -488,20 +803,24 @@ def sort_files_with_duplicates(
         dry_run: If True, simulate operations without modifying files
         progress_callback: Callback function for progress updates
         ascii_progress_callback: Callback function for ASCII progress bar updates
+        hash_cache: Persistent hash cache to reuse hashes of unchanged files
+        record_operations: If False, leave stats.operations empty and skip
+            recording each move
         
     Returns:
         EnhancedSortingStats: Statistics about the sorting operation
     """
     stats = EnhancedSortingStats()
+    root = os.fspath(source_path)
+    duplicates_folder = os.path.join(root, "duplicates")
     
-    # Define category folders to exclude from scanning
-    exclude_dirs = {'img', 'vid', 'arc', 'msk', 'duplicates'}
-    
-    # Scan for all files
-    files = scan_directory(source_path, exclude_dirs)
+    # Scan for all files, keeping the sizes found during the scan so duplicate
+    # detection doesn't need to stat every file again. Category folders and
+    # the duplicates folder are excluded from scanning.
+    records = scan_file_records(source_path, _DUPLICATE_EXCLUDE_DIRS)
     
     # Find duplicates
-    duplicates = find_duplicates(files, hash_algorithm)
+    duplicates = find_duplicates(records, hash_algorithm, cache=hash_cache)
     duplicate_files = set()
     for file_list in duplicates.values():
         # Keep first file, mark rest as duplicates
@@ -512,54 +831,43 @@ def sort_files_with_duplicates(
     stats.space_saved = calculate_space_saved(duplicates)
     stats.duplicates_found = len(duplicate_files)
     
-    # Process each file
-    for i, file_path in enumerate(files, 1):
-        try:
-            if file_path in duplicate_files:
-                # Move to duplicates folder
-                dest_folder = source_path / "duplicates"
-                if not dry_run:
-                    dest_folder.mkdir(exist_ok=True)
-                
-                # Add duplicate suffix to filename
-                dest_path = dest_folder / f"{file_path.stem}_duplicate{file_path.suffix}"
-                category_str = "duplicates"
-                type_category = classify_file(file_path)  # Still classify for stats
-            else:
-                # Normal classification
-                type_category = classify_file(file_path)
-                dest_folder = source_path / type_category.value
-                if not dry_run:
-                    dest_folder.mkdir(exist_ok=True)
-                dest_path = dest_folder / file_path.name
-                category_str = type_category.value
-            
-            # Move file with conflict resolution
-            actual_dest = move_file_with_conflict_resolution(file_path, dest_path, dry_run=dry_run)
-            
-            # Record operation
-            file_size = file_path.stat().st_size if file_path.exists() else 0
-            operation = FileOperation(
-                source=file_path,
-                destination=actual_dest,
-                timestamp=datetime.now(),
-                category=category_str,
-                size=file_size
-            )
-            stats.operations.append(operation)
-            
-            # Update statistics (only count non-duplicates in category counts)
-            if file_path not in duplicate_files:
-                stats.increment(type_category)
-            
-            # Call progress callbacks
-            if progress_callback:
-                progress_callback()
-            
-            if ascii_progress_callback:
-                ascii_progress_callback(i, len(files))
-                
-        except Exception as e:
-            stats.errors.append(f"Error processing {file_path}: {str(e)}")
+    def plan(record) -> tuple:
+        if record.path in duplicate_files:
+            # Move to duplicates folder with a duplicate suffix, using the
+            # name parts captured by the scan. Duplicates are not counted
+            # in the category stats, so they are not classified.
+            stem = record.name[:len(record.name) - len(record.suffix)]
+            return duplicates_folder, f"{stem}_duplicate{record.suffix}", "duplicates", record.size, None, None
+        
+        # Normal classification
+        type_category = classify_name(record.name)
+        return (
+            os.path.join(root, type_category.value),
+            record.name,
+            type_category.value,
+            record.size,
+            type_category,
+            None
+        )
+    
+    # Moves are needed to re-key cached hashes even when they aren't
+    # returned to the caller
+    rekey_hashes = hash_cache is not None and not dry_run
+    _process_files(
+        records, plan, stats, dry_run, progress_callback, ascii_progress_callback,
+        record_operations=record_operations or rekey_hashes
+    )
+    
+    # Keep the cached hashes of moved files valid under their new paths, so
+    # a later run over the sorted tree doesn't hash them again; like
+    # find_duplicates, the cache is keyed by absolute path
+    if rekey_hashes:
+        abspath = os.path.abspath
+        hash_cache.move_many(
+            (abspath(source), abspath(destination))
+            for source, destination in zip(stats.operations.sources, stats.operations.destinations)
+        )
+        if not record_operations:
+            stats.operations = OperationLog()
     
     return stats
@@ -0,0 +1,63 @@
+"""Shared pytest fixtures for the property-based tests."""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+
+# Memory-backed filesystem used for test directories where available (Linux)
+TMPFS_DIR = "/dev/shm"
+
+# Free space the tmpfs needs before tests use it; the size sorting tests
+# write files of up to 200MB (1GB)
+TMPFS_MIN_FREE = 1024 * 1024 * 1024
+
+
+def _tmpfs_base() -> Optional[str]:
+    """Returns TMPFS_DIR if it is writable and has enough free space, else None."""
+    try:
+        usage = os.statvfs(TMPFS_DIR)
+    except (OSError, AttributeError):
+        # Missing mount, or no statvfs on this platform (Windows)
+        return None
+    if usage.f_bavail * usage.f_frsize < TMPFS_MIN_FREE or not os.access(TMPFS_DIR, os.W_OK):
+        return None
+    return TMPFS_DIR
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_tmp():
+    """Points tempfile at a directory on tmpfs for the whole test session.
+    
+    The tests mostly create, stat and remove small files and directories, so
+    keeping them in memory avoids block-device metadata work. Every
+    TemporaryDirectory() in the tests lands below this directory; without a
+    suitable tmpfs the default temporary directory is used.
+    """
+    base = _tmpfs_base()
+    if base is None:
+        yield tempfile.gettempdir()
+        return
+    
+    with tempfile.TemporaryDirectory(dir=base, prefix="sik-sort-tests-") as temp_dir:
+        previous = tempfile.tempdir
+        tempfile.tempdir = temp_dir
+        try:
+            yield temp_dir
+        finally:
+            tempfile.tempdir = previous
+
+
+@pytest.fixture(scope="module")
+def scratch_root(fast_tmp):
+    """Temporary directory shared by every example of a test module.
+    
+    Hypothesis runs each test body many times; tests create their per-example
+    files below this root and remove them afterwards, instead of creating and
+    deleting a fresh temporary directory for every example.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
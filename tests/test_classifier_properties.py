@@ -1,8 +1,8 @@
 """Property-based tests for file classifier module."""
 
 from pathlib import Path
-from hypothesis import given, strategies as st, settings
-from sik_sort.classifier import classify_file, FileCategory, get_category_extensions
+from hypothesis import given, strategies as st, settings, assume
+from sik_sort.classifier import classify_file, classify_name, FileCategory, get_category_extensions
 
 
 # Feature: file-sorter-cli, Property 13: Case-insensitive classification
@@ -54,3 +54,51 @@ def test_case_insensitive_classification(base_name, extension, case_transform):
         f"File with extension '.{extension.lower()}' classified as {category_lower}, "
         f"but '.{transformed_ext}' classified as {category_transformed}"
     )
+
+
+# Additional property test: Classification matches the category extension sets
+@settings(max_examples=200)
+@given(
+    base_name=st.text(min_size=1, max_size=10, alphabet=st.characters(blacklist_characters=['.', '/', '\\', '\0'])),
+    extension=st.one_of(
+        st.sampled_from(sorted(set().union(*get_category_extensions().values()))),
+        st.text(min_size=1, max_size=5, alphabet=st.characters(blacklist_characters=['.', '/', '\\', '\0'])).map(lambda e: '.' + e),
+        st.just('')
+    )
+)
+def test_classification_matches_extension_sets(base_name, extension):
+    """
+    Property: Classification matches the category extension sets
+    
+    For any file name, classify_file should return the category whose
+    extension set contains the lowercased suffix, or MISC if none does.
+    """
+    file_path = Path(f"{base_name}{extension}")
+    
+    expected = FileCategory.MISC
+    for category, extensions in get_category_extensions().items():
+        if file_path.suffix.lower() in extensions:
+            expected = category
+    
+    assert classify_file(file_path) == expected
+
+
+# Additional property test: Name classification matches path classification
+@settings(max_examples=200)
+@given(
+    name=st.lists(
+        st.sampled_from(list("abcXYZ019 ._-") + ['.jpg', '.MP4', '.tar', '.gz']),
+        min_size=1,
+        max_size=8
+    ).map(''.join)
+)
+def test_name_classification_matches_path_classification(name):
+    """
+    Property: Name classification matches path classification
+    
+    For any file name, classify_name should return the same category as
+    classify_file does for a path with that name.
+    """
+    assume(Path(name).name == name)
+    
+    assert classify_name(name) == classify_file(Path(name))
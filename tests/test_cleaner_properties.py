@@ -1,27 +1,48 @@
 """Property-based tests for folder cleaner module."""
 
+import os
 import tempfile
 from pathlib import Path
 from hypothesis import given, strategies as st, settings, assume
-from sik_sort.cleaner import find_empty_directories, remove_empty_directories
+from sik_sort.cleaner import find_empty_directories, remove_empty_directories, clean_empty_directories
 
 
 # Windows reserved names that cannot be used as file or directory names
-WINDOWS_RESERVED_NAMES = {
+WINDOWS_RESERVED_NAMES = frozenset({
     'CON', 'PRN', 'AUX', 'NUL',
     'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
     'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-}
+})
 
 
 def is_valid_windows_name(name: str) -> bool:
     """Check if a name is valid on Windows."""
-    if not name or name.upper() in WINDOWS_RESERVED_NAMES:
-        return False
-    # Check if name ends with space or period (invalid on Windows)
-    if name.endswith(' ') or name.endswith('.'):
-        return False
-    return True
+    # Names cannot be reserved or end with a space or period
+    return bool(name) and name.upper() not in WINDOWS_RESERVED_NAMES and name[-1] not in ' .'
+
+
+# Category folders that cleanup preserves
+CATEGORY_DIRS = frozenset({'img', 'vid', 'arc', 'msk'})
+
+
+def walk_directories(root: str) -> dict[str, bool]:
+    """Map every directory under root (and root itself) to whether it has entries.
+    
+    Each directory is listed once with os.scandir, and subdirectories are
+    found from the entry types the listing reports, so no directory is
+    stat'd separately.
+    """
+    has_entries = {}
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        has_entries[directory] = False
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                has_entries[directory] = True
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return has_entries
 
 
 # Feature: file-sorter-cli, Property 11: Empty directories are removed
@@ -30,7 +51,8 @@ def is_valid_windows_name(name: str) -> bool:
     # Generate directory structure with some empty and some non-empty directories
     dir_structure=st.lists(
         st.tuples(
-            # Directory path components
+            # Directory path components, excluding names that are invalid on
+            # Windows and the preserved category folder names
             st.lists(
                 st.text(
                     min_size=1,
@@ -39,7 +61,7 @@ def is_valid_windows_name(name: str) -> bool:
                         whitelist_categories=('Lu', 'Ll', 'Nd'),
                         blacklist_characters=['/', '\\', '\0', ':', '*', '?', '"', '<', '>', '|']
                     )
-                ),
+                ).filter(lambda name: is_valid_windows_name(name) and name not in CATEGORY_DIRS),
                 min_size=1,
                 max_size=3
             ),
@@ -59,16 +81,16 @@ def test_empty_directories_are_removed(dir_structure):
     
     Validates: Requirements 5.2
     """
-    # Create a temporary directory for testing
-    with tempfile.TemporaryDirectory() as temp_dir:
-        root = Path(temp_dir)
-        
+    # Create a temporary directory for testing; the tree is built and
+    # checked with str paths and os functions, as this loop runs for every
+    # generated path
+    with tempfile.TemporaryDirectory() as root:
         # Category folders to preserve
-        preserve_dirs = {'img', 'vid', 'arc', 'msk'}
+        preserve_dirs = set(CATEGORY_DIRS)
         
         # Create preserved category folders (some empty, some with files)
         for category in preserve_dirs:
-            (root / category).mkdir()
+            os.mkdir(os.path.join(root, category))
         
         # Track which directories should be empty after cleanup
         expected_empty_dirs = set()
@@ -76,76 +98,197 @@ def test_empty_directories_are_removed(dir_structure):
         
         # Create the directory structure
         for dir_components, has_file in dir_structure:
-            # Filter out invalid directory names
-            valid_components = [d for d in dir_components if d and is_valid_windows_name(d)]
-            
-            # Skip if no valid components
-            if not valid_components:
+            # Create the directory and any missing parents in one call
+            current_path = os.path.join(root, *dir_components)
+            try:
+                os.makedirs(current_path, exist_ok=True)
+            except OSError:
+                # Skip if we can't create the directory
                 continue
             
-            # Build the directory path
-            current_path = root
-            for component in valid_components:
-                current_path = current_path / component
+            if has_file:
+                # Create a file in this directory
                 try:
-                    current_path.mkdir(exist_ok=True)
-                except (OSError, FileNotFoundError):
-                    # Skip if we can't create the directory
-                    break
-            else:
-                # Only process if we successfully created all directories
-                if has_file:
-                    # Create a file in this directory
-                    try:
-                        (current_path / "file.txt").write_text("content")
-                        # Mark this directory and all its parents as non-empty
-                        temp_path = current_path
-                        while temp_path != root:
-                            expected_non_empty_dirs.add(temp_path)
-                            temp_path = temp_path.parent
-                    except (OSError, FileNotFoundError):
-                        # If we can't create the file, treat as empty
-                        if current_path not in expected_non_empty_dirs:
-                            expected_empty_dirs.add(current_path)
-                else:
-                    # This directory should be empty (if not already marked as non-empty)
+                    # Only the file's presence matters, so create it empty
+                    os.close(os.open(os.path.join(current_path, "file.txt"), os.O_CREAT | os.O_WRONLY, 0o644))
+                    # Mark this directory and all its parents as non-empty
+                    parent = current_path
+                    while parent != root:
+                        expected_non_empty_dirs.add(parent)
+                        parent = os.path.dirname(parent)
+                except OSError:
+                    # If we can't create the file, treat as empty
                     if current_path not in expected_non_empty_dirs:
                         expected_empty_dirs.add(current_path)
+            else:
+                # This directory should be empty (if not already marked as non-empty)
+                if current_path not in expected_non_empty_dirs:
+                    expected_empty_dirs.add(current_path)
         
-        # Find and remove empty directories iteratively until none are left
-        # This handles nested empty directories
-        total_removed = 0
-        while True:
-            empty_dirs = find_empty_directories(root, preserve_dirs)
-            if not empty_dirs:
-                break
-            removed_count = remove_empty_directories(empty_dirs)
-            total_removed += removed_count
-            if removed_count == 0:
-                break
-        
-        # Verify that empty directories were removed
-        for empty_dir in expected_empty_dirs:
-            if empty_dir.exists():
-                # Check if it's actually empty
-                try:
-                    is_empty = not any(empty_dir.iterdir())
-                    assert not is_empty, (
-                        f"Empty directory {empty_dir} was not removed"
-                    )
-                except (PermissionError, OSError):
-                    # Can't check, skip
-                    pass
+        # Remove empty directories in one bottom-up pass; directories that
+        # only held empty directories are removed in the same pass
+        removed_count = clean_empty_directories(Path(root), preserve_dirs)
         
-        # Verify that non-empty directories still exist
-        for non_empty_dir in expected_non_empty_dirs:
-            assert non_empty_dir.exists(), (
-                f"Non-empty directory {non_empty_dir} was incorrectly removed"
+        # When every generated directory holds a file somewhere below it,
+        # nothing may be removed; the tree is then unchanged, so the checks
+        # that walk it are skipped
+        if expected_empty_dirs <= expected_non_empty_dirs:
+            assert removed_count == 0, (
+                f"Cleanup removed {removed_count} directories from a tree without empty directories"
             )
+            return
+        
+        # A separate find and remove pass has nothing left to remove
+        assert remove_empty_directories(find_empty_directories(Path(root), preserve_dirs)) == 0, (
+            "Cleanup left empty directories behind"
+        )
+        
+        # List the remaining tree once
+        remaining = walk_directories(root)
+        
+        # Verify that empty directories were removed (a directory that is
+        # still there must have gained entries, e.g. as a parent of another)
+        for empty_dir in expected_empty_dirs & remaining.keys():
+            assert remaining[empty_dir], (
+                f"Empty directory {empty_dir} was not removed"
+            )
+        
+        # Verify that non-empty directories still exist
+        missing = expected_non_empty_dirs - remaining.keys()
+        assert not missing, (
+            f"Non-empty directories {missing} were incorrectly removed"
+        )
         
         # Verify that preserved directories still exist
         for category in preserve_dirs:
-            category_dir = root / category
-            assert category_dir.exists(), (
+            assert os.path.join(root, category) in remaining, (
                 f"Preserved category directory {category} was removed"
             )
+
+
+# Feature: file-sorter-cli, Property 11: Empty directories are removed
+@settings(max_examples=100)
+@given(
+    # Generate nested directory paths, some of which contain a file
+    dir_structure=st.lists(
+        st.tuples(
+            st.lists(
+                st.sampled_from(['a', 'b', 'c', 'img']),
+                min_size=1,
+                max_size=4
+            ),
+            st.booleans()
+        ),
+        min_size=1,
+        max_size=15
+    )
+)
+def test_clean_empty_directories_single_pass(dir_structure):
+    """
+    Property 11: Empty directories are removed
+    
+    For any directory structure, a single cleanup pass should remove every
+    directory that contains no files (including directories that only held
+    empty directories), while keeping preserved folders and their contents.
+    
+    Validates: Requirements 5.2
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        preserve_dirs = {'img', 'vid', 'arc', 'msk'}
+        
+        file_paths = set()
+        created_dirs = set()
+        for dir_components, has_file in dir_structure:
+            current_path = root.joinpath(*dir_components)
+            current_path.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(current_path)
+            if has_file:
+                (current_path / "file.txt").write_text("content")
+                file_paths.add(current_path / "file.txt")
+        
+        # Directories expected to survive: anything at or below a preserved
+        # directory, plus every ancestor of a file or a preserved directory
+        expected_kept = set()
+        for directory in created_dirs | {f.parent for f in file_paths}:
+            relative_parts = directory.relative_to(root).parts
+            if any(part in preserve_dirs for part in relative_parts):
+                expected_kept.add(directory)
+            elif directory not in {f.parent for f in file_paths}:
+                continue
+            while directory != root:
+                expected_kept.add(directory)
+                directory = directory.parent
+        
+        # Dry run reports the same count without touching the tree
+        would_remove = clean_empty_directories(root, preserve_dirs, dry_run=True)
+        assert all(directory.exists() for directory in created_dirs), (
+            "Dry run should not remove any directories"
+        )
+        
+        removed_count = clean_empty_directories(root, preserve_dirs)
+        assert removed_count == would_remove, (
+            f"Dry run reported {would_remove} directories, but {removed_count} were removed"
+        )
+        
+        # Every directory is either kept or gone, never both
+        all_dirs = set()
+        for directory in created_dirs:
+            while directory != root:
+                all_dirs.add(directory)
+                directory = directory.parent
+        
+        for directory in all_dirs:
+            if directory in expected_kept:
+                assert directory.exists(), f"Directory {directory} was incorrectly removed"
+            else:
+                assert not directory.exists(), f"Empty directory {directory} was not removed"
+        
+        assert removed_count == len(all_dirs - expected_kept), (
+            f"Expected {len(all_dirs - expected_kept)} directories removed, got {removed_count}"
+        )
+        
+        # All files are untouched
+        for file_path in file_paths:
+            assert file_path.exists(), f"File {file_path} was removed"
+
+
+# Feature: file-sorter-cli, Property 11: Empty directories are removed
+@settings(max_examples=50)
+@given(
+    # Generate nested directory paths, some of which contain a file
+    dir_structure=st.lists(
+        st.tuples(
+            st.lists(
+                st.sampled_from(['a', 'b', 'c', 'img']),
+                min_size=1,
+                max_size=5
+            ),
+            st.booleans()
+        ),
+        min_size=1,
+        max_size=15
+    ),
+    max_workers=st.integers(min_value=2, max_value=4)
+)
+def test_parallel_find_matches_serial_find(dir_structure, max_workers):
+    """
+    Property 11: Empty directories are removed
+    
+    For any directory structure, scanning with a pool of workers should
+    report the same empty directories, in the same order, as the default
+    serial walk.
+    
+    Validates: Requirements 5.2
+    """
+    with tempfile.TemporaryDirectory() as root:
+        preserve_dirs = {'img', 'vid', 'arc', 'msk'}
+        
+        for dir_components, has_file in dir_structure:
+            current_path = os.path.join(root, *dir_components)
+            os.makedirs(current_path, exist_ok=True)
+            if has_file:
+                os.close(os.open(os.path.join(current_path, "file.txt"), os.O_CREAT | os.O_WRONLY, 0o644))
+        
+        expected = find_empty_directories(Path(root), preserve_dirs)
+        assert find_empty_directories(Path(root), preserve_dirs, max_workers=max_workers) == expected
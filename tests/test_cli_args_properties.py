@@ -1,30 +1,37 @@
 """Property-based tests for CLI argument parsing."""
 
 from pathlib import Path
-from hypothesis import given, strategies as st, settings, assume
-import tempfile
+import pytest
+from hypothesis import given, strategies as st, settings
+import shutil
 import sys
+import uuid
 from unittest.mock import patch
 from sik_sort.cli import parse_arguments
 
 
-# Windows reserved names that should be filtered out
-WINDOWS_RESERVED_NAMES = {
-    'CON', 'PRN', 'AUX', 'NUL',
-    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-}
+# Characters of generated names: letters and digits, so no character that
+# is special in paths on any platform
+name_characters = st.characters(
+    whitelist_categories=('Lu', 'Ll', 'Nd'),
+    blacklist_characters=['<', '>', ':', '"', '|', '?', '*', '\0', '/', '\\']
+)
 
+# Hand-picked directory names for the path pass-through tests: single
+# letter, word, digits only, longest name and non-ASCII
+DIR_NAME_CASES = ["a", "test", "0123", "u" * 50, "Ünïcödé"]
 
-# Feature: file-sorter-cli, Property 30: Command-line path argument is used
-@settings(max_examples=100)
-@given(
-    dir_name=st.text(min_size=1, max_size=50, alphabet=st.characters(
-        whitelist_categories=('Lu', 'Ll', 'Nd'),
-        blacklist_characters=['<', '>', ':', '"', '|', '?', '*', '\0', '/', '\\']
-    ))
+# Paths that cannot exist: the prefix is chosen once per test run, so no
+# generated path needs to be checked against the filesystem
+MISSING_PREFIX = f"__missing_{uuid.uuid4().hex}_"
+missing_paths = st.text(min_size=1, max_size=100, alphabet=name_characters).map(
+    lambda name: MISSING_PREFIX + name
 )
-def test_command_line_path_is_used(dir_name):
+
+
+# Feature: file-sorter-cli, Property 30: Command-line path argument is used
+@pytest.mark.parametrize("dir_name", DIR_NAME_CASES)
+def test_command_line_path_is_used(scratch_root, dir_name):
     """
     Property 30: Command-line path argument is used
     
@@ -33,26 +40,19 @@ def test_command_line_path_is_used(dir_name):
     
     Validates: Requirements 12.1
     """
-    # Filter out Windows reserved names
-    assume(dir_name.upper() not in WINDOWS_RESERVED_NAMES)
-    
-    # Create a temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create a subdirectory with the generated name
-        test_dir = Path(temp_dir) / dir_name
-        test_dir.mkdir(exist_ok=True)
+    # Create a subdirectory with the given name in the shared scratch root
+    test_dir = scratch_root / dir_name
+    test_dir.mkdir(exist_ok=True)
+    try:
+        path, dry_run, recursive = parse_arguments([str(test_dir)])
         
-        # Verify it's actually a directory (not a device file)
-        assume(test_dir.is_dir())
-        
-        # Mock sys.argv to simulate command-line arguments
-        with patch.object(sys, 'argv', ['sik', str(test_dir)]):
-            path, dry_run = parse_arguments()
-            
-            # Assert the path is used
-            assert path is not None, "Path should not be None when provided via command line"
-            assert path == test_dir, f"Expected path {test_dir}, got {path}"
-            assert not dry_run, "Dry-run should be False by default"
+        # Assert the path is used
+        assert path is not None, "Path should not be None when provided via command line"
+        assert path == test_dir, f"Expected path {test_dir}, got {path}"
+        assert not dry_run, "Dry-run should be False by default"
+        assert recursive, "Recursion should be enabled by default"
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
 
 
 # Feature: file-sorter-cli, Property 31: Missing path triggers interactive prompt
@@ -75,7 +75,7 @@ def test_missing_path_triggers_prompt(dry_flag):
         args.append('--dry')
     
     with patch.object(sys, 'argv', args):
-        path, dry_run = parse_arguments()
+        path, dry_run, recursive = parse_arguments()
         
         # Assert that path is None (indicating prompt is needed)
         assert path is None, "Path should be None when not provided via command line"
@@ -83,15 +83,9 @@ def test_missing_path_triggers_prompt(dry_flag):
 
 
 # Feature: file-sorter-cli, Property 32: Dry-run flag works with path argument
-@settings(max_examples=100)
-@given(
-    dir_name=st.text(min_size=1, max_size=50, alphabet=st.characters(
-        whitelist_categories=('Lu', 'Ll', 'Nd'),
-        blacklist_characters=['<', '>', ':', '"', '|', '?', '*', '\0', '/', '\\']
-    )),
-    dry_flag_variant=st.sampled_from(['--dry', '--dry-run'])
-)
-def test_dry_run_with_path_argument(dir_name, dry_flag_variant):
+@pytest.mark.parametrize("dry_flag_variant", ['--dry', '--dry-run'])
+@pytest.mark.parametrize("dir_name", DIR_NAME_CASES)
+def test_dry_run_with_path_argument(scratch_root, dir_name, dry_flag_variant):
     """
     Property 32: Dry-run flag works with path argument
     
@@ -100,35 +94,24 @@ def test_dry_run_with_path_argument(dir_name, dry_flag_variant):
     
     Validates: Requirements 12.3
     """
-    # Filter out Windows reserved names
-    assume(dir_name.upper() not in WINDOWS_RESERVED_NAMES)
-    
-    # Create a temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create a subdirectory with the generated name
-        test_dir = Path(temp_dir) / dir_name
-        test_dir.mkdir(exist_ok=True)
-        
-        # Verify it's actually a directory (not a device file)
-        assume(test_dir.is_dir())
+    # Create a subdirectory with the given name in the shared scratch root
+    test_dir = scratch_root / dir_name
+    test_dir.mkdir(exist_ok=True)
+    try:
+        path, dry_run, recursive = parse_arguments([str(test_dir), dry_flag_variant])
         
-        # Mock sys.argv to simulate command-line arguments with dry-run flag
-        with patch.object(sys, 'argv', ['sik', str(test_dir), dry_flag_variant]):
-            path, dry_run = parse_arguments()
-            
-            # Assert the path is used and dry-run is enabled
-            assert path is not None, "Path should not be None when provided via command line"
-            assert path == test_dir, f"Expected path {test_dir}, got {path}"
-            assert dry_run, "Dry-run should be True when flag is provided"
+        # Assert the path is used and dry-run is enabled
+        assert path is not None, "Path should not be None when provided via command line"
+        assert path == test_dir, f"Expected path {test_dir}, got {path}"
+        assert dry_run, "Dry-run should be True when flag is provided"
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
 
 
 # Feature: file-sorter-cli, Property 33: Invalid command-line path shows error
 @settings(max_examples=100)
 @given(
-    invalid_path=st.text(min_size=1, max_size=100, alphabet=st.characters(
-        whitelist_categories=('Lu', 'Ll', 'Nd'),
-        blacklist_characters=['<', '>', ':', '"', '|', '?', '*', '\0']
-    )).filter(lambda x: not Path(x).exists())
+    invalid_path=missing_paths
 )
 def test_invalid_command_line_path_error(invalid_path):
     """
@@ -139,15 +122,39 @@ def test_invalid_command_line_path_error(invalid_path):
     
     Validates: Requirements 12.4
     """
-    # Assume the path doesn't exist
-    assume(not Path(invalid_path).exists())
-    
     # Mock sys.argv to simulate command-line arguments with invalid path
     with patch.object(sys, 'argv', ['sik', invalid_path]):
         try:
-            path, dry_run = parse_arguments()
+            path, dry_run, recursive = parse_arguments()
             # If we get here, the test should fail
             assert False, f"Expected SystemExit for invalid path '{invalid_path}', but got path={path}"
         except SystemExit as e:
             # Assert that the program exits with error code
             assert e.code == 1, f"Expected exit code 1, got {e.code}"
+
+
+# Additional property test: --no-recursive disables recursion
+@settings(max_examples=20)
+@given(
+    no_recursive=st.booleans(),
+    dry_flag=st.booleans()
+)
+def test_no_recursive_flag(no_recursive, dry_flag):
+    """
+    Property: --no-recursive disables recursion
+    
+    For any combination of flags, the recursive flag should be False exactly
+    when --no-recursive is given, independently of the dry-run flag.
+    """
+    args = ['sik']
+    if no_recursive:
+        args.append('--no-recursive')
+    if dry_flag:
+        args.append('--dry')
+    
+    with patch.object(sys, 'argv', args):
+        path, dry_run, recursive = parse_arguments()
+        
+        assert path is None
+        assert dry_run == dry_flag
+        assert recursive == (not no_recursive)
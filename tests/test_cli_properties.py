@@ -1,8 +1,9 @@
 """Property-based tests for CLI module."""
 
 from pathlib import Path
-from hypothesis import given, strategies as st, settings, assume
-import tempfile
+from hypothesis import given, example, strategies as st, settings, Phase
+import shutil
+import uuid
 
 
 def validate_path(path_str: str) -> tuple[bool, str]:
@@ -22,15 +23,41 @@ def validate_path(path_str: str) -> tuple[bool, str]:
     return (True, "")
 
 
+# Characters of generated names: letters and digits, so no character that
+# is special in paths on any platform
+name_characters = st.characters(
+    whitelist_categories=('Lu', 'Ll', 'Nd'),
+    blacklist_characters=['<', '>', ':', '"', '|', '?', '*', '\0', '/', '\\']
+)
+
+# Directory names to create and validate
+valid_dir_names = st.text(min_size=1, max_size=50, alphabet=name_characters)
+
+# Paths that cannot exist: the prefix is chosen once per test run, so no
+# generated path needs to be checked against the filesystem
+MISSING_PREFIX = f"__missing_{uuid.uuid4().hex}_"
+missing_paths = st.text(min_size=1, max_size=100, alphabet=name_characters).map(
+    lambda name: MISSING_PREFIX + name
+)
+
+
 # Feature: file-sorter-cli, Property 1: Valid paths are accepted
-@settings(max_examples=100)
+# Pass-through test: same examples every run, no database replay or shrinking
+@settings(
+    max_examples=20,
+    deadline=None,
+    derandomize=True,
+    phases=(Phase.explicit, Phase.generate)
+)
 @given(
-    dir_name=st.text(min_size=1, max_size=50, alphabet=st.characters(
-        whitelist_categories=('Lu', 'Ll', 'Nd'),
-        blacklist_characters=['<', '>', ':', '"', '|', '?', '*', '\0', '/', '\\']
-    ))
+    dir_name=valid_dir_names
 )
-def test_valid_paths_are_accepted(dir_name):
+# Boundary names: single letter, single digit, longest name, non-ASCII
+@example(dir_name="a")
+@example(dir_name="0")
+@example(dir_name="A" * 50)
+@example(dir_name="Ünïcödé")
+def test_valid_paths_are_accepted(scratch_root, dir_name):
     """
     Property 1: Valid paths are accepted
     
@@ -39,12 +66,10 @@ def test_valid_paths_are_accepted(dir_name):
     
     Validates: Requirements 1.2
     """
-    # Create a temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create a subdirectory with the generated name
-        test_dir = Path(temp_dir) / dir_name
-        test_dir.mkdir(exist_ok=True)
-        
+    # Create a subdirectory with the generated name in the shared scratch root
+    test_dir = scratch_root / dir_name
+    test_dir.mkdir(exist_ok=True)
+    try:
         # Validate the path
         is_valid, error_msg = validate_path(str(test_dir))
         
@@ -52,18 +77,15 @@ def test_valid_paths_are_accepted(dir_name):
         assert is_valid, f"Valid directory should be accepted, but got error: {error_msg}"
         assert test_dir.exists()
         assert test_dir.is_dir()
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
 
 
 # Feature: file-sorter-cli, Property 2: Invalid paths are rejected
 @settings(max_examples=100)
 @given(
-    invalid_path=st.one_of(
-        # Non-existent paths with random characters
-        st.text(min_size=1, max_size=100, alphabet=st.characters(
-            whitelist_categories=('Lu', 'Ll', 'Nd'),
-            blacklist_characters=['<', '>', ':', '"', '|', '?', '*', '\0']
-        )).filter(lambda x: not Path(x).exists()),
-    )
+    # Non-existent paths with random characters
+    invalid_path=missing_paths
 )
 def test_invalid_paths_are_rejected(invalid_path):
     """
@@ -74,9 +96,6 @@ def test_invalid_paths_are_rejected(invalid_path):
     
     Validates: Requirements 1.3
     """
-    # Assume the path doesn't exist or is not a directory
-    assume(not Path(invalid_path).exists() or not Path(invalid_path).is_dir())
-    
     # Validate the path
     is_valid, error_msg = validate_path(invalid_path)
     
@@ -289,6 +289,49 @@ def test_cli_argument_precedence(config_data, cli_args):
 
 
 
+
+# Feature: advanced-file-operations, Property 27: CLI argument precedence
+@settings(max_examples=50)
+@given(
+    config_data=config_dict_strategy(),
+    cli_args=st.one_of(st.just({}), cli_args_strategy())
+)
+def test_merged_config_shares_only_untouched_sections(config_data, cli_args):
+    """
+    Property 27: CLI argument precedence
+    
+    For any configuration and CLI arguments, merging should share the
+    nested sections the CLI does not override with the base configuration,
+    and changing the merged configuration should never change the next
+    load of the same file.
+    
+    Validates: Requirements 6.3
+    """
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        yaml.dump(config_data, f)
+        config_path = Path(f.name)
+    
+    try:
+        base_config = load_config(config_path)
+        merged_config = merge_with_cli_args(base_config, cli_args)
+        
+        # Without threshold arguments the section is shared, not copied
+        assert (merged_config.size_thresholds is base_config.size_thresholds) == (not cli_args)
+        assert merged_config.filters is base_config.filters
+        assert merged_config.custom_categories is base_config.custom_categories
+        
+        merged_config.filters.include_patterns.append('*.changed')
+        merged_config.size_thresholds.small_max = 1
+        merged_config.custom_categories['img'] = 'changed'
+        
+        reloaded = load_config(config_path)
+        assert '*.changed' not in reloaded.filters.include_patterns
+        assert reloaded.size_thresholds.small_max == config_data['size_thresholds']['small_max']
+        assert reloaded.custom_categories.get('img') == config_data['custom_categories'].get('img')
+    finally:
+        config_path.unlink()
+
+
 # Feature: advanced-file-operations, Property 51: Comprehensive configuration support
 @settings(max_examples=100)
 @given(config_data=config_dict_strategy())
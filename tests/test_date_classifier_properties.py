@@ -9,6 +9,7 @@ from hypothesis import given, strategies as st, settings
 from sik_sort.date_classifier import (
     classify_by_date,
     get_file_date,
+    get_file_date_from_entry,
     format_date,
     DateMode
 )
@@ -237,6 +238,38 @@ def test_get_file_date_validity(year, month, day):
         )
 
 
+# Additional property test: get_file_date_from_entry matches get_file_date
+@settings(max_examples=100)
+@given(
+    timestamp=st.integers(min_value=946684800, max_value=1893456000),  # 2000-2030
+    use_creation=st.booleans()
+)
+def test_get_file_date_from_entry_matches_path(timestamp, use_creation):
+    """
+    Property: get_file_date_from_entry agrees with get_file_date
+    
+    For any file, reading the date from its os.scandir entry should give the
+    same datetime as reading it from the file path.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        
+        # Create a test file with a known modification time
+        test_file = tmppath / "test.txt"
+        test_file.write_text("test content")
+        os.utime(test_file, (timestamp, timestamp))
+        
+        with os.scandir(tmppath) as entries:
+            entry = next(entries)
+            entry_date = get_file_date_from_entry(entry, use_creation=use_creation)
+        
+        path_date = get_file_date(test_file, use_creation=use_creation)
+        
+        assert entry_date == path_date, (
+            f"Entry date {entry_date} should match path date {path_date}"
+        )
+
+
 # Test custom date formats
 @settings(max_examples=100)
 @given(
@@ -1,5 +1,6 @@
 """Property-based tests for duplicate detector module."""
 
+import hashlib
 import tempfile
 from pathlib import Path
 from hypothesis import given, strategies as st, settings, assume
@@ -7,7 +8,9 @@ from sik_sort.duplicates import (
     find_duplicates,
     compute_hash,
     calculate_space_saved,
-    DuplicateStats
+    DuplicateStats,
+    available_algorithms,
+    default_algorithm
 )
 
 
@@ -388,3 +391,142 @@ def test_different_files_different_hash(content1, content2, algorithm):
         assert hash1 != hash2, (
             f"Different files should have different hashes, both got {hash1}"
         )
+
+
+# Additional property test: File hashes match hashlib over the whole content
+@settings(max_examples=100, deadline=None)
+@given(
+    content=st.binary(min_size=0, max_size=20000),
+    repeat=st.sampled_from([1, 100]),
+    algorithm=st.sampled_from(["md5", "sha256"])
+)
+def test_compute_hash_matches_hashlib(content, repeat, algorithm):
+    """
+    Property: File hashes match hashlib over the whole content
+    
+    For any file content, including empty files and files large enough to
+    be memory-mapped, compute_hash should return the same digest as hashing
+    the content in memory.
+    """
+    content = content * repeat
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file_path = Path(tmpdir) / "file.bin"
+        file_path.write_bytes(content)
+        
+        expected = hashlib.new(algorithm, content).hexdigest()
+        assert compute_hash(file_path, algorithm) == expected
+        
+        # The default algorithm is the first installed one in preference
+        # order, so it never changes between runs
+        installed = available_algorithms()
+        preferred = [name for name in ("xxh3", "blake3", "blake2b", "md5") if name in installed]
+        assert default_algorithm() == preferred[0]
+
+
+# Additional property test: Duplicate groups match grouping by content
+@settings(max_examples=100, deadline=None)
+@given(
+    file_contents=st.lists(
+        st.sampled_from([
+            b"", b"a", b"b", b"ab", b"ba", b"abc",
+            b"a" * 5000, b"b" * 5000, b"a" * 4999 + b"b",
+            b"a" * 6000 + b"b" * 6000 + b"a" * 6000, b"a" * 18000
+        ]),
+        min_size=1,
+        max_size=15
+    )
+)
+def test_duplicate_groups_match_content_grouping(file_contents):
+    """
+    Property: Duplicate groups match grouping by content
+    
+    For any set of files, including files that share a size or their first
+    and last bytes but not their whole content, find_duplicates should
+    report exactly the groups of files with identical content, with files
+    in input order.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        
+        files = []
+        expected = {}
+        for i, content in enumerate(file_contents):
+            file_path = tmppath / f"file_{i}.bin"
+            file_path.write_bytes(content)
+            files.append(file_path)
+            expected.setdefault(content, []).append(file_path)
+        
+        duplicates = find_duplicates(files)
+        
+        expected_groups = sorted(group for group in expected.values() if len(group) > 1)
+        assert sorted(duplicates.values()) == expected_groups
+
+
+# Additional property test: Space saved does not depend on the files still existing
+@settings(max_examples=100, deadline=None)
+@given(
+    group_sizes=st.lists(st.integers(min_value=2, max_value=4), min_size=1, max_size=4),
+    file_size=st.integers(min_value=0, max_value=8192)
+)
+def test_space_saved_uses_group_sizes(group_sizes, file_size):
+    """
+    Property: Space saved does not depend on the files still existing
+    
+    For any duplicate groups found by find_duplicates, calculate_space_saved
+    should use the sizes recorded during detection, so the result is the same
+    after the files have been moved away.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        
+        files = []
+        for group_idx, count in enumerate(group_sizes):
+            content = bytes([group_idx]) * file_size
+            for file_idx in range(count):
+                file_path = tmppath / f"group_{group_idx}_{file_idx}.bin"
+                file_path.write_bytes(content)
+                files.append(file_path)
+        
+        duplicates = find_duplicates(files)
+        expected = calculate_space_saved(duplicates)
+        
+        for file_path in files:
+            file_path.unlink()
+        
+        assert calculate_space_saved(duplicates) == expected
+        if file_size:
+            assert expected == sum(file_size * (count - 1) for count in group_sizes)
+
+
+# Additional property test: Content confirmation splits colliding groups
+@settings(max_examples=100, deadline=None)
+@given(
+    file_contents=st.lists(st.sampled_from([b"a", b"b", b"c"]), min_size=2, max_size=8)
+)
+def test_content_confirmation_splits_collisions(file_contents):
+    """
+    Property: Content confirmation splits colliding groups
+    
+    For any group of equal-sized files reported under one hash (as a
+    non-cryptographic hash collision would), confirming by content should
+    keep exactly the groups of byte-identical files.
+    """
+    from sik_sort.duplicates import DuplicateGroup, _confirm_by_content
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        
+        files = []
+        expected = {}
+        for i, content in enumerate(file_contents):
+            file_path = tmppath / f"file_{i}.bin"
+            file_path.write_bytes(content)
+            files.append(file_path)
+            expected.setdefault(content, []).append(file_path)
+        
+        confirmed = _confirm_by_content({"collision": DuplicateGroup(1, files)})
+        
+        expected_groups = sorted(group for group in expected.values() if len(group) > 1)
+        assert sorted(confirmed.values()) == expected_groups
+        assert all(group.size == 1 for group in confirmed.values())
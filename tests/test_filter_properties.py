@@ -212,3 +212,41 @@ def test_filter_statistics_accuracy(files, include_patterns, exclude_patterns, i
     # Verify the filtered list preserves the order and duplicates from the original
     # (filtering should not add or remove duplicates, just filter based on criteria)
     assert len(filtered) <= len(files), "Filtered list has more files than original"
+
+
+# Additional property test: Combined filters match per-pattern fnmatch checks
+@settings(max_examples=100)
+@given(
+    files=st.lists(file_path_strategy(), min_size=0, max_size=50),
+    include_patterns=st.lists(glob_pattern_strategy(), max_size=3),
+    exclude_patterns=st.lists(glob_pattern_strategy(), max_size=3),
+    include_extensions=st.sets(st.sampled_from(['.JPG', '.png', '.PDF', '.txt', '.zip']), max_size=3),
+    exclude_extensions=st.sets(st.sampled_from(['.jpg', '.TMP', '.bak']), max_size=2)
+)
+def test_combined_filters_match_reference(files, include_patterns, exclude_patterns, include_extensions, exclude_extensions):
+    """
+    Property: Combined filters match per-pattern fnmatch checks
+    
+    For any combination of filters, apply_filters should keep exactly the files
+    that pass every filter when each pattern and extension is checked on its own,
+    in their original order.
+    """
+    config = FilterConfig(
+        include_patterns=include_patterns,
+        exclude_patterns=exclude_patterns,
+        include_extensions=include_extensions,
+        exclude_extensions=exclude_extensions
+    )
+    
+    expected = [
+        f for f in files
+        if (not include_patterns or any(matches_pattern(f, p) for p in include_patterns))
+        and (not include_extensions or matches_extensions(f, include_extensions))
+        and not any(matches_pattern(f, p) for p in exclude_patterns)
+        and not (exclude_extensions and matches_extensions(f, exclude_extensions))
+    ]
+    
+    filtered, excluded_count = apply_filters(files, config)
+    
+    assert filtered == expected
+    assert excluded_count == len(files) - len(expected)
@@ -0,0 +1,170 @@
+"""Property-based tests for hash cache module."""
+
+import os
+import tempfile
+from pathlib import Path
+from hypothesis import given, strategies as st, settings
+from sik_sort.duplicates import find_duplicates
+from sik_sort.hash_cache import HashCache
+from sik_sort.sorter import sort_files_with_duplicates
+
+
+# Feature: advanced-file-operations, Property: Cached duplicate detection matches uncached
+@settings(max_examples=50, deadline=None)
+@given(
+    file_contents=st.lists(
+        st.sampled_from([b"", b"a", b"b", b"ab", b"a" * 5000, b"b" * 5000]),
+        min_size=1,
+        max_size=10
+    ),
+    algorithm=st.sampled_from(["md5", "sha256"])
+)
+def test_cached_duplicates_match_uncached(file_contents, algorithm):
+    """
+    Property: Cached duplicate detection matches uncached
+    
+    For any set of files, find_duplicates should return the same groups with
+    an empty cache, with a warm cache, and without a cache.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        
+        files = []
+        for i, content in enumerate(file_contents):
+            file_path = tmppath / f"file_{i}.bin"
+            file_path.write_bytes(content)
+            files.append(file_path)
+        
+        expected = find_duplicates(files, algorithm)
+        
+        with HashCache(tmppath / "cache" / "hashes.sqlite") as cache:
+            assert find_duplicates(files, algorithm, cache=cache) == expected
+            assert find_duplicates(files, algorithm, cache=cache) == expected
+
+
+# Feature: advanced-file-operations, Property: Cached hashes are tied to size and modification time
+@settings(max_examples=50, deadline=None)
+@given(
+    path=st.text(min_size=1, max_size=30),
+    size=st.integers(min_value=0, max_value=2**40),
+    mtime_ns=st.integers(min_value=0, max_value=2**62),
+    digest=st.text(alphabet="0123456789abcdef", min_size=32, max_size=32)
+)
+def test_cache_entries_invalidated_by_changes(path, size, mtime_ns, digest):
+    """
+    Property: Cached hashes are tied to size and modification time
+    
+    For any stored hash, a lookup should return it only when the size,
+    modification time and algorithm all match.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with HashCache(Path(tmpdir) / "hashes.sqlite") as cache:
+            cache.put_many([(path, size, mtime_ns, "md5", digest)])
+            
+            assert cache.get(path, size, mtime_ns, "md5") == digest
+            assert cache.get(path, size + 1, mtime_ns, "md5") is None
+            assert cache.get(path, size, mtime_ns + 1, "md5") is None
+            assert cache.get(path, size, mtime_ns, "sha256") is None
+
+
+def test_cache_skips_unchanged_files():
+    """
+    A file whose size and modification time match its cache entry is not
+    read again, even if its content was rewritten in place.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        first = tmppath / "first.bin"
+        second = tmppath / "second.bin"
+        first.write_bytes(b"same")
+        second.write_bytes(b"same")
+        
+        with HashCache(tmppath / "hashes.sqlite") as cache:
+            assert len(find_duplicates([first, second], "md5", cache=cache)) == 1
+            
+            # Rewrite the content but restore the original modification time
+            stat = second.stat()
+            second.write_bytes(b"diff")
+            os.utime(second, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            
+            assert len(find_duplicates([first, second], "md5", cache=cache)) == 1
+            assert len(find_duplicates([first, second], "md5")) == 0
+
+
+def test_sorted_files_keep_their_cached_hashes():
+    """
+    After a duplicate-detecting sort, the cached hashes of moved files are
+    found under their new paths, so re-checking the sorted files hashes
+    nothing.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        source = tmppath / "source"
+        source.mkdir()
+        (source / "a.jpg").write_bytes(b"same")
+        (source / "b.jpg").write_bytes(b"same")
+        
+        with HashCache(tmppath / "hashes.sqlite") as cache:
+            stats = sort_files_with_duplicates(source, "md5", hash_cache=cache)
+            
+            for operation in stats.operations:
+                file_stat = operation.destination.stat()
+                assert cache.get(
+                    os.fspath(operation.destination), file_stat.st_size, file_stat.st_mtime_ns, "md5"
+                ) is not None
+                assert cache.get(
+                    os.fspath(operation.source), file_stat.st_size, file_stat.st_mtime_ns, "md5"
+                ) is None
+
+
+def test_cache_keys_do_not_depend_on_working_directory(monkeypatch):
+    """
+    Files given by the same relative path from different working
+    directories are different files, so a cached hash from one directory
+    is never reused in the other, even when size and modification time
+    match.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        first_dir = tmppath / "first"
+        second_dir = tmppath / "second"
+        first_dir.mkdir()
+        second_dir.mkdir()
+        
+        (first_dir / "a.jpg").write_bytes(b"same")
+        (first_dir / "b.jpg").write_bytes(b"same")
+        (second_dir / "a.jpg").write_bytes(b"diff")
+        (second_dir / "b.jpg").write_bytes(b"more")
+        for name in ("a.jpg", "b.jpg"):
+            stat = (first_dir / name).stat()
+            os.utime(second_dir / name, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        
+        relative_files = [Path("a.jpg"), Path("b.jpg")]
+        with HashCache(tmppath / "hashes.sqlite") as cache:
+            monkeypatch.chdir(first_dir)
+            assert len(find_duplicates(relative_files, "md5", cache=cache)) == 1
+            
+            monkeypatch.chdir(second_dir)
+            assert len(find_duplicates(relative_files, "md5", cache=cache)) == 0
+
+
+def test_relative_sort_keeps_cached_hashes_under_absolute_paths(monkeypatch):
+    """
+    A duplicate-detecting sort of a relative source path re-keys the cached
+    hashes of moved files under their absolute destination paths.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / "source").mkdir()
+        (tmppath / "source" / "a.jpg").write_bytes(b"same")
+        (tmppath / "source" / "b.jpg").write_bytes(b"same")
+        
+        monkeypatch.chdir(tmppath)
+        with HashCache(tmppath / "hashes.sqlite") as cache:
+            stats = sort_files_with_duplicates(Path("source"), "md5", hash_cache=cache)
+            
+            for operation in stats.operations:
+                file_stat = operation.destination.stat()
+                assert cache.get(
+                    os.path.abspath(operation.destination), file_stat.st_size, file_stat.st_mtime_ns, "md5"
+                ) is not None
@@ -4,7 +4,8 @@ from pathlib import Path
 from hypothesis import given, strategies as st, settings
 import tempfile
 import shutil
-from sik_sort.main import setup_category_folders
+from unittest.mock import patch
+from sik_sort.main import main, setup_category_folders
 from sik_sort.sorter import sort_files, SortingStats
 from sik_sort.cleaner import find_empty_directories
 
@@ -212,3 +213,67 @@ def test_directory_preservation_when_cleanup_declined(num_subdirs, num_files):
         for subdir in subdirs:
             assert subdir.exists(), \
                 f"Subdirectory {subdir.name} should still exist when cleanup is declined"
+
+
+# Feature: file-sorter-cli, Property 12: Directory preservation when cleanup declined
+@settings(max_examples=20, deadline=None)
+@given(
+    num_subdirs=st.integers(min_value=1, max_value=5),
+    num_files=st.integers(min_value=1, max_value=5)
+)
+def test_non_recursive_run_skips_cleanup(num_subdirs, num_files):
+    """
+    Property 12: Directory preservation when cleanup declined
+    
+    For any non-recursive run, subdirectories are left untouched: even
+    with cleanup confirmed, empty subdirectories should still exist.
+    
+    Validates: Requirements 5.3
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_dir = Path(temp_dir)
+        
+        subdirs = [test_dir / f"subdir_{i}" / "empty" for i in range(num_subdirs)]
+        for subdir in subdirs:
+            subdir.mkdir(parents=True)
+        
+        for i in range(num_files):
+            (test_dir / f"file_{i}.jpg").touch()
+        
+        with patch('sys.argv', ['sik', str(test_dir), '--no-recursive']), \
+                patch('sik_sort.main.confirm_cleanup', return_value=True) as confirm:
+            main()
+        
+        assert not confirm.called, "Cleanup should not be offered in non-recursive mode"
+        for subdir in subdirs:
+            assert subdir.exists(), \
+                f"Empty subdirectory {subdir.relative_to(test_dir)} should be left untouched"
+        assert len(list((test_dir / 'img').iterdir())) == num_files
+
+
+# Feature: file-sorter-cli, Property 3: Category folders are created
+@settings(max_examples=20, deadline=None)
+@given(
+    num_images=st.integers(min_value=1, max_value=5)
+)
+def test_run_creates_only_used_category_folders(num_images):
+    """
+    Property 3: Category folders are created
+    
+    For any run over a directory of images only, the img folder should be
+    the only category folder created.
+    
+    Validates: Requirements 2.1
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_dir = Path(temp_dir)
+        
+        for i in range(num_images):
+            (test_dir / f"photo_{i}.jpg").touch()
+        
+        with patch('sys.argv', ['sik', str(test_dir)]), \
+                patch('sik_sort.main.confirm_cleanup', return_value=False):
+            main()
+        
+        assert sorted(item.name for item in test_dir.iterdir()) == ['img']
+        assert len(list((test_dir / 'img').iterdir())) == num_images
@@ -1,5 +1,6 @@
 """Property-based tests for operation logger module."""
 
+import time
 from io import StringIO
 from hypothesis import given, strategies as st, settings
 from rich.console import Console
@@ -250,3 +251,148 @@ def test_scan_completion_displays_count(file_count):
     finally:
         # Restore original console
         logger_module.console = original_console
+
+
+# Additional property test: Batched logging prints every line in order
+@settings(max_examples=100)
+@given(
+    filenames=st.lists(
+        st.text(
+            min_size=1,
+            max_size=20,
+            alphabet=st.characters(min_codepoint=97, max_codepoint=122)
+        ),
+        min_size=0,
+        max_size=600
+    )
+)
+def test_batched_logging_preserves_lines(filenames):
+    """
+    Property: Batched logging prints every line in order
+    
+    For any sequence of file operations logged inside batched_logging, the
+    output after the block should contain one line per operation, in order.
+    """
+    from sik_sort.operation_logger import batched_logging
+    
+    string_io = StringIO()
+    test_console = Console(file=string_io, force_terminal=False, width=200)
+    
+    import sik_sort.operation_logger as logger_module
+    original_console = logger_module.console
+    logger_module.console = test_console
+    
+    try:
+        with batched_logging():
+            for filename in filenames:
+                log_file_operation(filename, FileCategory.IMAGE, dry_run=False)
+        
+        lines = string_io.getvalue().splitlines()
+        assert lines == [f"[IMG] {filename} → img/" for filename in filenames]
+    finally:
+        logger_module.console = original_console
+
+
+def test_batched_logging_flushes_while_idle():
+    """
+    Property: Batched logging prints every line in order
+    
+    A line buffered inside batched_logging should be printed within the
+    batch interval even if no further line is logged, e.g. while a slow
+    move is in progress.
+    """
+    from sik_sort.operation_logger import batched_logging, _LOG_BATCH_INTERVAL
+    
+    string_io = StringIO()
+    test_console = Console(file=string_io, force_terminal=False, width=200)
+    
+    import sik_sort.operation_logger as logger_module
+    original_console = logger_module.console
+    logger_module.console = test_console
+    
+    try:
+        with batched_logging():
+            log_file_operation("slow.jpg", FileCategory.IMAGE, dry_run=False)
+            
+            deadline = time.monotonic() + _LOG_BATCH_INTERVAL * 20
+            while not string_io.getvalue() and time.monotonic() < deadline:
+                time.sleep(_LOG_BATCH_INTERVAL / 10)
+            
+            assert string_io.getvalue().splitlines() == ["[IMG] slow.jpg → img/"]
+    finally:
+        logger_module.console = original_console
+
+
+def test_timed_flush_waits_for_other_console_writers():
+    """
+    Property: Batched logging prints every line in order
+    
+    A timed flush should wait while another writer, such as the ASCII
+    progress bar, holds the output lock, and print once it is released.
+    """
+    from sik_sort.operation_logger import batched_logging, output_lock, _LOG_BATCH_INTERVAL
+    
+    string_io = StringIO()
+    test_console = Console(file=string_io, force_terminal=False, width=200)
+    
+    import sik_sort.operation_logger as logger_module
+    original_console = logger_module.console
+    logger_module.console = test_console
+    
+    try:
+        with batched_logging():
+            log_file_operation("slow.jpg", FileCategory.IMAGE, dry_run=False)
+            
+            with output_lock:
+                time.sleep(_LOG_BATCH_INTERVAL * 3)
+                assert string_io.getvalue() == ""
+            
+            deadline = time.monotonic() + _LOG_BATCH_INTERVAL * 20
+            while not string_io.getvalue() and time.monotonic() < deadline:
+                time.sleep(_LOG_BATCH_INTERVAL / 10)
+            
+            assert string_io.getvalue().splitlines() == ["[IMG] slow.jpg → img/"]
+    finally:
+        logger_module.console = original_console
+
+
+# Additional property test: Conflict and error logs show names literally
+@settings(max_examples=100)
+@given(
+    original_name=st.text(
+        min_size=1,
+        max_size=30,
+        alphabet=st.characters(min_codepoint=33, max_codepoint=126)
+    ),
+    new_name=st.text(
+        min_size=1,
+        max_size=30,
+        alphabet=st.characters(min_codepoint=33, max_codepoint=126)
+    )
+)
+def test_conflict_and_error_logs_show_names_literally(original_name, new_name):
+    """
+    Property: Conflict and error logs show names literally
+    
+    For any file names, including names containing Rich markup such as
+    "[bold]" or "[/x]", conflict and error logs should print the names
+    unchanged.
+    """
+    string_io = StringIO()
+    test_console = Console(file=string_io, force_terminal=False, width=200)
+    
+    import sik_sort.operation_logger as logger_module
+    original_console = logger_module.console
+    logger_module.console = test_console
+    
+    try:
+        log_conflict_resolution(original_name, new_name)
+        log_error(original_name, new_name)
+        
+        lines = string_io.getvalue().splitlines()
+        assert lines == [
+            f"[CONFLICT] {original_name} → {new_name}",
+            f"[ERROR] {original_name}: {new_name}",
+        ]
+    finally:
+        logger_module.console = original_console
@@ -4,7 +4,14 @@ import tempfile
 import shutil
 from pathlib import Path
 from hypothesis import given, strategies as st, settings, assume
-from sik_sort.scanner import scan_directory
+from sik_sort.scanner import (
+    iter_scan_multiple,
+    parallel_scan,
+    scan_directory,
+    scan_file_records,
+    scan_multiple_directories
+)
+from sik_sort.filters import FilterConfig
 
 
 # Windows reserved names that cannot be used as file or directory names
@@ -122,3 +129,155 @@ def test_recursive_traversal_finds_all_files(file_paths):
             f"Expected to find {len(created_files)} files, but found {len(found_files)}. "
             f"Missing: {created_set - found_set}, Extra: {found_set - created_set}"
         )
+
+
+# Additional property test: File records match the scanned files
+@settings(max_examples=100, deadline=None)
+@given(
+    file_specs=st.lists(
+        st.tuples(
+            st.lists(st.sampled_from(['a', 'b', 'skip']), max_size=3),
+            st.sampled_from(['x.jpg', 'y.TXT', 'z', '.hidden']),
+            st.integers(min_value=0, max_value=64)
+        ),
+        min_size=1,
+        max_size=15
+    )
+)
+def test_file_records_match_scanned_files(file_specs):
+    """
+    Property: File records match the scanned files
+    
+    For any directory tree, scan_file_records should return one record per
+    file outside excluded directories, carrying the file's path, name,
+    suffix and size.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        
+        expected = {}
+        for dir_parts, filename, size in file_specs:
+            directory = root.joinpath(*dir_parts)
+            directory.mkdir(parents=True, exist_ok=True)
+            file_path = directory / filename
+            file_path.write_bytes(b"x" * size)
+            if 'skip' not in dir_parts:
+                expected[file_path] = size
+        
+        records = scan_file_records(root, {'skip'})
+        
+        assert {record.path: record.size for record in records} == expected
+        assert len(records) == len(expected)
+        for record in records:
+            assert record.name == record.path.name
+            assert record.suffix == record.path.suffix
+
+
+# Additional property test: Parallel scans match the serial scan
+@settings(max_examples=50, deadline=None)
+@given(
+    file_specs=st.lists(
+        st.tuples(
+            st.lists(st.sampled_from(['a', 'b', 'c', 'skip']), max_size=4),
+            st.sampled_from(['x.jpg', 'y.txt', 'z'])
+        ),
+        min_size=1,
+        max_size=20
+    ),
+    workers=st.integers(min_value=1, max_value=4)
+)
+def test_parallel_scan_matches_serial_scan(file_specs, workers):
+    """
+    Property: Parallel scans match the serial scan
+    
+    For any directory tree, parallel_scan and scan_multiple_directories,
+    serial or pooled, should find the same files as scan_directory, in the
+    same order.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        
+        for dir_parts, filename in file_specs:
+            directory = root.joinpath(*dir_parts)
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / filename).write_text("test content")
+        
+        expected = scan_directory(root, {'skip'})
+        
+        assert parallel_scan(root, {'skip'}, workers=workers) == expected
+        assert scan_multiple_directories([root], {'skip'}, FilterConfig()) == {root: expected}
+        assert scan_multiple_directories([root], {'skip'}, FilterConfig(), workers=workers) == {root: expected}
+
+
+# Additional property test: Non-recursive scans only return top-level files
+@settings(max_examples=50, deadline=None)
+@given(
+    file_specs=st.lists(
+        st.tuples(
+            st.lists(st.sampled_from(['a', 'b', 'skip']), max_size=3),
+            st.sampled_from(['x.jpg', 'y.txt', 'z'])
+        ),
+        min_size=1,
+        max_size=20
+    )
+)
+def test_non_recursive_scan_returns_top_level_files(file_specs):
+    """
+    Property: Non-recursive scans only return top-level files
+    
+    For any directory tree, a non-recursive scan should return exactly the
+    files of the recursive scan that sit directly in the root directory.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        
+        for dir_parts, filename in file_specs:
+            directory = root.joinpath(*dir_parts)
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / filename).write_text("test content")
+        
+        expected = [f for f in scan_directory(root, {'skip'}) if f.parent == root]
+        
+        assert scan_directory(root, {'skip'}, recursive=False) == expected
+
+
+# Additional property test: Streaming multi-root scans match the batch scan
+@settings(max_examples=50, deadline=None)
+@given(
+    file_specs=st.lists(
+        st.tuples(
+            st.sampled_from(['one', 'two']),
+            st.lists(st.sampled_from(['a', 'skip']), max_size=2),
+            st.sampled_from(['x.jpg', 'y.txt', 'z'])
+        ),
+        min_size=1,
+        max_size=20
+    ),
+    include_extensions=st.sets(st.sampled_from(['.jpg', '.txt']), max_size=2)
+)
+def test_iter_scan_multiple_matches_batch_scan(file_specs, include_extensions):
+    """
+    Property: Streaming multi-root scans match the batch scan
+    
+    For any set of directory trees and filters, iter_scan_multiple should
+    yield each root's files in the same order as scan_multiple_directories
+    returns them.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        roots = [Path(tmpdir) / 'one', Path(tmpdir) / 'two']
+        for root in roots:
+            root.mkdir()
+        
+        for root_name, dir_parts, filename in file_specs:
+            directory = Path(tmpdir, root_name).joinpath(*dir_parts)
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / filename).write_text("test content")
+        
+        filters = FilterConfig(include_extensions=include_extensions)
+        expected = scan_multiple_directories(roots, {'skip'}, filters)
+        
+        streamed = {root: [] for root in roots}
+        for root, file_path in iter_scan_multiple(roots, {'skip'}, filters):
+            streamed[root].append(file_path)
+        
+        assert streamed == expected
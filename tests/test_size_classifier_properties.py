@@ -1,8 +1,9 @@
 """Property-based tests for size classifier module."""
 
+import os
 import tempfile
 from pathlib import Path
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, example, strategies as st, settings, assume
 from sik_sort.size_classifier import (
     classify_by_size,
     get_file_size,
@@ -206,3 +207,66 @@ def test_threshold_boundaries(offset):
             f"File of size {boundary_size} bytes (offset {offset} from {small_max}) "
             f"should be {expected}, got {category}"
         )
+
+
+# Additional property test: format_size matches repeated division by 1024
+@settings(max_examples=200)
+@given(
+    size_bytes=st.one_of(
+        st.integers(min_value=-1024, max_value=2**50),
+        st.floats(min_value=-1024, max_value=2**50, allow_nan=False),
+        # Values at and around each unit boundary
+        st.builds(
+            lambda power, offset: max(0, 2**(10 * power) + offset),
+            st.integers(min_value=0, max_value=5),
+            st.integers(min_value=-2, max_value=2)
+        )
+    )
+)
+@example(size_bytes=0.5)
+@example(size_bytes=1536.0)
+def test_format_size_matches_reference(size_bytes):
+    """
+    Property: format_size matches repeated division by 1024
+    
+    For any byte count, integer or float, format_size should pick the same
+    unit and value as dividing by 1024 until the size drops below 1024 or
+    the largest unit is reached.
+    """
+    units = ['B', 'KB', 'MB', 'GB', 'TB']
+    if size_bytes <= 0:
+        expected = "0 B"
+    else:
+        size = float(size_bytes)
+        unit_index = 0
+        while size >= 1024.0 and unit_index < len(units) - 1:
+            size /= 1024.0
+            unit_index += 1
+        expected = f"{int(size)} B" if unit_index == 0 else f"{size:.2f} {units[unit_index]}"
+    
+    assert format_size(size_bytes) == expected
+
+
+# Additional property test: Size classification agrees for paths, entries and stat results
+@settings(max_examples=50, deadline=None)
+@given(file_size=st.integers(min_value=0, max_value=4096))
+def test_size_sources_agree(file_size):
+    """
+    Property: Size classification agrees for paths, entries and stat results
+    
+    For any file, get_file_size and classify_by_size should give the same
+    result whether they are passed the file's path, its directory entry or
+    a stat result taken for it.
+    """
+    thresholds = SizeThresholds(small_max=1024, medium_max=2048)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "file.bin"
+        file_path.write_bytes(b"x" * file_size)
+        
+        with os.scandir(temp_dir) as entries:
+            entry = next(entries)
+        
+        for source in (file_path, entry, file_path.stat()):
+            assert get_file_size(source) == file_size
+            assert classify_by_size(source, thresholds) == classify_by_size(file_path, thresholds)
@@ -1,14 +1,18 @@
 """Property-based tests for file sorter module."""
 
 import tempfile
+import time
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from hypothesis import given, strategies as st, settings, assume
 from sik_sort.sorter import (
     move_file_with_conflict_resolution,
     generate_unique_filename,
     sort_files,
-    SortingStats
+    SortingStats,
+    _bounded_map,
+    _list_names
 )
 from sik_sort.classifier import FileCategory, get_category_extensions
 
@@ -663,7 +667,6 @@ def test_largest_file_correctness(files_data):
     """
     from sik_sort.sorter import EnhancedSortingStats, FileOperation
     from sik_sort.classifier import classify_file
-    from datetime import datetime
     
     # Skip if any filename is invalid
     for filename, _, _ in files_data:
@@ -711,7 +714,7 @@ def test_largest_file_correctness(files_data):
                 operation = FileOperation(
                     source=src_file,
                     destination=root / category.value / full_filename,
-                    timestamp=datetime.now(),
+                    timestamp=time.time_ns(),
                     category=category.value,
                     size=size
                 )
@@ -820,3 +823,304 @@ def test_size_formatting_correctness(size_bytes):
             assert len(decimal_part[1]) <= 2, (
                 f"Expected at most 2 decimal places, got {len(decimal_part[1])} in '{formatted}'"
             )
+
+
+# Additional property test: Cached conflict resolution keeps every file
+@settings(max_examples=50, deadline=None)
+@given(
+    num_conflicts=st.integers(min_value=2, max_value=12),
+    preexisting=st.sets(st.integers(min_value=1, max_value=8), max_size=5)
+)
+def test_cached_conflict_resolution_keeps_every_file(num_conflicts, preexisting):
+    """
+    Property: Cached conflict resolution keeps every file
+    
+    For any number of same-named files moved into a folder that already holds
+    some numbered variants, resolving conflicts with a shared name cache should
+    give every file its own name and never overwrite an existing file.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        dest_dir = root / "dest"
+        dest_dir.mkdir()
+        
+        # Existing numbered variants in the destination
+        for counter in preexisting:
+            (dest_dir / f"photo_{counter}.jpg").write_text(f"existing_{counter}")
+        
+        name_cache = {}
+        for i in range(num_conflicts):
+            src_file = root / f"src_{i}" / "photo.jpg"
+            src_file.parent.mkdir()
+            src_file.write_text(f"content_{i}")
+            move_file_with_conflict_resolution(src_file, dest_dir / "photo.jpg", name_cache=name_cache)
+        
+        contents = sorted(f.read_text() for f in dest_dir.iterdir())
+        expected = sorted(
+            [f"existing_{counter}" for counter in preexisting]
+            + [f"content_{i}" for i in range(num_conflicts)]
+        )
+        assert contents == expected
+
+
+# Additional property test: Cached conflict resolution takes the lowest free counters
+@settings(max_examples=50, deadline=None)
+@given(
+    num_conflicts=st.integers(min_value=1, max_value=20),
+    preexisting=st.sets(st.integers(min_value=1, max_value=15), max_size=8)
+)
+def test_cached_conflict_resolution_takes_lowest_free_counters(num_conflicts, preexisting):
+    """
+    Property: Cached conflict resolution takes the lowest free counters
+    
+    For any set of numbered variants already in a folder, resolving repeated
+    conflicts on the same name with a shared name cache should hand out the
+    lowest counters not already taken, in increasing order.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        dest_dir = Path(temp_dir)
+        (dest_dir / "photo.jpg").write_text("original")
+        for counter in preexisting:
+            (dest_dir / f"photo_{counter}.jpg").write_text(f"existing_{counter}")
+        
+        name_cache = {}
+        names = []
+        for _ in range(num_conflicts):
+            existing_names = name_cache.setdefault(str(dest_dir), _list_names(str(dest_dir)))
+            names.append(generate_unique_filename(dest_dir, "photo.jpg", existing_names))
+        
+        free_counters = [c for c in range(1, num_conflicts + len(preexisting) + 1) if c not in preexisting]
+        assert names == [f"photo_{c}.jpg" for c in free_counters[:num_conflicts]]
+
+
+# Additional property test: Category counters match the increments
+@settings(max_examples=100)
+@given(categories=st.lists(st.sampled_from(list(FileCategory)), max_size=50))
+def test_category_counters_match_increments(categories):
+    """
+    Property: Category counters match the increments
+    
+    For any sequence of increments, each category count should equal the
+    number of times that category was incremented, and the counts should
+    sum to the total.
+    """
+    stats = SortingStats()
+    for category in categories:
+        stats.increment(category)
+    
+    assert stats.img_count == categories.count(FileCategory.IMAGE)
+    assert stats.vid_count == categories.count(FileCategory.VIDEO)
+    assert stats.arc_count == categories.count(FileCategory.ARCHIVE)
+    assert stats.msk_count == categories.count(FileCategory.MISC)
+    assert stats.total_files == len(categories)
+
+
+# Additional property test: Only used category folders are created
+@settings(max_examples=30, deadline=None)
+@given(
+    categories=st.sets(st.sampled_from(list(FileCategory)), max_size=4)
+)
+def test_only_used_category_folders_are_created(categories):
+    """
+    Property: Only used category folders are created
+    
+    For any set of categories present in a directory, sort_files should
+    create exactly the folders of those categories.
+    """
+    extensions = {
+        FileCategory.IMAGE: '.jpg',
+        FileCategory.VIDEO: '.mp4',
+        FileCategory.ARCHIVE: '.zip',
+        FileCategory.MISC: '.txt',
+    }
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        for category in categories:
+            (root / f"file{extensions[category]}").write_text("content")
+        
+        sort_files(root)
+        
+        created = {entry.name for entry in root.iterdir() if entry.is_dir()}
+        assert created == {category.value for category in categories}
+
+
+# Additional property test: Unique names split the extension like Path
+@settings(max_examples=200)
+@given(
+    filename=st.text(
+        alphabet=st.sampled_from('ab.'),
+        min_size=1,
+        max_size=8
+    ).filter(lambda name: name not in ('.', '..'))
+)
+def test_unique_name_splits_extension_like_path(filename):
+    """
+    Property: Unique names split the extension like Path
+    
+    For any file name, the first unique name should insert the counter
+    between Path.stem and Path.suffix, including for names with leading,
+    trailing or repeated dots.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(filename)
+        expected = f"{path.stem}_1{path.suffix}"
+        assert generate_unique_filename(Path(temp_dir), filename) == expected
+
+
+# Additional property test: Parallel sorting matches serial sorting
+@settings(max_examples=30, deadline=None)
+@given(
+    file_specs=st.lists(
+        st.tuples(
+            st.sampled_from(['', 'a', 'b']),
+            st.sampled_from(['photo.jpg', 'clip.mp4', 'notes.txt', 'data.zip'])
+        ),
+        min_size=1,
+        max_size=20
+    ),
+    max_workers=st.integers(min_value=2, max_value=6)
+)
+def test_parallel_sort_matches_serial_sort(file_specs, max_workers):
+    """
+    Property: Parallel sorting matches serial sorting
+    
+    For any set of files, including files that collide on a name, sorting
+    with several workers should move every file into the same category
+    folder as a serial sort, without overwriting any file, and produce the
+    same statistics.
+    """
+    def run(max_workers):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            for index, (subdir, filename) in enumerate(file_specs):
+                directory = root / subdir
+                directory.mkdir(exist_ok=True)
+                target = directory / filename
+                if target.exists():
+                    directory = directory / f"dup{index}"
+                    directory.mkdir()
+                    target = directory / filename
+                target.write_text(f"content_{index}")
+            
+            stats = sort_files(root, record_operations=True, max_workers=max_workers)
+            
+            contents = {
+                folder.name: sorted(f.read_text() for f in folder.iterdir())
+                for folder in root.iterdir()
+                if folder.name in {'img', 'vid', 'arc', 'msk'}
+            }
+            sources = [operation.source.relative_to(root) for operation in stats.operations]
+            counts = (stats.img_count, stats.vid_count, stats.arc_count, stats.msk_count)
+            return contents, sources, counts
+    
+    assert run(max_workers) == run(1)
+
+
+# Additional property test: Parallel sorting matches serial sorting
+@settings(max_examples=50, deadline=None)
+@given(
+    num_items=st.integers(min_value=0, max_value=50),
+    max_in_flight=st.integers(min_value=1, max_value=8)
+)
+def test_bounded_map_streams_its_input(num_items, max_in_flight):
+    """
+    Property: Parallel sorting matches serial sorting
+    
+    For any input, the bounded map used for parallel moves should return
+    the results in input order while never taking more than max_in_flight
+    items ahead of the results consumed so far.
+    """
+    taken = []
+    
+    def items():
+        for item in range(num_items):
+            taken.append(item)
+            yield item
+    
+    results = []
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for result in _bounded_map(executor, lambda item: item * 2, items(), max_in_flight):
+            assert len(taken) - len(results) <= max_in_flight
+            results.append(result)
+    
+    assert results == [item * 2 for item in range(num_items)]
+
+
+# Additional property test: Operation timestamps convert to the time they were taken
+@settings(max_examples=20, deadline=None)
+@given(extension=st.sampled_from(['.jpg', '.mp4', '.zip', '.txt']))
+def test_operation_timestamps_convert_to_datetime(extension):
+    """
+    Property: Operation timestamps convert to the time they were taken
+    
+    For any sorted file, the recorded nanosecond timestamp should fall
+    within the sort call, and as_datetime() should convert it to the same
+    moment.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        (root / f"file{extension}").write_text("content")
+        
+        before = time.time_ns()
+        stats = sort_files(root, record_operations=True)
+        after = time.time_ns()
+        
+        operation, = stats.operations
+        assert before <= operation.timestamp <= after
+        assert abs(operation.as_datetime().timestamp() - operation.timestamp / 1e9) < 1e-3
+
+
+# Additional property test: The operation log returns the operations recorded
+@settings(max_examples=100)
+@given(
+    records=st.lists(
+        st.tuples(
+            st.sampled_from(['a.jpg', 'b/c.mp4', 'd.txt']),
+            st.integers(min_value=0, max_value=2**62),
+            st.sampled_from(['img', 'vid', 'small/msk', 'duplicates']),
+            st.integers(min_value=0, max_value=2**40),
+            st.one_of(st.none(), st.text(alphabet='0123456789abcdef', min_size=32, max_size=32))
+        ),
+        max_size=20
+    )
+)
+def test_operation_log_round_trips_operations(records):
+    """
+    Property: The operation log returns the operations recorded
+    
+    For any sequence of operations, whether recorded from fields or appended
+    as FileOperation objects, the log should have one entry per operation
+    and give back equal FileOperation records in order.
+    """
+    from sik_sort.sorter import FileOperation, OperationLog
+    
+    expected = [
+        FileOperation(
+            source=Path('src') / name,
+            destination=Path('dest') / name,
+            timestamp=timestamp,
+            category=category,
+            size=size,
+            hash=file_hash
+        )
+        for name, timestamp, category, size, file_hash in records
+    ]
+    
+    log = OperationLog()
+    for index, operation in enumerate(expected):
+        if index % 2:
+            log.append(operation)
+        else:
+            log.record(
+                operation.source,
+                operation.destination,
+                operation.timestamp,
+                operation.category,
+                operation.size,
+                operation.hash
+            )
+    
+    assert len(log) == len(expected)
+    assert list(log) == expected
+    assert all(log[index] == operation for index, operation in enumerate(expected))
@@ -132,3 +132,34 @@ def test_size_statistics_accuracy(num_files, file_sizes):
         # Verify all files are accounted for
         total_in_categories = sum(stats.size_categories.values())
         assert total_in_categories == num_files
+
+
+# Additional property test: Sorting without recording operations
+@given(
+    names=st.sets(filenames, min_size=1, max_size=8)
+)
+@settings(max_examples=30, deadline=None)
+def test_size_sort_without_recording_operations(names):
+    """Property: Sorting without recording operations
+    
+    For any set of files, sorting by size with record_operations=False
+    should move and count every file the same way but leave the operation
+    log empty.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_path = Path(tmpdir)
+        for name in names:
+            (source_path / name).write_bytes(b'x' * len(name))
+        
+        stats = sort_files_with_size(source_path, record_operations=False)
+        
+        assert len(stats.operations) == 0
+        assert stats.total_files == len(names)
+        assert sum(stats.size_categories.values()) == len(names)
+        
+        # Every file ended up under its size/type folders
+        sorted_names = {
+            path.name for path in source_path.rglob('*')
+            if path.is_file() and len(path.relative_to(source_path).parts) == 3
+        }
+        assert sorted_names == names